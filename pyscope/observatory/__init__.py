@@ -33,6 +33,7 @@ from .ascom_safety_monitor import ASCOMSafetyMonitor
 from .ascom_switch import ASCOMSwitch
 from .ascom_telescope import ASCOMTelescope
 
+from .astrometry_local_wcs import AstrometryLocalWCS
 from .astrometry_net_wcs import AstrometryNetWCS
 from .html_observing_conditions import HTMLObservingConditions
 from .html_safety_monitor import HTMLSafetyMonitor
@@ -65,6 +66,7 @@ __all__ = [
     "ASCOMRotator",
     "ASCOMSwitch",
     "ASCOMTelescope",
+    "AstrometryLocalWCS",
     "AstrometryNetWCS",
     "Autofocus",
     "Camera",
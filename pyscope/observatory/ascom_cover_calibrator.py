@@ -7,55 +7,57 @@ logger = logging.getLogger(__name__)
 
 
 class ASCOMCoverCalibrator(ASCOMDevice, CoverCalibrator):
+    _device_type = "CoverCalibrator"
+
     def __init__(self, identifier, alpaca=False, device_number=0, protocol="http"):
         super().__init__(
             identifier,
             alpaca=alpaca,
-            device_type=self.__class__.__name__.replace("ASCOM", ""),
+            device_type=self._device_type,
             device_number=device_number,
             protocol=protocol,
         )
 
     def CalibratorOff(self):
-        logger.debug(f"ASCOMCoverCalibrator.CalibratorOff() called")
+        logger.debug("ASCOMCoverCalibrator.CalibratorOff() called")
         self._device.CalibratorOff()
 
     def CalibratorOn(self, Brightness):
-        logger.debug(f"ASCOMCoverCalibrator.CalibratorOn({Brightness}) called")
+        logger.debug("ASCOMCoverCalibrator.CalibratorOn(%s) called", Brightness)
         self._device.CalibratorOn(Brightness)
 
     def Choose(self, CalibratorID):
-        logger.debug(f"ASCOMCoverCalibrator.Choose({CalibratorID}) called")
+        logger.debug("ASCOMCoverCalibrator.Choose(%s) called", CalibratorID)
         self._device.Choose(CalibratorID)
 
     def CloseCover(self):
-        logger.debug(f"ASCOMCoverCalibrator.CloseCover() called")
+        logger.debug("ASCOMCoverCalibrator.CloseCover() called")
         self._device.CloseCover()
 
     def HaltCover(self):
-        logger.debug(f"ASCOMCoverCalibrator.HaltCover() called")
+        logger.debug("ASCOMCoverCalibrator.HaltCover() called")
         self._device.HaltCover()
 
     def OpenCover(self):
-        logger.debug(f"ASCOMCoverCalibrator.OpenCover() called")
+        logger.debug("ASCOMCoverCalibrator.OpenCover() called")
         self._device.OpenCover()
 
     @property
     def Brightness(self):
-        logger.debug(f"ASCOMCoverCalibrator.Brightness property called")
+        logger.debug("ASCOMCoverCalibrator.Brightness property called")
         return self._device.Brightness
 
     @property
     def CalibratorState(self):
-        logger.debug(f"ASCOMCoverCalibrator.CalibratorState property called")
+        logger.debug("ASCOMCoverCalibrator.CalibratorState property called")
         return self._device.CalibratorState
 
     @property
     def CoverState(self):
-        logger.debug(f"ASCOMCoverCalibrator.CoverState property called")
+        logger.debug("ASCOMCoverCalibrator.CoverState property called")
         return self._device.CoverState
 
     @property
     def MaxBrightness(self):
-        logger.debug(f"ASCOMCoverCalibrator.MaxBrightness property called")
+        logger.debug("ASCOMCoverCalibrator.MaxBrightness property called")
         return self._device.MaxBrightness
@@ -6,10 +6,40 @@ from .observatory_exception import ObservatoryException
 
 logger = logging.getLogger(__name__)
 
+_alpaca_session = None
+
+# Seconds before an Alpaca property read is abandoned. Only GET requests are
+# bounded, since synchronous methods such as slews may legitimately block.
+_ALPACA_READ_TIMEOUT = 10
+
+
+def _get_alpaca_session():
+    """Return the keep-alive HTTP session shared by all Alpaca devices."""
+    global _alpaca_session
+    if _alpaca_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        class _ReadTimeoutAdapter(HTTPAdapter):
+            def send(self, request, timeout=None, **kwargs):
+                if timeout is None and request.method == "GET":
+                    timeout = _ALPACA_READ_TIMEOUT
+                return super().send(request, timeout=timeout, **kwargs)
+
+        _alpaca_session = requests.Session()
+        adapter = _ReadTimeoutAdapter(pool_connections=4, pool_maxsize=10)
+        _alpaca_session.mount("http://", adapter)
+        _alpaca_session.mount("https://", adapter)
+    return _alpaca_session
+
 
 class ASCOMDevice(Device):
+    __slots__ = ("_identifier", "_device")
+
     def __init__(self, identifier, alpaca=False, device_type="Device", **kwargs):
-        logger.debug(f"ASCOMDevice.__init__({identifier}, alpaca={alpaca}, {kwargs})")
+        logger.debug(
+            "ASCOMDevice.__init__(%s, alpaca=%s, %s)", identifier, alpaca, kwargs
+        )
         self._identifier = identifier
         self._device = None
 
@@ -22,6 +52,9 @@ class ASCOMDevice(Device):
                 ),
                 device_type,
             )(self._identifier, **kwargs)
+            # alpyca opens a session per device; share one so devices served
+            # by the same Alpaca server reuse its pooled connections.
+            self._device.rqs = _get_alpaca_session()
         elif platform.system() == "Windows":
             from win32com.client import Dispatch
 
@@ -30,65 +63,65 @@ class ASCOMDevice(Device):
             raise ObservatoryException("If you are not on Windows, you must use Alpaca")
 
     def Action(self, ActionName, *ActionParameters):
-        logger.debug(f"ASCOMDevice.Action({ActionName}, {ActionParameters})")
+        logger.debug("ASCOMDevice.Action(%s, %s)", ActionName, ActionParameters)
         return self._device.Action(ActionName, *ActionParameters)
 
     def CommandBlind(self, Command, Raw):
-        logger.debug(f"ASCOMDevice.CommandBlind({Command}, {Raw})")
+        logger.debug("ASCOMDevice.CommandBlind(%s, %s)", Command, Raw)
         self._device.CommandBlind(Command, Raw)
 
     def CommandBool(self, Command, Raw):
-        logger.debug(f"ASCOMDevice.CommandBool({Command}, {Raw})")
+        logger.debug("ASCOMDevice.CommandBool(%s, %s)", Command, Raw)
         return self._device.CommandBool(Command, Raw)
 
     def CommandString(self, Command, Raw):
-        logger.debug(f"ASCOMDevice.CommandString({Command}, {Raw})")
+        logger.debug("ASCOMDevice.CommandString(%s, %s)", Command, Raw)
         return self._device.CommandString(Command, Raw)
 
     """def Dispose(self):
-        logger.debug(f"ASCOMDevice.Dispose()")
+        logger.debug("ASCOMDevice.Dispose()")
         self._device.Dispose()
 
     def SetupDialog(self):
-        logger.debug(f"ASCOMDevice.SetupDialog()")
+        logger.debug("ASCOMDevice.SetupDialog()")
         self._device.SetupDialog()"""
 
     @property
     def Connected(self):
-        logger.debug(f"ASCOMDevice.Connected property")
+        logger.debug("ASCOMDevice.Connected property")
         return self._device.Connected
 
     @Connected.setter
     def Connected(self, value):
-        logger.debug(f"ASCOMDevice.Connected property set to {value}")
+        logger.debug("ASCOMDevice.Connected property set to %s", value)
         self._device.Connected = value
 
     @property
     def Description(self):
-        logger.debug(f"ASCOMDevice.Description property")
+        logger.debug("ASCOMDevice.Description property")
         return self._device.Description
 
     @property
     def DriverInfo(self):
-        logger.debug(f"ASCOMDevice.DriverInfo property")
+        logger.debug("ASCOMDevice.DriverInfo property")
         return self._device.DriverInfo
 
     @property
     def DriverVersion(self):
-        logger.debug(f"ASCOMDevice.DriverVersion property")
+        logger.debug("ASCOMDevice.DriverVersion property")
         return self._device.DriverVersion
 
     @property
     def InterfaceVersion(self):
-        logger.debug(f"ASCOMDevice.InterfaceVersion property")
+        logger.debug("ASCOMDevice.InterfaceVersion property")
         return self._device.InterfaceVersion
 
     @property
     def Name(self):
-        logger.debug(f"ASCOMDevice.Name property")
+        logger.debug("ASCOMDevice.Name property")
         return self._device.Name
 
     @property
     def SupportedActions(self):
-        logger.debug(f"ASCOMDevice.SupportedActions property")
+        logger.debug("ASCOMDevice.SupportedActions property")
         return self._device.SupportedActions
@@ -1,132 +1,423 @@
+import asyncio
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
 
 from .ascom_device import ASCOMDevice
 from .dome import Dome
+from .observatory_exception import ObservatoryException
 
 logger = logging.getLogger(__name__)
 
+_COMPATIBLE_MOTIONS = {frozenset(("SlewToAltitude", "SlewToAzimuth"))}
+
+_SNAPSHOT_PROPERTIES = ("Slewing", "Azimuth", "AtHome", "AtPark", "ShutterStatus")
+
+
+def _capability_property(name):
+    """Build a read-only property that reads ``name`` from the device once.
+
+    Capability flags are fixed for the lifetime of a connection, so the first
+    value is kept until :meth:`ASCOMDome.invalidate_capabilities` is called.
+    """
+
+    getter = attrgetter(name)
+    is_enabled_for, debug = logger.isEnabledFor, logger.debug
+
+    def fget(self):
+        if is_enabled_for(logging.DEBUG):
+            debug("ASCOMDome.%s property called", name)
+        try:
+            return self._capabilities[name]
+        except KeyError:
+            value = self._capabilities[name] = getter(self._device)
+            return value
+
+    fget.__name__ = name
+    return property(fget)
+
+
+def _state_property(name):
+    """Build a read-only property for dome state that is polled in tight loops.
+
+    Reads within :attr:`ASCOMDome.state_cache_ttl` seconds of each other share
+    one device round-trip. Every command sent to the dome clears the cache.
+    """
+
+    is_enabled_for, debug = logger.isEnabledFor, logger.debug
+
+    def fget(self):
+        if is_enabled_for(logging.DEBUG):
+            debug("ASCOMDome.%s property called", name)
+        return self._read_state(name)
+
+    fget.__name__ = name
+    return property(fget)
+
+
+class _ASCOMDomeSetup:
+    """One-shot configuration calls, kept apart from the motion and state API."""
+
+    __slots__ = ()
+
+    def Choose(self, DomeID):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ASCOMDome.Choose(%s) called", DomeID)
+        self._device.Choose(DomeID)
+        self._invalidate_state()
+
+    def SetPark(self):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ASCOMDome.SetPark() called")
+        self._device_SetPark()
+        self._invalidate_state()
+
+
+class ASCOMDome(ASCOMDevice, _ASCOMDomeSetup, Dome):
+    __slots__ = (
+        "_alpaca",
+        "_capabilities",
+        "_state_cache",
+        "_state_pending",
+        "_state_generation",
+        "_state_lock",
+        "_motion_in_progress",
+        "_active_motions",
+        "_device_AbortSlew",
+        "_device_CloseShutter",
+        "_device_FindHome",
+        "_device_OpenShutter",
+        "_device_Park",
+        "_device_SetPark",
+        "_device_SlewToAltitude",
+        "_device_SlewToAzimuth",
+        "_device_SyncToAzimuth",
+    )
+
+    _device_type = "Dome"
+
+    state_cache_ttl = 0.1
+    """Seconds a polled state value (``Slewing``, ``Azimuth``, ...) is reused."""
+
+    azimuth_tolerance = 1.0
+    """Degrees within which an asynchronous azimuth slew counts as arrived."""
+
+    poll_interval = 0.2
+    """Seconds between completion checks in the asynchronous motion methods."""
 
-class ASCOMDome(ASCOMDevice, Dome):
     def __init__(self, identifier, alpaca=False, device_number=0, protocol="http"):
         super().__init__(
             identifier,
             alpaca=alpaca,
-            device_type=self.__class__.__name__.replace("ASCOM", ""),
+            device_type=self._device_type,
             device_number=device_number,
             protocol=protocol,
         )
 
-    def AbortSlew(self):
-        logger.debug(f"ASCOMDome.AbortSlew() called")
-        self._device.AbortSlew()
+        self._alpaca = alpaca
+        self._capabilities = {}
+        self._state_cache = {}
+        self._state_pending = {}
+        self._state_generation = 0
+        self._state_lock = threading.Lock()
+        self._motion_in_progress = False
+        self._active_motions = set()
 
-    def Choose(self, DomeID):
-        logger.debug(f"ASCOMDome.Choose({DomeID}) called")
-        self._device.Choose(DomeID)
+        # Bind the device callables once so each call skips the lookup on
+        # self._device. Choose is COM-only and is resolved per call.
+        self._device_AbortSlew = self._device.AbortSlew
+        self._device_CloseShutter = self._device.CloseShutter
+        self._device_FindHome = self._device.FindHome
+        self._device_OpenShutter = self._device.OpenShutter
+        self._device_Park = self._device.Park
+        self._device_SetPark = self._device.SetPark
+        self._device_SlewToAltitude = self._device.SlewToAltitude
+        self._device_SlewToAzimuth = self._device.SlewToAzimuth
+        self._device_SyncToAzimuth = self._device.SyncToAzimuth
+
+    def invalidate_capabilities(self):
+        """Forget the cached ``Can*`` flags so they are re-read from the device."""
+        logger.debug("ASCOMDome.invalidate_capabilities() called")
+        self._capabilities.clear()
+
+    def _read_state(self, name):
+        # Concurrent readers of the same property wait for the read already
+        # in flight instead of issuing a second driver call.
+        with self._state_lock:
+            cached = self._state_cache.get(name)
+            if (
+                cached is not None
+                and time.monotonic() - cached[0] < self.state_cache_ttl
+            ):
+                return cached[1]
+            pending = self._state_pending.get(name)
+            owner = pending is None
+            if owner:
+                pending = self._state_pending[name] = threading.Event()
+            generation = self._state_generation
+
+        if not owner:
+            pending.wait()
+            cached = self._state_cache.get(name)
+            if cached is not None:
+                return cached[1]
+            return getattr(self._device, name)
+
+        try:
+            value = getattr(self._device, name)
+            with self._state_lock:
+                if generation == self._state_generation:
+                    self._state_cache[name] = (time.monotonic(), value)
+            return value
+        finally:
+            with self._state_lock:
+                del self._state_pending[name]
+            pending.set()
+
+    def _invalidate_state(self):
+        with self._state_lock:
+            self._state_cache.clear()
+            self._state_generation += 1
+
+    def snapshot(self, names=_SNAPSHOT_PROPERTIES):
+        """Read several state properties at once and refresh the state cache.
+
+        Alpaca reads are issued concurrently over the device's keep-alive
+        session; COM reads are issued in turn because dispatch objects cannot
+        be shared across threads.
+
+        Parameters
+        ----------
+        names : tuple of str, optional
+            The state properties to read. Defaults to ``Slewing``, ``Azimuth``,
+            ``AtHome``, ``AtPark`` and ``ShutterStatus``.
+
+        Returns
+        -------
+        dict
+            The values read, keyed by property name.
+        """
+        logger.debug("ASCOMDome.snapshot() called")
+        with self._state_lock:
+            generation = self._state_generation
+
+        if self._alpaca:
+            with ThreadPoolExecutor(max_workers=len(names)) as executor:
+                values = list(executor.map(partial(getattr, self._device), names))
+        else:
+            values = [getattr(self._device, name) for name in names]
+
+        now = time.monotonic()
+        with self._state_lock:
+            if generation == self._state_generation:
+                self._state_cache.update(
+                    (name, (now, value)) for name, value in zip(names, values)
+                )
+        return dict(zip(names, values))
+
+    def _begin_motion(self, name):
+        # Refuse a motion that would overlap one still running, without
+        # sending it to the driver. Slewing is only read when a motion has
+        # been started since the dome was last seen idle.
+        active = self._active_motions
+        if active:
+            if not self.Slewing:
+                active.clear()
+            elif any(
+                frozenset((name, other)) not in _COMPATIBLE_MOTIONS for other in active
+            ):
+                raise ObservatoryException(
+                    f"Cannot start {name} while {', '.join(sorted(active))} is in progress"
+                )
+        active.add(name)
+
+    def _wait_until(self, done, timeout):
+        deadline = time.monotonic() + timeout
+        delay = 0.1
+        while time.monotonic() < deadline:
+            if done():
+                return True
+            time.sleep(delay)
+            delay = min(delay * 1.5, 2.0)
+        return done()
+
+    def wait_until_home(self, timeout=120):
+        """Block until the dome reports :attr:`AtHome`.
+
+        Returns ``True`` on success, or ``False`` if ``timeout`` seconds pass.
+        """
+        logger.debug("ASCOMDome.wait_until_home() called")
+        return self._wait_until(lambda: self.AtHome, timeout)
+
+    def wait_until_parked(self, timeout=120):
+        """Block until the dome reports :attr:`AtPark`.
+
+        Only ``AtPark`` is polled; ``AtHome`` says nothing about a park having
+        finished. Returns ``True`` on success, or ``False`` if ``timeout``
+        seconds pass.
+        """
+        logger.debug("ASCOMDome.wait_until_parked() called")
+        return self._wait_until(lambda: self.AtPark, timeout)
+
+    def wait_until_shutter_open(self, timeout=120):
+        """Block until :attr:`ShutterStatus` reports the shutter open (0).
+
+        Returns ``True`` on success, or ``False`` if ``timeout`` seconds pass.
+        """
+        logger.debug("ASCOMDome.wait_until_shutter_open() called")
+        return self._wait_until(lambda: self.ShutterStatus == 0, timeout)
+
+    async def _await_motion(self, command, args, done):
+        # Driver calls stay on the calling thread because COM dispatch objects
+        # cannot be shared across threads; only the waiting is asynchronous.
+        if self._motion_in_progress:
+            raise ObservatoryException("A dome motion is already in progress")
+        self._motion_in_progress = True
+        start = time.monotonic()
+        polls = 0
+        try:
+            command(*args)
+            while True:
+                await asyncio.sleep(self.poll_interval)
+                polls += 1
+                if done():
+                    break
+        finally:
+            self._motion_in_progress = False
+        # One summary record per motion rather than a trace of every poll.
+        logger.info(
+            "Dome %s(%s) finished in %.1f s after %d polls",
+            command.__name__,
+            ", ".join(str(arg) for arg in args),
+            time.monotonic() - start,
+            polls,
+        )
+
+    async def CloseShutterAsync(self):
+        """Close the shutter and return once it has stopped moving."""
+        logger.debug("ASCOMDome.CloseShutterAsync() called")
+        await self._await_motion(
+            self.CloseShutter, (), lambda: self.ShutterStatus not in (2, 3)
+        )
+
+    async def FindHomeAsync(self):
+        """Find home and return once the dome reports :attr:`AtHome`."""
+        logger.debug("ASCOMDome.FindHomeAsync() called")
+        await self._await_motion(
+            self.FindHome, (), lambda: not self.Slewing and self.AtHome
+        )
+
+    async def OpenShutterAsync(self):
+        """Open the shutter and return once it has stopped moving."""
+        logger.debug("ASCOMDome.OpenShutterAsync() called")
+        await self._await_motion(
+            self.OpenShutter, (), lambda: self.ShutterStatus not in (2, 3)
+        )
+
+    async def ParkAsync(self):
+        """Park the dome and return once the dome reports :attr:`AtPark`."""
+        logger.debug("ASCOMDome.ParkAsync() called")
+        await self._await_motion(
+            self.Park, (), lambda: not self.Slewing and self.AtPark
+        )
+
+    async def SlewToAltitudeAsync(self, Altitude):
+        """Slew the shutter to ``Altitude`` and return once the slew has finished."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ASCOMDome.SlewToAltitudeAsync(%s) called", Altitude)
+        await self._await_motion(
+            self.SlewToAltitude, (Altitude,), lambda: not self.Slewing
+        )
+
+    async def SlewToAzimuthAsync(self, Azimuth):
+        """Slew to ``Azimuth`` and return once the dome is within
+        :attr:`azimuth_tolerance` degrees of it and no longer slewing."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ASCOMDome.SlewToAzimuthAsync(%s) called", Azimuth)
+        tolerance = self.azimuth_tolerance
+
+        def arrived():
+            if self.Slewing:
+                return False
+            d = abs(self.Azimuth - Azimuth) % 360.0
+            return d <= tolerance or 360.0 - d <= tolerance
+
+        await self._await_motion(self.SlewToAzimuth, (Azimuth,), arrived)
+
+    def AbortSlew(self):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ASCOMDome.AbortSlew() called")
+        self._device_AbortSlew()
+        self._active_motions.clear()
+        self._invalidate_state()
 
     def CloseShutter(self):
-        logger.debug(f"ASCOMDome.CloseShutter() called")
-        self._device.CloseShutter()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ASCOMDome.CloseShutter() called")
+        self._device_CloseShutter()
+        self._invalidate_state()
 
     def FindHome(self):
-        logger.debug(f"ASCOMDome.FindHome() called")
-        self._device.FindHome()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ASCOMDome.FindHome() called")
+        self._begin_motion("FindHome")
+        self._device_FindHome()
+        self._invalidate_state()
 
     def OpenShutter(self):
-        logger.debug(f"ASCOMDome.OpenShutter() called")
-        self._device.OpenShutter()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ASCOMDome.OpenShutter() called")
+        self._device_OpenShutter()
+        self._invalidate_state()
 
     def Park(self):
-        logger.debug(f"ASCOMDome.Park() called")
-        self._device.Park()
-
-    def SetPark(self):
-        logger.debug(f"ASCOMDome.SetPark() called")
-        self._device.SetPark()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ASCOMDome.Park() called")
+        self._begin_motion("Park")
+        self._device_Park()
+        self._invalidate_state()
 
     def SlewToAltitude(self, Altitude):
-        logger.debug(f"ASCOMDome.SlewToAltitude({Altitude}) called")
-        self._device.SlewToAltitude(Altitude)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ASCOMDome.SlewToAltitude(%s) called", Altitude)
+        self._begin_motion("SlewToAltitude")
+        self._device_SlewToAltitude(Altitude)
+        self._invalidate_state()
 
     def SlewToAzimuth(self, Azimuth):
-        logger.debug(f"ASCOMDome.SlewToAzimuth({Azimuth}) called")
-        self._device.SlewToAzimuth(Azimuth)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ASCOMDome.SlewToAzimuth(%s) called", Azimuth)
+        self._begin_motion("SlewToAzimuth")
+        self._device_SlewToAzimuth(Azimuth)
+        self._invalidate_state()
 
     def SyncToAzimuth(self, Azimuth):
-        logger.debug(f"ASCOMDome.SyncToAzimuth({Azimuth}) called")
-        self._device.SyncToAzimuth(Azimuth)
-
-    @property
-    def Altitude(self):
-        logger.debug(f"ASCOMDome.Altitude property called")
-        return self._device.Altitude
-
-    @property
-    def AtHome(self):
-        logger.debug(f"ASCOMDome.AtHome property called")
-        return self._device.AtHome
-
-    @property
-    def AtPark(self):
-        logger.debug(f"ASCOMDome.AtPark property called")
-        return self._device.AtPark
-
-    @property
-    def Azimuth(self):
-        logger.debug(f"ASCOMDome.Azimuth property called")
-        return self._device.Azimuth
-
-    @property
-    def CanFindHome(self):
-        logger.debug(f"ASCOMDome.CanFindHome property called")
-        return self._device.CanFindHome
-
-    @property
-    def CanPark(self):
-        logger.debug(f"ASCOMDome.CanPark property called")
-        return self._device.CanPark
-
-    @property
-    def CanSetAltitude(self):
-        logger.debug(f"ASCOMDome.CanSetAltitude property called")
-        return self._device.CanSetAltitude
-
-    @property
-    def CanSetAzimuth(self):
-        logger.debug(f"ASCOMDome.CanSetAzimuth property called")
-        return self._device.CanSetAzimuth
-
-    @property
-    def CanSetPark(self):
-        logger.debug(f"ASCOMDome.CanSetPark property called")
-        return self._device.CanSetPark
-
-    @property
-    def CanSetShutter(self):
-        logger.debug(f"ASCOMDome.CanSetShutter property called")
-        return self._device.CanSetShutter
-
-    @property
-    def CanSlave(self):
-        logger.debug(f"ASCOMDome.CanSlave property called")
-        return self._device.CanSlave
-
-    @property
-    def CanSyncAzimuth(self):
-        logger.debug(f"ASCOMDome.CanSyncAzimuth property called")
-        return self._device.CanSyncAzimuth
-
-    @property
-    def ShutterStatus(self):
-        logger.debug(f"ASCOMDome.ShutterStatus property called")
-        return self._device.ShutterStatus
-
-    @property
-    def Slaved(self):
-        logger.debug(f"ASCOMDome.Slaved property called")
-        return self._device.Slaved
-
-    @property
-    def Slewing(self):
-        logger.debug(f"ASCOMDome.Slewing property called")
-        return self._device.Slewing
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ASCOMDome.SyncToAzimuth(%s) called", Azimuth)
+        self._device_SyncToAzimuth(Azimuth)
+        self._invalidate_state()
+
+    @ASCOMDevice.Connected.setter
+    def Connected(self, value):
+        self.invalidate_capabilities()
+        self._invalidate_state()
+        ASCOMDevice.Connected.fset(self, value)
+
+    Altitude = _state_property("Altitude")
+    AtHome = _state_property("AtHome")
+    AtPark = _state_property("AtPark")
+    Azimuth = _state_property("Azimuth")
+    CanFindHome = _capability_property("CanFindHome")
+    CanPark = _capability_property("CanPark")
+    CanSetAltitude = _capability_property("CanSetAltitude")
+    CanSetAzimuth = _capability_property("CanSetAzimuth")
+    CanSetPark = _capability_property("CanSetPark")
+    CanSetShutter = _capability_property("CanSetShutter")
+    CanSlave = _capability_property("CanSlave")
+    CanSyncAzimuth = _capability_property("CanSyncAzimuth")
+    ShutterStatus = _state_property("ShutterStatus")
+    Slaved = _state_property("Slaved")
+    Slewing = _state_property("Slewing")
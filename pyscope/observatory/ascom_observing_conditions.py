@@ -7,17 +7,21 @@ logger = logging.getLogger(__name__)
 
 
 class ASCOMObservingConditions(ASCOMDevice, ObservingConditions):
+    _device_type = "ObservingConditions"
+
     def __init__(self, identifier, alpaca=False, device_number=0, protocol="http"):
         super().__init__(
             identifier,
             alpaca=alpaca,
-            device_type=self.__class__.__name__.replace("ASCOM", ""),
+            device_type=self._device_type,
             device_number=device_number,
             protocol=protocol,
         )
 
     def Choose(self, ObservingConditionsID):
-        logger.debug(f"ASCOMObservingConditions.Choose({ObservingConditionsID}) called")
+        logger.debug(
+            "ASCOMObservingConditions.Choose(%s) called", ObservingConditionsID
+        )
         self._device.Choose(ObservingConditionsID)
 
     def Refresh(self):
@@ -26,13 +30,13 @@ class ASCOMObservingConditions(ASCOMDevice, ObservingConditions):
 
     def SensorDescription(self, PropertyName):
         logger.debug(
-            f"ASCOMObservingConditions.SensorDescription({PropertyName}) called"
+            "ASCOMObservingConditions.SensorDescription(%s) called", PropertyName
         )
         return self._device.SensorDescription(PropertyName)
 
     def TimeSinceLastUpdate(self, PropertyName):
         logger.debug(
-            f"ASCOMObservingConditions.TimeSinceLastUpdate({PropertyName}) called"
+            "ASCOMObservingConditions.TimeSinceLastUpdate(%s) called", PropertyName
         )
         return self._device.TimeSinceLastUpdate(PropertyName)
 
@@ -43,7 +47,7 @@ class ASCOMObservingConditions(ASCOMDevice, ObservingConditions):
 
     @AveragePeriod.setter
     def AveragePeriod(self, value):
-        logger.debug(f"ASCOMObservingConditions.AveragePeriod property set to {value}")
+        logger.debug("ASCOMObservingConditions.AveragePeriod property set to %s", value)
         self._device.AveragePeriod = value
 
     @property
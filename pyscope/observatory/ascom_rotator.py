@@ -7,17 +7,19 @@ logger = logging.getLogger(__name__)
 
 
 class ASCOMRotator(ASCOMDevice, Rotator):
+    _device_type = "Rotator"
+
     def __init__(self, identifier, alpaca=False, device_number=0, protocol="http"):
         super().__init__(
             identifier,
             alpaca=alpaca,
-            device_type=self.__class__.__name__.replace("ASCOM", ""),
+            device_type=self._device_type,
             device_number=device_number,
             protocol=protocol,
         )
 
     def Choose(self, RotatorID):
-        logger.debug(f"ASCOMRotator.Choose({RotatorID}) called")
+        logger.debug("ASCOMRotator.Choose(%s) called", RotatorID)
         self._device.Choose(RotatorID)
 
     def Halt(self):
@@ -25,19 +27,19 @@ class ASCOMRotator(ASCOMDevice, Rotator):
         self._device.Halt()
 
     def Move(self, Position):
-        logger.debug(f"ASCOMRotator.Move({Position}) called")
+        logger.debug("ASCOMRotator.Move(%s) called", Position)
         self._device.Move(Position)
 
     def MoveAbsolute(self, Position):
-        logger.debug(f"ASCOMRotator.MoveAbsolute({Position}) called")
+        logger.debug("ASCOMRotator.MoveAbsolute(%s) called", Position)
         self._device.MoveAbsolute(Position)
 
     def MoveMechanical(self, Position):
-        logger.debug(f"ASCOMRotator.MoveMechanical({Position}) called")
+        logger.debug("ASCOMRotator.MoveMechanical(%s) called", Position)
         self._device.MoveMechanical(Position)
 
     def Sync(self, Position):
-        logger.debug(f"ASCOMRotator.Sync({Position}) called")
+        logger.debug("ASCOMRotator.Sync(%s) called", Position)
         self._device.Sync(Position)
 
     @property
@@ -67,7 +69,7 @@ class ASCOMRotator(ASCOMDevice, Rotator):
 
     @Reverse.setter
     def Reverse(self, value):
-        logger.debug(f"ASCOMRotator.Reverse property set to {value}")
+        logger.debug("ASCOMRotator.Reverse property set to %s", value)
         self._device.Reverse = value
 
     @property
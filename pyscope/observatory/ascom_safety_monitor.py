@@ -7,20 +7,22 @@ logger = logging.getLogger(__name__)
 
 
 class ASCOMSafetyMonitor(ASCOMDevice, SafetyMonitor):
+    _device_type = "SafetyMonitor"
+
     def __init__(self, identifier, alpaca=False, device_number=0, protocol="http"):
         super().__init__(
             identifier,
             alpaca=alpaca,
-            device_type=self.__class__.__name__.replace("ASCOM", ""),
+            device_type=self._device_type,
             device_number=device_number,
             protocol=protocol,
         )
 
     def Choose(self, SafetyMonitorID):
-        logger.debug(f"ASCOMSafetyMonitor.Choose({SafetyMonitorID}) called")
+        logger.debug("ASCOMSafetyMonitor.Choose(%s) called", SafetyMonitorID)
         self._device.Choose(SafetyMonitorID)
 
     @property
     def IsSafe(self):
-        logger.debug(f"ASCOMSafetyMonitor.IsSafe property called")
+        logger.debug("ASCOMSafetyMonitor.IsSafe property called")
         return self._device.IsSafe
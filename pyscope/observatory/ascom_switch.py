@@ -7,57 +7,59 @@ logger = logging.getLogger(__name__)
 
 
 class ASCOMSwitch(ASCOMDevice, Switch):
+    _device_type = "Switch"
+
     def __init__(self, identifier, alpaca=False, device_number=0, protocol="http"):
         super().__init__(
             identifier,
             alpaca=alpaca,
-            device_type=self.__class__.__name__.replace("ASCOM", ""),
+            device_type=self._device_type,
             device_number=device_number,
             protocol=protocol,
         )
 
     def CanWrite(self, ID):
-        logger.debug(f"ASCOMSwitch.CanWrite({ID}) called")
+        logger.debug("ASCOMSwitch.CanWrite(%s) called", ID)
         return self._device.CanWrite(ID)
 
     def Choose(self, SwitchID):
-        logger.debug(f"ASCOMSwitch.Choose({SwitchID}) called")
+        logger.debug("ASCOMSwitch.Choose(%s) called", SwitchID)
         self._device.Choose(SwitchID)
 
     def GetSwitch(self, ID):
-        logger.debug(f"ASCOMSwitch.GetSwitch({ID}) called")
+        logger.debug("ASCOMSwitch.GetSwitch(%s) called", ID)
         return self._device.GetSwitch(ID)
 
     def GetSwitchDescription(self, ID):
-        logger.debug(f"ASCOMSwitch.GetSwitchDescription({ID}) called")
+        logger.debug("ASCOMSwitch.GetSwitchDescription(%s) called", ID)
         return self._device.GetSwitchDescription(ID)
 
     def GetSwitchName(self, ID):
-        logger.debug(f"ASCOMSwitch.GetSwitchName({ID}) called")
+        logger.debug("ASCOMSwitch.GetSwitchName(%s) called", ID)
         return self._device.GetSwitchName(ID)
 
     def MaxSwitchValue(self, ID):
-        logger.debug(f"ASCOMSwitch.MaxSwitchValue({ID}) called")
+        logger.debug("ASCOMSwitch.MaxSwitchValue(%s) called", ID)
         return self._device.MaxSwitchValue(ID)
 
     def MinSwitchValue(self, ID):
-        logger.debug(f"ASCOMSwitch.MinSwitchValue({ID}) called")
+        logger.debug("ASCOMSwitch.MinSwitchValue(%s) called", ID)
         return self._device.MinSwitchValue(ID)
 
     def SetSwitch(self, ID, State):
-        logger.debug(f"ASCOMSwitch.SetSwitch({ID}, {State}) called")
+        logger.debug("ASCOMSwitch.SetSwitch(%s, %s) called", ID, State)
         self._device.SetSwitch(ID, State)
 
     def SetSwitchName(self, ID, Name):
-        logger.debug(f"ASCOMSwitch.SetSwitchName({ID}, {Name}) called")
+        logger.debug("ASCOMSwitch.SetSwitchName(%s, %s) called", ID, Name)
         self._device.SetSwitchName(ID, Name)
 
     def SetSwitchValue(self, ID, Value):
-        logger.debug(f"ASCOMSwitch.SetSwitchValue({ID}, {Value}) called")
+        logger.debug("ASCOMSwitch.SetSwitchValue(%s, %s) called", ID, Value)
         self._device.SetSwitchValue(ID, Value)
 
     def SwitchStep(self, ID):
-        logger.debug(f"ASCOMSwitch.SwitchStep({ID}) called")
+        logger.debug("ASCOMSwitch.SwitchStep(%s) called", ID)
         self._device.SwitchStep(ID)
 
     @property
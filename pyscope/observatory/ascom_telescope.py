@@ -7,11 +7,13 @@ logger = logging.getLogger(__name__)
 
 
 class ASCOMTelescope(ASCOMDevice, Telescope):
+    _device_type = "Telescope"
+
     def __init__(self, identifier, alpaca=False, device_number=0, protocol="http"):
         super().__init__(
             identifier,
             alpaca=alpaca,
-            device_type=self.__class__.__name__.replace("ASCOM", ""),
+            device_type=self._device_type,
             device_number=device_number,
             protocol=protocol,
         )
@@ -21,20 +23,22 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
         self._device.AbortSlew()
 
     def AxisRates(self, Axis):
-        logger.debug(f"ASCOMTelescope.AxisRates({Axis}) called")
+        logger.debug("ASCOMTelescope.AxisRates(%s) called", Axis)
         return self._device.AxisRates(Axis)
 
     def CanMoveAxis(self, Axis):
-        logger.debug(f"ASCOMTelescope.CanMoveAxis({Axis}) called")
+        logger.debug("ASCOMTelescope.CanMoveAxis(%s) called", Axis)
         return self._device.CanMoveAxis(Axis)
 
     def Choose(self, TelescopeID):
-        logger.debug(f"ASCOMTelescope.Choose({TelescopeID}) called")
+        logger.debug("ASCOMTelescope.Choose(%s) called", TelescopeID)
         self._device.Choose(TelescopeID)
 
     def DestinationSideOfPier(self, RightAscension, Declination):
         logger.debug(
-            f"ASCOMTelescope.DestinationSideOfPier({RightAscension}, {Declination}) called"
+            "ASCOMTelescope.DestinationSideOfPier(%s, %s) called",
+            RightAscension,
+            Declination,
         )
         return self._device.DestinationSideOfPier(RightAscension, Declination)
 
@@ -43,7 +47,7 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
         self._device.FindHome()
 
     def MoveAxis(self, Axis, Rate):
-        logger.debug(f"ASCOMTelescope.MoveAxis({Axis}, {Rate}) called")
+        logger.debug("ASCOMTelescope.MoveAxis(%s, %s) called", Axis, Rate)
         self._device.MoveAxis(Axis, Rate)
 
     def Park(self):
@@ -51,7 +55,7 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
         self._device.Park()
 
     def PulseGuide(self, Direction, Duration):
-        logger.debug(f"ASCOMTelescope.PulseGuide({Direction}, {Duration}) called")
+        logger.debug("ASCOMTelescope.PulseGuide(%s, %s) called", Direction, Duration)
         self._device.PulseGuide(Direction, Duration)
 
     def SetPark(self):
@@ -59,22 +63,28 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
         self._device.SetPark()
 
     def SlewToAltAz(self, Azimuth, Altitude):
-        logger.debug(f"ASCOMTelescope.SlewToAltAz({Azimuth}, {Altitude}) called")
+        logger.debug("ASCOMTelescope.SlewToAltAz(%s, %s) called", Azimuth, Altitude)
         self._device.SlewToAltAz(Azimuth, Altitude)
 
     def SlewToAltAzAsync(self, Azimuth, Altitude):
-        logger.debug(f"ASCOMTelescope.SlewToAltAzAsync({Azimuth}, {Altitude}) called")
+        logger.debug(
+            "ASCOMTelescope.SlewToAltAzAsync(%s, %s) called", Azimuth, Altitude
+        )
         self._device.SlewToAltAzAsync(Azimuth, Altitude)
 
     def SlewToCoordinates(self, RightAscension, Declination):
         logger.debug(
-            f"ASCOMTelescope.SlewToCoordinates({RightAscension}, {Declination}) called"
+            "ASCOMTelescope.SlewToCoordinates(%s, %s) called",
+            RightAscension,
+            Declination,
         )
         self._device.SlewToCoordinates(RightAscension, Declination)
 
     def SlewToCoordinatesAsync(self, RightAscension, Declination):
         logger.debug(
-            f"ASCOMTelescope.SlewToCoordinatesAsync({RightAscension}, {Declination}) called"
+            "ASCOMTelescope.SlewToCoordinatesAsync(%s, %s) called",
+            RightAscension,
+            Declination,
         )
         self._device.SlewToCoordinatesAsync(RightAscension, Declination)
 
@@ -87,12 +97,14 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
         self._device.SlewToTargetAsync()
 
     def SyncToAltAz(self, Azimuth, Altitude):
-        logger.debug(f"ASCOMTelescope.SyncToAltAz({Azimuth}, {Altitude}) called")
+        logger.debug("ASCOMTelescope.SyncToAltAz(%s, %s) called", Azimuth, Altitude)
         self._device.SyncToAltAz(Azimuth, Altitude)
 
     def SyncToCoordinates(self, RightAscension, Declination):
         logger.debug(
-            f"ASCOMTelescope.SyncToCoordinates({RightAscension}, {Declination}) called"
+            "ASCOMTelescope.SyncToCoordinates(%s, %s) called",
+            RightAscension,
+            Declination,
         )
         self._device.SyncToCoordinates(RightAscension, Declination)
 
@@ -150,7 +162,7 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
         return self._device.CanPark
 
     def CanPulseGuide(self, Direction):
-        logger.debug(f"ASCOMTelescope.CanPulseGuide({Direction}) called")
+        logger.debug("ASCOMTelescope.CanPulseGuide(%s) called", Direction)
         return self._device.CanPulseGuide(Direction)
 
     @property
@@ -230,7 +242,7 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
 
     @DeclinationRate.setter
     def DeclinationRate(self, value):
-        logger.debug(f"ASCOMTelescope.DeclinationRate set to {value}")
+        logger.debug("ASCOMTelescope.DeclinationRate set to %s", value)
         self._device.DeclinationRate = value
 
     @property
@@ -240,7 +252,7 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
 
     @DoesRefraction.setter
     def DoesRefraction(self, value):
-        logger.debug(f"ASCOMTelescope.DoesRefraction set to {value}")
+        logger.debug("ASCOMTelescope.DoesRefraction set to %s", value)
         self._device.DoesRefraction = value
 
     @property
@@ -260,7 +272,7 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
 
     @GuideRateDeclination.setter
     def GuideRateDeclination(self, value):
-        logger.debug(f"ASCOMTelescope.GuideRateDeclination set to {value}")
+        logger.debug("ASCOMTelescope.GuideRateDeclination set to %s", value)
         self._device.GuideRateDeclination = value
 
     @property
@@ -270,7 +282,7 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
 
     @GuideRateRightAscension.setter
     def GuideRateRightAscension(self, value):
-        logger.debug(f"ASCOMTelescope.GuideRateRightAscension set to {value}")
+        logger.debug("ASCOMTelescope.GuideRateRightAscension set to %s", value)
         self._device.GuideRateRightAscension = value
 
     @property
@@ -290,7 +302,7 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
 
     @RightAscensionRate.setter
     def RightAscensionRate(self, value):
-        logger.debug(f"ASCOMTelescope.RightAscensionRate set to {value}")
+        logger.debug("ASCOMTelescope.RightAscensionRate set to %s", value)
         self._device.RightAscensionRate = value
 
     @property
@@ -300,7 +312,7 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
 
     @SideOfPier.setter
     def SideOfPier(self, value):
-        logger.debug(f"ASCOMTelescope.SideOfPier set to {value}")
+        logger.debug("ASCOMTelescope.SideOfPier set to %s", value)
         self._device.SideOfPier = value
 
     @property
@@ -315,7 +327,7 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
 
     @SiteElevation.setter
     def SiteElevation(self, value):
-        logger.debug(f"ASCOMTelescope.SiteElevation set to {value}")
+        logger.debug("ASCOMTelescope.SiteElevation set to %s", value)
         self._device.SiteElevation = value
 
     @property
@@ -325,7 +337,7 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
 
     @SiteLatitude.setter
     def SiteLatitude(self, value):
-        logger.debug(f"ASCOMTelescope.SiteLatitude set to {value}")
+        logger.debug("ASCOMTelescope.SiteLatitude set to %s", value)
         self._device.SiteLatitude = value
 
     @property
@@ -335,7 +347,7 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
 
     @SiteLongitude.setter
     def SiteLongitude(self, value):
-        logger.debug(f"ASCOMTelescope.SiteLongitude set to {value}")
+        logger.debug("ASCOMTelescope.SiteLongitude set to %s", value)
         self._device.SiteLongitude = value
 
     @property
@@ -350,7 +362,7 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
 
     @SlewSettleTime.setter
     def SlewSettleTime(self, value):
-        logger.debug(f"ASCOMTelescope.SlewSettleTime set to {value}")
+        logger.debug("ASCOMTelescope.SlewSettleTime set to %s", value)
         self._device.SlewSettleTime = value
 
     @property
@@ -360,7 +372,7 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
 
     @TargetDeclination.setter
     def TargetDeclination(self, value):
-        logger.debug(f"ASCOMTelescope.TargetDeclination set to {value}")
+        logger.debug("ASCOMTelescope.TargetDeclination set to %s", value)
         self._device.TargetDeclination = value
 
     @property
@@ -370,7 +382,7 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
 
     @TargetRightAscension.setter
     def TargetRightAscension(self, value):
-        logger.debug(f"ASCOMTelescope.TargetRightAscension set to {value}")
+        logger.debug("ASCOMTelescope.TargetRightAscension set to %s", value)
         self._device.TargetRightAscension = value
 
     @property
@@ -380,7 +392,7 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
 
     @Tracking.setter
     def Tracking(self, value):
-        logger.debug(f"ASCOMTelescope.Tracking set to {value}")
+        logger.debug("ASCOMTelescope.Tracking set to %s", value)
         self._device.Tracking = value
 
     @property
@@ -390,7 +402,7 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
 
     @TrackingRate.setter
     def TrackingRate(self, value):
-        logger.debug(f"ASCOMTelescope.TrackingRate set to {value}")
+        logger.debug("ASCOMTelescope.TrackingRate set to %s", value)
         self._device.TrackingRate = value
 
     @property
@@ -405,5 +417,5 @@ class ASCOMTelescope(ASCOMDevice, Telescope):
 
     @UTCDate.setter
     def UTCDate(self, value):
-        logger.debug(f"ASCOMTelescope.UTCDate set to {value}")
+        logger.debug("ASCOMTelescope.UTCDate set to %s", value)
         self._device.UTCDate = value
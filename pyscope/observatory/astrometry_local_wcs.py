@@ -0,0 +1,112 @@
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+
+import astropy.io.fits as pyfits
+from astropy import coordinates as coord
+
+from .observatory_exception import ObservatoryException
+from .wcs import WCS
+
+logger = logging.getLogger(__name__)
+
+
+class AstrometryLocalWCS(WCS):
+    def __init__(self, solve_field="solve-field", search_radius=2):
+        """Plate solves images with a local astrometry.net installation
+
+        Parameters
+        ----------
+        solve_field : str, optional
+            Name or path of the astrometry.net ``solve-field`` executable.
+        search_radius : float, optional
+            Radius in degrees around the pointing hint to search, by default 2.
+        """
+        logger.debug("AstrometryLocalWCS.__init__(%s, %s)", solve_field, search_radius)
+
+        self._solve_field = shutil.which(solve_field)
+        if self._solve_field is None:
+            raise ObservatoryException(
+                "Could not find the astrometry.net solve-field executable %s"
+                % solve_field
+            )
+        self._search_radius = search_radius
+
+    def Solve(
+        self,
+        filepath,
+        ra_key="RA",
+        dec_key="DEC",
+        ra=None,
+        dec=None,
+        ra_dec_units=("hour", "deg"),
+        solve_timeout=60,
+        scale_units="arcsecperpix",
+        scale_type="ev",
+        scale_est=None,
+        scale_err=None,
+        parity=None,
+        crpix_center=False,
+        **kwargs,
+    ):
+        logger.debug("AstrometryLocalWCS.Solve(%s, %s) called", filepath, kwargs)
+
+        with pyfits.open(filepath) as hdul:
+            header = hdul[0].header
+            if ra is None and dec is None and ra_key in header and dec_key in header:
+                ra, dec = header[ra_key], header[dec_key]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            args = [
+                self._solve_field,
+                filepath,
+                "--dir",
+                tmpdir,
+                "--overwrite",
+                "--no-plots",
+                "--new-fits",
+                "none",
+                "--cpulimit",
+                str(solve_timeout),
+            ]
+            if ra is not None and dec is not None:
+                obj = coord.SkyCoord(ra, dec, unit=ra_dec_units, frame="icrs")
+                args += ["--ra", str(obj.ra.deg), "--dec", str(obj.dec.deg)]
+                args += ["--radius", str(self._search_radius)]
+            if scale_est is not None:
+                if scale_type == "ev":
+                    if scale_err is None:
+                        scale_err = 0.1 * scale_est
+                    low, high = scale_est - scale_err, scale_est + scale_err
+                else:
+                    low, high = scale_est, scale_err
+                args += ["--scale-units", scale_units]
+                args += ["--scale-low", str(low), "--scale-high", str(high)]
+            if parity in (0, 1):
+                args += ["--parity", ("pos", "neg")[parity]]
+            if crpix_center:
+                args.append("--crpix-center")
+
+            try:
+                subprocess.run(
+                    args, capture_output=True, timeout=solve_timeout + 10, check=False
+                )
+            except subprocess.TimeoutExpired:
+                logger.warning("solve-field timed out on %s", filepath)
+                return False
+
+            base = os.path.splitext(os.path.basename(filepath))[0]
+            wcs_path = os.path.join(tmpdir, base + ".wcs")
+            if not os.path.exists(os.path.join(tmpdir, base + ".solved")):
+                return False
+            wcs_header = pyfits.getheader(wcs_path)
+
+        # The .wcs file is a header-only FITS file, so its SIMPLE, BITPIX and
+        # NAXIS cards must not replace the image's
+        wcs_header.strip()
+
+        with pyfits.open(filepath, mode="update") as hdul:
+            hdul[0].header.update(wcs_header)
+        return True
@@ -10,7 +10,7 @@ logger = logging.getLogger(__name__)
 
 class AstrometryNetWCS(WCS):
     def __init__(self):
-        logger.debug(f"AstrometryNetWCS.__init__() called")
+        logger.debug("AstrometryNetWCS.__init__() called")
 
         # Avoid documentation build failure by importing here
         from astroquery.astrometry_net import AstrometryNet
@@ -18,7 +18,7 @@ class AstrometryNetWCS(WCS):
         self._solver = AstrometryNet()
 
     def Solve(self, filepath, **kwargs):
-        logger.debug(f"AstrometryNetWCS.Solve({filepath}, {kwargs}) called")
+        logger.debug("AstrometryNetWCS.Solve(%s, %s) called", filepath, kwargs)
 
         try_again = True
         submission_id = None
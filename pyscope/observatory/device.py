@@ -4,6 +4,8 @@ from ._docstring_inheritee import _DocstringInheritee
 
 
 class Device(ABC, metaclass=_DocstringInheritee):
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, *args, **kwargs):
         pass
@@ -157,7 +157,7 @@ class HTMLObservingConditions(ObservingConditions):
         self.Refresh()
 
     def Refresh(self):
-        logger.debug(f"HTMLObservingConditions.Refresh() called")
+        logger.debug("HTMLObservingConditions.Refresh() called")
         stream = urllib.request.urlopen(self._url)
         lines = stream.readlines()
 
@@ -304,7 +304,7 @@ class HTMLObservingConditions(ObservingConditions):
 
     @AveragePeriod.setter
     def AveragePeriod(self, value):
-        logger.debug(f"HTMLObservingConditions.AveragePeriod({value}) called")
+        logger.debug("HTMLObservingConditions.AveragePeriod(%s) called", value)
         return
 
     @property
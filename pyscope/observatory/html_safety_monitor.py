@@ -16,7 +16,7 @@ class HTMLSafetyMonitor(SafetyMonitor):
 
     @property
     def IsSafe(self):
-        logger.debug(f"""HTMLSafetyMonitor.IsSafe property called""")
+        logger.debug("HTMLSafetyMonitor.IsSafe property called")
         safe = False
         c = None
         # buffer = io.BytesIO()
@@ -20,7 +20,7 @@ class IPCoverCalibrator(CoverCalibrator):
         return self._send_packet(0)
 
     def CalibratorOn(self, Brightness):
-        logger.debug(f"CalibratorOn called with Brightness={Brightness}")
+        logger.debug("CalibratorOn called with Brightness=%s", Brightness)
         return self._send_packet(Brightness)
 
     def CloseCover(self):
@@ -56,7 +56,7 @@ class IPCoverCalibrator(CoverCalibrator):
         return 254
 
     def _send_packet(self, intensity):
-        logger.debug(f"_send_packet called with intensity={intensity}")
+        logger.debug("_send_packet called with intensity=%s", intensity)
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         s.connect((self.tcp_ip, self.tcp_port))
 
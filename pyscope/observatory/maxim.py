@@ -41,7 +41,7 @@ class Maxim(Device):
 
     @Connected.setter
     def Connected(self, value):
-        logger.debug(f"Connected setter called with value={value}")
+        logger.debug("Connected setter called with value=%s", value)
         self.camera.Connected = value
 
     @property
@@ -64,6 +64,16 @@ class Maxim(Device):
         logger.debug("Maxim.camera called")
         return self._camera
 
+    @property
+    def filter_wheel(self):
+        logger.debug("Maxim.filter_wheel called")
+        return self._filter_wheel
+
+    @property
+    def wcs(self):
+        logger.debug("Maxim.wcs called")
+        return self._wcs
+
 
 class _MaximAutofocus(Autofocus):
     def __init__(self, maxim):
@@ -71,7 +81,7 @@ class _MaximAutofocus(Autofocus):
         self.maxim = maxim
 
     def Run(self, exposure=10):
-        logger.debug(f"Run called with exposure={exposure}")
+        logger.debug("Run called with exposure=%s", exposure)
         self.maxim.Autofocus(exposure)
 
         while self.maxim.AutofocusStatus == -1:
@@ -103,7 +113,7 @@ class _MaximCamera(Camera):
 
     @Connected.setter
     def Connected(self, value):
-        logger.debug(f"Connected setter called with value={value}")
+        logger.debug("Connected setter called with value=%s", value)
         self._com_object.LinkEnabled = value
 
     @property
@@ -117,12 +127,12 @@ class _MaximCamera(Camera):
 
     def PulseGuide(self, Direction, Duration):
         logger.debug(
-            f"PulseGuide called with Direction={Direction}, Duration={Duration}"
+            "PulseGuide called with Direction=%s, Duration=%s", Direction, Duration
         )
         raise NotImplementedError
 
     def StartExposure(self, Duration, Light):
-        logger.debug(f"StartExposure called with Duration={Duration}, Light={Light}")
+        logger.debug("StartExposure called with Duration=%s, Light=%s", Duration, Light)
         self._last_exposure_duration = Duration
         self._last_exposure_start_time = time.time()
         self._com_object.Expose(Duration, Light)
@@ -148,7 +158,7 @@ class _MaximCamera(Camera):
 
     @BinX.setter
     def BinX(self, value):
-        logger.debug(f"BinX setter called with value={value}")
+        logger.debug("BinX setter called with value=%s", value)
         self._com_object.BinX = value
 
     @property
@@ -158,7 +168,7 @@ class _MaximCamera(Camera):
 
     @BinY.setter
     def BinY(self, value):
-        logger.debug(f"BinY setter called with value={value}")
+        logger.debug("BinY setter called with value=%s", value)
         self._com_object.BinY = value
 
     @property
@@ -223,7 +233,7 @@ class _MaximCamera(Camera):
 
     @CoolerOn.setter
     def CoolerOn(self, value):
-        logger.debug(f"CoolerOn setter called with value={value}")
+        logger.debug("CoolerOn setter called with value=%s", value)
         self._com_object.CoolerOn = value
 
     @property
@@ -258,7 +268,7 @@ class _MaximCamera(Camera):
 
     @FastReadout.setter
     def FastReadout(self, value):
-        logger.debug(f"FastReadout setter called with value={value}")
+        logger.debug("FastReadout setter called with value=%s", value)
         raise DeprecationWarning
 
     @property
@@ -273,7 +283,7 @@ class _MaximCamera(Camera):
 
     @Gain.setter
     def Gain(self, value):
-        logger.debug(f"Gain setter called with value={value}")
+        logger.debug("Gain setter called with value=%s", value)
         self._com_object.Speed = value
 
     @property
@@ -353,7 +363,7 @@ class _MaximCamera(Camera):
 
     @NumX.setter
     def NumX(self, value):
-        logger.debug(f"NumX setter called with value={value}")
+        logger.debug("NumX setter called with value=%s", value)
         self._com_object.NumX = value
 
     @property
@@ -363,7 +373,7 @@ class _MaximCamera(Camera):
 
     @NumY.setter
     def NumY(self, value):
-        logger.debug(f"NumY setter called with value={value}")
+        logger.debug("NumY setter called with value=%s", value)
         self._com_object.NumY = value
 
     @property
@@ -373,7 +383,7 @@ class _MaximCamera(Camera):
 
     @Offset.setter
     def Offset(self, value):
-        logger.debug(f"Offset setter called with value={value}")
+        logger.debug("Offset setter called with value=%s", value)
         raise NotImplementedError
 
     @property
@@ -413,7 +423,7 @@ class _MaximCamera(Camera):
 
     @ReadoutMode.setter
     def ReadoutMode(self, value):
-        logger.debug(f"ReadoutMode setter called with value={value}")
+        logger.debug("ReadoutMode setter called with value=%s", value)
         self._com_object.ReadoutMode = value
 
     @property
@@ -438,7 +448,7 @@ class _MaximCamera(Camera):
 
     @SetCCDTemperature.setter
     def SetCCDTemperature(self, value):
-        logger.debug(f"SetCCDTemperature setter called with value={value}")
+        logger.debug("SetCCDTemperature setter called with value=%s", value)
         self._com_object.TemperatureSetpoint = value
 
     @property
@@ -448,7 +458,7 @@ class _MaximCamera(Camera):
 
     @StartX.setter
     def StartX(self, value):
-        logger.debug(f"StartX setter called with value={value}")
+        logger.debug("StartX setter called with value=%s", value)
         self._com_object.StartX = value
 
     @property
@@ -458,7 +468,7 @@ class _MaximCamera(Camera):
 
     @StartY.setter
     def StartY(self, value):
-        logger.debug(f"StartY setter called with value={value}")
+        logger.debug("StartY setter called with value=%s", value)
         self._com_object.StartY = value
 
     @property
@@ -468,7 +478,7 @@ class _MaximCamera(Camera):
 
     @SubExposureDuration.setter
     def SubExposureDuration(self, value):
-        logger.debug(f"SubExposureDuration setter called with value={value}")
+        logger.debug("SubExposureDuration setter called with value=%s", value)
         raise NotImplementedError
 
 
@@ -484,7 +494,7 @@ class _MaximFilterWheel(FilterWheel):
 
     @Connected.setter
     def Connected(self, value):
-        logger.debug(f"Connected setter called with value={value}")
+        logger.debug("Connected setter called with value=%s", value)
         self.maxim_camera.Connected = value
 
     @property
@@ -509,7 +519,7 @@ class _MaximFilterWheel(FilterWheel):
 
     @Position.setter
     def Position(self, value):
-        logger.debug(f"Position setter called with value={value}")
+        logger.debug("Position setter called with value=%s", value)
         self.maxim_camera.Filter = value
 
 
@@ -520,7 +530,10 @@ class _MaximPinpointWCS(WCS):
 
     def Solve(self, ra=None, dec=None, scale_est=None, *args, **kwargs):
         logger.debug(
-            f"_MaximPinpointWCS.Solve called with ra={ra}, dec={dec}, and scale_est={scale_est}"
+            "_MaximPinpointWCS.Solve called with ra=%s, dec=%s, and scale_est=%s",
+            ra,
+            dec,
+            scale_est,
         )
         self.maxim_camera.document.PinpointSolve(ra, dec, scale_est, scale_est)
 
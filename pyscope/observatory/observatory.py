@@ -1,38 +1,629 @@
+import collections
 import configparser
+import datetime
+import functools
 import importlib
+import json
 import logging
+import math
+import os
+import platform
+import re
 import shutil
 import sys
 import tempfile
 import threading
 import time
+import weakref
 from ast import literal_eval
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from types import MappingProxyType
 
+import erfa
 import numpy as np
 from astropy import coordinates as coord
 from astropy import time as astrotime
 from astropy import units as u
-from astropy.io import fits
-from astroquery.mpc import MPC
 
-from .. import observatory
 from ..utils import (
     _args_to_config,
+    _fast_ini_parse,
     _get_image_source_catalog,
     _kwargs_to_config,
+    _write_fits,
     airmass,
 )
 from . import ObservatoryException
+from .ascom_device import ASCOMDevice
 from .device import Device
 
 logger = logging.getLogger(__name__)
 
+# Config sections whose keys are read as Observatory keyword arguments
+_SECTIONS = (
+    "site",
+    "camera",
+    "cover_calibrator",
+    "dome",
+    "filter_wheel",
+    "focuser",
+    "observing_conditions",
+    "rotator",
+    "safety_monitor",
+    "switch",
+    "telescope",
+    "autofocus",
+    "wcs",
+    "scheduling",
+)
+
+# key:value pairs in *_kwargs config values; the value may contain colons
+_KV_RE = re.compile(r"([^:\s]+):(\S+)")
+
+# Driver names that select MaxIm DL
+_MAXIM_ALIASES = frozenset({"maxim", "maximdl"})
+
+# Device roles that MaxIm DL can provide, mapped to its attribute for each
+_MAXIM_ROLES = {
+    "camera": "camera",
+    "filter_wheel": "filter_wheel",
+    "autofocus": "autofocus",
+    "wcs": "wcs",
+}
+
+# Config keys of the first entries of a multi-device section
+_DRIVER_KEYS = tuple("driver_%i" % i for i in range(16))
+
+# Keyword arguments passed to every WCS solver, apart from the pixel scale
+_WCS_SOLVE_KWARGS = {
+    "ra_key": "TELRAIC",
+    "dec_key": "TELDECIC",
+    "ra_dec_units": ("hour", "deg"),
+    "solve_timeout": 60,
+    "scale_units": "arcsecperpix",
+    "scale_type": "ev",
+    "parity": 1,
+    "crpix_center": True,
+}
+
+# Frames for the ASCOM EquatorialSystem values, built from an obstime and an
+# EarthLocation. Unknown values fall back to topocentric (1).
+_EQUATORIAL_FRAMES = {
+    1: lambda t, location: coord.TETE(obstime=t, location=location),
+    2: lambda t, location: "icrs",
+    3: lambda t, location: coord.FK5(equinox="J2050"),
+    4: lambda t, location: coord.FK4(equinox="B1950"),
+}
+# ASCOM EquatorialSystem and AlignmentMode names, indexed by value
+_EQUATORIAL_SYSTEMS = ("equOther", "equTopocentric", "equJ2000", "equJ2050", "equB1950")
+_ALIGNMENT_MODES = ("AltAz", "Polar", "GermanPolar")
+# Indexed by SideOfPier, where pierUnknown is -1
+_PIER_SIDES = ("pierEast", "pierWest", "pierUnknown")
+
+_ARCSEC_PER_RAD = 206264.80624709636
+
+# Observatory properties read from keyword arguments and the config file, in
+# the order they are set
+_KWARG_ATTRIBUTES = (
+    "site_name",
+    "instrument_name",
+    "instrument_description",
+    "latitude",
+    "longitude",
+    "elevation",
+    "diameter",
+    "focal_length",
+    "cooler_setpoint",
+    "cooler_tolerance",
+    "max_dimension",
+    "cover_calibrator_alt",
+    "cover_calibrator_az",
+    "filters",
+    "filter_focus_offsets",
+    "focuser_max_error",
+    "rotator_reverse",
+    "rotator_min_angle",
+    "rotator_max_angle",
+    "min_altitude",
+    "settle_time",
+    "slew_rate",
+)
+
+# Header cards for driver properties that do not change while a device is
+# connected, as (keyword, property, comment). They are read once per connection.
+_CAMERA_STATIC_INFO = (
+    ("CAMNAME", "Name", "Name of camera"),
+    ("CAMERA", "Name", "Name of camera"),
+    ("CAMDRVER", "DriverVersion", "Camera driver version"),
+    ("CAMDRV", "DriverInfo", "Camera driver info"),
+    ("CAMINTF", "InterfaceVersion", "Camera interface version"),
+    ("CAMDESC", "Description", "Camera description"),
+    ("SENSOR", "SensorName", "Name of sensor"),
+    ("WIDTH", "CameraXSize", "Width of sensor in pixels"),
+    ("HEIGHT", "CameraYSize", "Height of sensor in pixels"),
+    ("XPIXSIZE", "PixelSizeX", "Pixel width in microns"),
+    ("YPIXSIZE", "PixelSizeY", "Pixel height in microns"),
+    ("MECHSHTR", "HasShutter", "Whether a camera mechanical shutter is present"),
+    ("ISSHUTTR", "HasShutter", "Whether a camera mechanical shutter is present"),
+    ("MINEXP", "ExposureMin", "Minimum exposure time [seconds]"),
+    ("MAXEXP", "ExposureMax", "Maximum exposure time [seconds]"),
+    ("EXPRESL", "ExposureResolution", "Exposure time resolution [seconds]"),
+    ("MAXBINSX", "MaxBinX", "Maximum binning factor in width"),
+    ("MAXBINSY", "MaxBinY", "Maximum binning factor in height"),
+    ("CANASBIN", "CanAsymmetricBin", "Can asymmetric bin"),
+    ("CANABRT", "CanAbortExposure", "Can abort exposures"),
+    ("CANSTP", "CanStopExposure", "Can stop exposures"),
+    ("CANCOOLP", "CanGetCoolerPower", "Can get cooler power"),
+    ("CANSETTE", "CanSetCCDTemperature", "Can camera set temperature"),
+    ("CANPULSE", "CanPulseGuide", "Can camera pulse guide"),
+    ("MAXADU", "MaxADU", "Camera maximum ADU value possible"),
+    ("CANFASTR", "CanFastReadout", "Can camera fast readout"),
+    ("CAMSUPAC", "SupportedActions", "Camera supported actions"),
+)
+_COVER_CALIBRATOR_STATIC_INFO = (
+    ("CCNAME", "Name", "Cover calibrator name"),
+    ("COVCAL", "Name", "Cover calibrator name"),
+    ("CCDRVER", "DriverVersion", "Cover calibrator driver version"),
+    ("CCDRV", "DriverInfo", "Cover calibrator driver info"),
+    ("CCINTF", "InterfaceVersion", "Cover calibrator interface version"),
+    ("CCDESC", "Description", "Cover calibrator description"),
+    ("MAXBRITE", "MaxBrightness", "Cover calibrator maximum possible brightness"),
+    ("CCSUPAC", "SupportedActions", "Cover calibrator supported actions"),
+)
+_DOME_STATIC_INFO = (
+    ("DOMENAME", "Name", "Dome name"),
+    ("DOMDRVER", "DriverVersion", "Dome driver version"),
+    ("DOMEDRV", "DriverInfo", "Dome driver info"),
+    ("DOMEINTF", "InterfaceVersion", "Dome interface version"),
+    ("DOMEDESC", "Description", "Dome description"),
+    ("DOMECALT", "CanSetAltitude", "Can dome set altitude"),
+    ("DOMECAZ", "CanSetAzimuth", "Can dome set azimuth"),
+    ("DOMECSHT", "CanSetShutter", "Can dome set shutter"),
+    ("DOMECSLV", "CanSlave", "Can dome slave to mount"),
+    ("DCANSYNC", "CanSyncAzimuth", "Can dome sync to azimuth value"),
+    ("DCANHOME", "CanFindHome", "Can dome home"),
+    ("DCANPARK", "CanPark", "Can dome park"),
+    ("DCANSPRK", "CanSetPark", "Can dome set park"),
+    ("DOMSUPAC", "SupportedActions", "Dome supported actions"),
+)
+_FILTER_WHEEL_STATIC_INFO = (
+    ("FWDEVNAM", "Name", "Filter wheel device name"),
+    ("FWDRVER", "DriverVersion", "Filter wheel driver version"),
+    ("FWDRV", "DriverInfo", "Filter wheel driver info"),
+    ("FWINTF", "InterfaceVersion", "Filter wheel interface version"),
+    ("FWDESC", "Description", "Filter wheel description"),
+    ("FWALLNAM", "Names", "Filter wheel names"),
+    ("FWALLOFF", "FocusOffsets", "Filter wheel focus offsets"),
+    ("FWSUPAC", "SupportedActions", "Filter wheel supported actions"),
+)
+_FOCUSER_STATIC_INFO = (
+    ("FOCNAME", "Name", "Focuser name"),
+    ("FOCDRVER", "DriverVersion", "Focuser driver version"),
+    ("FOCDRV", "DriverInfo", "Focuser driver info"),
+    ("FOCINTF", "InterfaceVersion", "Focuser interface version"),
+    ("FOCDESC", "Description", "Focuser description"),
+    ("FOCABSOL", "Absolute", "Can focuser move to absolute position"),
+    ("FOCMAXIN", "MaxIncrement", "Focuser maximum increment"),
+    ("FOCMAXST", "MaxStep", "Focuser maximum step"),
+    ("FOCTEMPC", "TempCompAvailable", "Focuser temperature compensation available"),
+)
+_OBSERVING_CONDITIONS_STATIC_INFO = (
+    ("WXNAME", "Name", "Observing conditions name"),
+    ("WXDRVER", "DriverVersion", "Observing conditions driver version"),
+    ("WXDRIV", "DriverInfo", "Observing conditions driver info"),
+    ("WXINTF", "InterfaceVersion", "Observing conditions interface version"),
+    ("WXDESC", "Description", "Observing conditions description"),
+)
+_ROTATOR_STATIC_INFO = (
+    ("ROTNAME", "Name", "Rotator name"),
+    ("ROTDRVER", "DriverVersion", "Rotator driver version"),
+    ("ROTDRV", "DriverInfo", "Rotator driver name"),
+    ("ROTINTFC", "InterfaceVersion", "Rotator interface version"),
+    ("ROTDESC", "Description", "Rotator description"),
+    ("ROTCANRV", "CanReverse", "Can rotator reverse"),
+    ("ROTSUPAC", "SupportedActions", "Rotator supported actions"),
+)
+# Keywords are formatted with the index of each safety monitor
+_SAFETY_MONITOR_STATIC_INFO = (
+    ("SM%iNAME", "Name", "Safety monitor name"),
+    ("SM%iDRVER", "DriverVersion", "Safety monitor driver version"),
+    ("SM%iDRV", "DriverInfo", "Safety monitor driver name"),
+    ("SM%iINTF", "InterfaceVersion", "Safety monitor interface version"),
+    ("SM%iDESC", "Description", "Safety monitor description"),
+    ("SM%iSUPAC", "SupportedActions", "Safety monitor supported actions"),
+)
+_TELESCOPE_STATIC_INFO = (
+    ("TELNAME", "Name", "Telescope name"),
+    ("TELDRVER", "DriverVersion", "Telescope driver version"),
+    ("TELDRV", "DriverInfo", "Telescope driver name"),
+    ("TELINTF", "InterfaceVersion", "Telescope interface version"),
+    ("TELDESC", "Description", "Telescope description"),
+    ("TELCANHM", "CanFindHome", "Can telescope find home"),
+    ("TELCANPA", "CanPark", "Can telescope park"),
+    ("TELCANUN", "CanUnpark", "Can telescope unpark"),
+    ("TELCANPP", "CanSetPark", "Can telescope set park position"),
+    ("TELCANPG", "CanPulseGuide", "Can telescope pulse guide"),
+    ("TELCANGR", "CanSetGuideRates", "Can telescope set guide rates"),
+    ("TELCANTR", "CanSetTracking", "Can telescope set tracking"),
+    ("TELCANSR", "CanSetRightAscensionRate", "Can telescope set RA offset rate"),
+    ("TELCANSD", "CanSetDeclinationRate", "Can telescope set DEC offset rate"),
+    ("TELCANSP", "CanSetPierSide", "Can telescope set pier side"),
+    ("TELCANSL", "CanSlew", "Can telescope slew to equatorial coordinates"),
+    ("TELCNSLA", "CanSlewAsync", "Can telescope slew asynchronously"),
+    ("TELCANSF", "CanSlewAltAz", "Can telescope slew to alt-azimuth coordinates"),
+    (
+        "TELCNSFA",
+        "CanSlewAltAzAsync",
+        "Can telescope slew to alt-azimuth coordinates asynchronously",
+    ),
+    ("TELCANSY", "CanSync", "Can telescope sync to equatorial coordinates"),
+    ("TELCNSYA", "CanSyncAltAz", "Can telescope sync to alt-azimuth coordinates"),
+    ("TELTRCKS", "TrackingRates", "Telescope tracking rates"),
+    ("TELSUPAC", "SupportedActions", "Telescope supported actions"),
+)
+# Static telescope properties that drivers may not implement
+_TELESCOPE_OPTIONAL_STATIC_INFO = (
+    ("TELAPAR", "ApertureArea", "Telescope aperture area [m^2]"),
+    ("TELDIAM", "ApertureDiameter", "Telescope aperture diameter [m]"),
+    ("TELFOCL", "FocalLength", "Telescope focal length [m]"),
+    ("TELELEV", "SiteElevation", "Telescope elevation [degrees]"),
+    ("TELLAT", "SiteLatitude", "Telescope latitude [degrees]"),
+    ("TELLONG", "SiteLongitude", "Telescope longitude [degrees]"),
+)
+# Header cards read on every call, as (keyword, property, comment). Cards for
+# properties the driver does not implement are left empty.
+_ROTATOR_DYNAMIC_INFO = (
+    ("ROTPOS", "Position", "Rotator position"),
+    ("ROTMECHP", "MechanicalPosition", "Rotator mechanical position"),
+    ("ROTTARGP", "TargetPosition", "Rotator target position"),
+    ("ROTMOV", "IsMoving", "Rotator moving"),
+    ("ROTREVSE", "Reverse", "Rotator reverse"),
+    ("ROTSTEP", "StepSize", "Rotator step size [degrees]"),
+)
+# (sensor, description, value keyword, last updated keyword, description keyword)
+_OBSERVING_CONDITIONS_SENSORS = (
+    ("CloudCover", "cloud cover", "WXCLD", "WXCLDUPD", "WXCLDD"),
+    ("DewPoint", "dew point", "WXDEW", "WXDEWUPD", "WXDEWD"),
+    ("Humidity", "humidity", "WXHUM", "WXHUMUPD", "WXHUMD"),
+    ("Pressure", "pressure", "WXPRES", "WXPREUPD", "WXPRESD"),
+    ("RainRate", "rain rate", "WXRAIN", "WXRAIUPD", "WXRAIND"),
+    ("SkyBrightness", "sky brightness", "WXSKY", "WXSKYUPD", "WXSKYD"),
+    ("SkyQuality", "sky quality", "WXSKYQ", "WXSKYQUP", "WXSKYQD"),
+    ("SkyTemperature", "sky temperature", "WXSKYTMP", "WXSKTUPD", "WXSKTD"),
+    ("Seeing", "seeing", "WXFWHM", "WXFWHUP", "WXFWHMD"),
+    ("Temperature", "temperature", "WXTEMP", "WXTEMUPD", "WXTEMPD"),
+    ("WindSpeed", "wind speed", "WXWIND", "WXWINUPD", "WXWINDD"),
+    ("WindDirection", "wind direction", "WXWINDIR", "WXWDIRUP", "WXWDIRD"),
+    ("WindGust", "wind gust", "WXWDGST", "WXWGDUPD", "WXWGDSTD"),
+)
+_OBSERVING_CONDITIONS_INFO = {
+    key: (None, "Observing conditions %s%s" % (label, suffix))
+    for _, label, *keys in _OBSERVING_CONDITIONS_SENSORS
+    for key, suffix in zip(keys, ("", " last updated", " sensor description"))
+}
+# Seconds to wait for the observing conditions sensors before giving up
+_SENSOR_TIMEOUT = 5
+
+# threads_info cards for each combination of running threads, built on first use
+_THREADS_INFO = {}
+
+_CAMERA_STATES = ("Idle", "Waiting", "Exposing", "Reading", "Download", "Error")
+_SENSOR_TYPES = ("Monochrome", "Color", "RGGB", "CMYG", "CMYG2", "LRGB")
+
+# Header cards that change between reads, as [value, comment] lists. Each
+# *_info call copies its template and fills in the values it can read.
+_CAMERA_INFO = {
+    "CAMCON": [True, "Camera connection"],
+    "CAMREADY": [None, "Image ready"],
+    "CAMSTATE": [None, "Camera state"],
+    "PCNTCOMP": [None, "Function percent completed"],
+    "DATE-OBS": [None, "YYYY-MM-DDThh:mm:ss observation start [UT]"],
+    "JD": [None, "Julian date"],
+    "MJD": [None, "Modified Julian date"],
+    "EXPTIME": [None, "Exposure time [seconds]"],
+    "EXPOSURE": [None, "Exposure time [seconds]"],
+    "SUBEXP": [None, "Subexposure time [seconds]"],
+    "XBINNING": [None, "Image binning factor in width"],
+    "YBINNING": [None, "Image binning factor in height"],
+    "XORGSUBF": [None, "Subframe X position"],
+    "YORGSUBF": [None, "Subframe Y position"],
+    "XPOSSUBF": [None, "Subframe X dimension"],
+    "YPOSSUBF": [None, "Subframe Y dimension"],
+    "READOUT": [None, "Image readout mode"],
+    "READOUTM": [None, "Image readout mode"],
+    "FASTREAD": [None, "Fast readout mode"],
+    "GAIN": [None, "Electronic gain"],
+    "OFFSET": [None, "Image offset"],
+    "PULSGUID": [None, "Pulse guiding"],
+    "SENSTYP": [None, "Sensor type"],
+    "BAYERPAT": [None, "Bayer color pattern"],
+    "BAYOFFX": [None, "Bayer X offset"],
+    "BAYOFFY": [None, "Bayer Y offset"],
+    "HSINKT": [None, "Heat sink temperature [C]"],
+    "COOLERON": [None, "Whether the cooler is on"],
+    "COOLPOWR": [None, "Cooler power in percent"],
+    "SET-TEMP": [None, "Camera temperature setpoint [C]"],
+    "CCD-TEMP": [None, "Camera temperature [C]"],
+    "CMOS-TMP": [None, "Camera temperature [C]"],
+    "FULLWELL": [None, "Full well capacity [e-]"],
+    "E-ADU": [None, "Gain [e- per ADU]"],
+    "EGAIN": [None, "Electronic gain"],
+    "READMDS": [None, "Possible readout modes"],
+    "GAINS": [None, "Possible electronic gains"],
+    "GAINMIN": [None, "Minimum possible electronic gain"],
+    "GAINMAX": [None, "Maximum possible electronic gain"],
+    "OFFSETS": [None, "Possible offsets"],
+    "OFFSETMN": [None, "Minimum possible offset"],
+    "OFFSETMX": [None, "Maximum possible offset"],
+}
+_COVER_CALIBRATOR_INFO = {
+    "CCALCONN": [True, "Cover calibrator connected"],
+    "CALSTATE": [None, "Calibrator state"],
+    "COVSTATE": [None, "Cover state"],
+    "BRIGHT": [None, "Brightness of cover calibrator"],
+}
+_DOME_INFO = {
+    "DOMECONN": [True, "Dome connected"],
+    "DOMEALT": [None, "Dome altitude [deg]"],
+    "DOMEAZ": [None, "Dome azimuth [deg]"],
+    "DOMESHUT": [None, "Dome shutter status"],
+    "DOMESLEW": [None, "Dome slew status"],
+    "DOMESLAV": [None, "Dome slave status"],
+    "DOMEHOME": [None, "Dome home status"],
+    "DOMEPARK": [None, "Dome park status"],
+}
+_TELESCOPE_INFO = {
+    "TELCONN": [True, "Telescope connected"],
+    "TELHOME": [None, "Is telescope at home position"],
+    "TELPARK": [None, "Is telescope at park position"],
+    "TELALT": [None, "Telescope altitude [degrees]"],
+    "TELAZ": [
+        None,
+        "Telescope azimuth North-referenced positive East (clockwise) [degrees]",
+    ],
+    "TELRA": [None, "Telescope right ascension in TELEQSYS coordinate frame [hours]"],
+    "TELDEC": [None, "Telescope declination in TELEQSYS coordinate frame [degrees]"],
+    "TELRAIC": [None, "Telescope right ascension in ICRS coordinate frame [hours]"],
+    "TELDECIC": [None, "Telescope declination in ICRS coordinate frame [degrees]"],
+    "TARGRA": [
+        None,
+        "Telescope target right ascension in TELEQSYS coordinate frame [hours]",
+    ],
+    "TARGDEC": [
+        None,
+        "Telescope target declination in TELEQSYS coordinate frame [degrees]",
+    ],
+    "OBJCTALT": [None, "Object altitude [degrees]"],
+    "OBJCTAZ": [
+        None,
+        "Object azimuth North-referenced positive East (clockwise) [degrees]",
+    ],
+    "OBJCTHA": [None, "Object hour angle [hours]"],
+    "AIRMASS": [None, "Airmass"],
+    "MOONANGL": [None, "Angle between object and moon [degrees]"],
+    "MOONPHAS": [None, "Moon phase [percent]"],
+    "TELSLEW": [None, "Is telescope slewing"],
+    "TELSETT": [None, "Telescope settling time [seconds]"],
+    "TELPIER": [None, "Telescope pier side"],
+    "TELTRACK": [None, "Is telescope tracking"],
+    "TELTRKRT": [None, "Telescope tracking rate (sidereal)"],
+    "TELOFFRA": [None, "Telescope RA tracking offset [seconds per sidereal second]"],
+    "TELOFFDC": [
+        None,
+        "Telescope DEC tracking offset [arcseconds per sidereal second]",
+    ],
+    "TELPULSE": [None, "Is telescope pulse guiding"],
+    "TELGUIDR": [None, "Telescope pulse guiding RA rate [degrees/sec]"],
+    "TELGUIDD": [None, "Telescope pulse guiding DEC rate [arcseconds/sec]"],
+    "TELDOREF": [None, "Does telescope do refraction"],
+    "TELLST": [None, "Telescope local sidereal time [hours]"],
+    "TELUT": [None, "Telescope UTC date"],
+}
+
+# Optional driver properties, as (property, keywords). Drivers raise when they
+# do not implement one, and its cards are then left empty.
+_CAMERA_OPTIONAL_INFO = (
+    ("PercentCompleted", ("PCNTCOMP",)),
+    ("ExposureTime", ("EXPTIME", "EXPOSURE")),
+    ("SubExposureDuration", ("SUBEXP",)),
+    ("CoolerOn", ("COOLERON",)),
+    ("CCDTemperature", ("CCD-TEMP",)),
+    ("CMOSTemperature", ("CMOS-TMP",)),
+)
+_COVER_CALIBRATOR_OPTIONAL_INFO = (("Brightness", ("BRIGHT",)),)
+_DOME_OPTIONAL_INFO = (
+    ("Altitude", ("DOMEALT",)),
+    ("Azimuth", ("DOMEAZ",)),
+    ("ShutterStatus", ("DOMESHUT",)),
+    ("Slaved", ("DOMESLAV",)),
+    ("AtHome", ("DOMEHOME",)),
+    ("AtPark", ("DOMEPARK",)),
+)
+_TELESCOPE_OPTIONAL_INFO = (
+    ("Altitude", ("TELALT",)),
+    ("Azimuth", ("TELAZ",)),
+    ("TargetRightAscension", ("TARGRA",)),
+    ("TargetDeclination", ("TARGDEC",)),
+    ("Slewing", ("TELSLEW",)),
+    ("SlewSettleTime", ("TELSETT",)),
+    ("Tracking", ("TELTRACK",)),
+    ("RightAscensionRate", ("TELOFFRA",)),
+    ("DeclinationRate", ("TELOFFDC",)),
+    ("IsPulseGuiding", ("TELPULSE",)),
+    ("GuideRateRightAscension", ("TELGUIDR",)),
+    ("GuideRateDeclination", ("TELGUIDD",)),
+    ("DoesRefraction", ("TELDOREF",)),
+    ("UTCDate", ("TELUT",)),
+)
+
+# Driver classes that already passed _check_class_inheritance, mapped to the
+# names of the abstract classes they were checked against
+_checked_classes = weakref.WeakKeyDictionary()
+
+# Driver classes loaded from source files, keyed by (filepath, driver_name)
+_driver_classes = {}
+
+# Number of recent calls kept for each info property's timings
+_TIMING_SAMPLES = 256
+
+
+def _timed(func):
+    """Records how long each call to an info property takes"""
+
+    @functools.wraps(func)
+    def wrapper(self):
+        start = time.perf_counter_ns()
+        try:
+            return func(self)
+        finally:
+            self._info_timings[func.__name__].append(time.perf_counter_ns() - start)
+
+    return wrapper
+
+
+@dataclass(frozen=True, slots=True)
+class _DeviceSpec:
+    """How a device role is read from the config and from keyword arguments"""
+
+    section: str
+    class_name: str
+    uses_ascom: bool = True
+    multi: bool = False
+    required: bool = False
+    default: str | None = None
+
 
 class Observatory:
+    _DEVICES = (
+        _DeviceSpec("camera", "Camera", required=True),
+        _DeviceSpec("cover_calibrator", "CoverCalibrator"),
+        _DeviceSpec("dome", "Dome"),
+        _DeviceSpec("filter_wheel", "FilterWheel"),
+        _DeviceSpec("focuser", "Focuser"),
+        _DeviceSpec("observing_conditions", "ObservingConditions"),
+        _DeviceSpec("rotator", "Rotator"),
+        _DeviceSpec("safety_monitor", "SafetyMonitor", multi=True),
+        _DeviceSpec("switch", "Switch", multi=True),
+        _DeviceSpec("telescope", "Telescope", required=True),
+        _DeviceSpec("autofocus", "Autofocus", uses_ascom=False),
+        _DeviceSpec(
+            "wcs", "WCS", uses_ascom=False, multi=True, default="AstrometryNetWCS"
+        ),
+    )
+
+    _args_to_config = _args_to_config
+    _kwargs_to_config = _kwargs_to_config
+
+    __slots__ = (
+        "_autofocus",
+        "_autofocus_args",
+        "_autofocus_driver",
+        "_autofocus_kwargs",
+        "_cache_hits",
+        "_cache_misses",
+        "_camera",
+        "_camera_args",
+        "_camera_ascom",
+        "_camera_driver",
+        "_camera_kwargs",
+        "_capabilities",
+        "_config",
+        "_cooler_setpoint",
+        "_cooler_tolerance",
+        "_cover_calibrator",
+        "_cover_calibrator_alt",
+        "_cover_calibrator_args",
+        "_cover_calibrator_ascom",
+        "_cover_calibrator_az",
+        "_cover_calibrator_driver",
+        "_cover_calibrator_kwargs",
+        "_current_focus_offset",
+        "_derotation_event",
+        "_derotation_thread",
+        "_diameter",
+        "_dome",
+        "_dome_args",
+        "_dome_ascom",
+        "_dome_driver",
+        "_dome_kwargs",
+        "_elevation",
+        "_equatorial_system",
+        "_filter_focus_offsets",
+        "_filter_wheel",
+        "_filter_wheel_args",
+        "_filter_wheel_ascom",
+        "_filter_wheel_driver",
+        "_filter_wheel_kwargs",
+        "_filters",
+        "_focal_length",
+        "_focuser",
+        "_focuser_args",
+        "_focuser_ascom",
+        "_focuser_driver",
+        "_focuser_kwargs",
+        "_focuser_max_error",
+        "_info_timings",
+        "_instrument_description",
+        "_instrument_name",
+        "_instrument_reconfiguration_times",
+        "_last_camera_shutter_status",
+        "_latitude",
+        "_longitude",
+        "_max_dimension",
+        "_maxim",
+        "_min_altitude",
+        "_observing_conditions",
+        "_observing_conditions_args",
+        "_observing_conditions_ascom",
+        "_observing_conditions_driver",
+        "_observing_conditions_event",
+        "_observing_conditions_kwargs",
+        "_observing_conditions_snapshot",
+        "_observing_conditions_thread",
+        "_observatory_location",
+        "_pixel_scale",
+        "_plate_scale",
+        "_rotator",
+        "_rotator_args",
+        "_rotator_ascom",
+        "_rotator_driver",
+        "_rotator_kwargs",
+        "_rotator_max_angle",
+        "_rotator_min_angle",
+        "_rotator_reverse",
+        "_safety_monitor",
+        "_safety_monitor_args",
+        "_safety_monitor_ascom",
+        "_safety_monitor_driver",
+        "_safety_monitor_event",
+        "_safety_monitor_kwargs",
+        "_safety_monitor_thread",
+        "_settle_time",
+        "_site_name",
+        "_slew_rate",
+        "_static_info",
+        "_switch",
+        "_switch_args",
+        "_switch_ascom",
+        "_switch_driver",
+        "_switch_kwargs",
+        "_telescope",
+        "_telescope_args",
+        "_telescope_ascom",
+        "_telescope_driver",
+        "_telescope_kwargs",
+        "_wcs",
+        "_wcs_args",
+        "_wcs_driver",
+        "_wcs_kwargs",
+        "instrument_reconfiguration_times",
+    )
+
     def __init__(self, config_path=None, **kwargs):
         logger.debug("Observatory.__init__() called")
-        logger.debug("config_path: %s" % config_path)
-        logger.debug("kwargs: %s" % kwargs)
+        logger.debug("config_path: %s", config_path)
+        logger.debug("kwargs: %s", kwargs)
 
         self._config = configparser.ConfigParser()
         self._config["site"] = {}
@@ -57,8 +648,18 @@ class Observatory:
         self._latitude = None
         self._longitude = None
         self._elevation = None
+        self._observatory_location = None
+        self._capabilities = {}
+        self._static_info = {}
+        self._cache_hits = collections.Counter()
+        self._cache_misses = collections.Counter()
+        self._info_timings = collections.defaultdict(
+            lambda: collections.deque(maxlen=_TIMING_SAMPLES)
+        )
         self._diameter = None
         self._focal_length = None
+        self._plate_scale = None
+        self._pixel_scale = None
 
         self._camera = None
         self._camera_args = None
@@ -108,6 +709,7 @@ class Observatory:
         self._switch_kwargs = None
 
         self._telescope = None
+        self._equatorial_system = None
         self._telescope_args = None
         self._telescope_kwargs = None
         self._min_altitude = 10
@@ -126,1111 +728,477 @@ class Observatory:
         self._maxim = None
 
         if config_path is not None:
-            logger.info("Using config file to initialize observatory: %s" % config_path)
-            try:
-                self._config.read(config_path)
-            except:
-                raise ObservatoryException(
-                    "Error parsing config file '%s'" % config_path
-                )
-
-            # Camera
-            self._camera_driver = self._config["camera"]["camera_driver"]
-            self._camera_ascom = self._config["camera"]["camera_ascom"]
-            self._camera_args = (
-                iter(
-                    literal_eval(v)
-                    for v in self._config.get(
-                        "camera", "camera_args", fallback=""
-                    ).split()
-                )
-                if self._config.get("camera", "camera_args", fallback=None)
-                not in (None, "")
-                else None
-            )
-            self._camera_kwargs = (
-                dict(
-                    (k, literal_eval(v))
-                    for k, v in (
-                        pair.split(":")
-                        for pair in self._config.get(
-                            "camera", "camera_kwargs", fallback=""
-                        ).split()
-                    )
-                )
-                if self._config.get("camera", "camera_kwargs", fallback=None)
-                not in (None, "")
-                else None
-            )
-            if self.camera_driver.lower() in ("maxim", "maximdl"):
-                logger.info("Using MaxIm DL as the camera driver")
-                self._maxim = _import_driver("Driver", driver_name="Maxim", ascom=False)
-                self._camera = self._maxim.camera
-            else:
-                self._camera = _import_driver(
-                    "Camera",
-                    driver_name=self.camera_driver,
-                    ascom=self.camera_ascom,
-                    args=self._camera_args,
-                    kwargs=self._camera_kwargs,
-                )
-
-            # Cover calibrator
-            self._cover_calibrator_driver = self._config.get(
-                "cover_calibrator", "cover_calibrator_driver", fallback=None
-            )
-            self._cover_calibrator_ascom = self._config.get(
-                "cover_calibrator", "cover_calibrator_ascom", fallback=None
-            )
-            self._cover_calibrator_args = (
-                iter(
-                    literal_eval(v)
-                    for v in self._config.get(
-                        "cover_calibrator", "cover_calibrator_args", fallback=""
-                    ).split()
-                )
-                if self._config.get(
-                    "cover_calibrator", "cover_calibrator_args", fallback=None
-                )
-                not in (None, "")
-                else None
-            )
-            self._cover_calibrator_kwargs = (
-                dict(
-                    (k, literal_eval(v))
-                    for k, v in (
-                        pair.split(":")
-                        for pair in self._config.get(
-                            "cover_calibrator", "cover_calibrator_kwargs", fallback=""
-                        ).split()
-                    )
-                )
-                if self._config.get(
-                    "cover_calibrator", "cover_calibrator_kwargs", fallback=None
-                )
-                not in (None, "")
-                else None
-            )
-            self._cover_calibrator = _import_driver(
-                "CoverCalibrator",
-                driver_name=self.cover_calibrator_driver,
-                ascom=self.cover_calibrator_ascom,
-                args=self._cover_calibrator_args,
-                kwargs=self._cover_calibrator_kwargs,
-            )
-
-            # Dome
-            self._dome_driver = self._config.get("dome", "dome_driver", fallback=None)
-            self._dome_ascom = self._config.get("dome", "dome_ascom", fallback=None)
-            self._dome_args = (
-                iter(
-                    literal_eval(v)
-                    for v in self._config.get("dome", "dome_args", fallback="").split()
-                )
-                if self._config.get("dome", "dome_args", fallback=None)
-                not in (None, "")
-                else None
-            )
-            self._dome_kwargs = (
-                dict(
-                    (k, literal_eval(v))
-                    for k, v in (
-                        pair.split(":")
-                        for pair in self._config.get(
-                            "dome", "dome_kwargs", fallback=""
-                        ).split()
-                    )
-                )
-                if self._config.get("dome", "dome_kwargs", fallback=None)
-                not in (None, "")
-                else None
-            )
-            self._dome = _import_driver(
-                "Dome",
-                driver_name=self.dome_driver,
-                ascom=self.dome_ascom,
-                args=self._dome_args,
-                kwargs=self._dome_kwargs,
-            )
-
-            # Filter wheel
-            self._filter_wheel_driver = self._config.get(
-                "filter_wheel", "filter_wheel_driver", fallback=None
-            )
-            self._filter_wheel_ascom = self._config.get(
-                "filter_wheel", "filter_wheel_ascom", fallback=None
-            )
-            self._filter_wheel_args = (
-                iter(
-                    literal_eval(v)
-                    for v in self._config.get(
-                        "filter_wheel", "filter_wheel_args", fallback=""
-                    ).split()
-                )
-                if self._config.get("filter_wheel", "filter_wheel_args", fallback=None)
-                not in (None, "")
-                else None
-            )
-            self._filter_wheel_kwargs = (
-                dict(
-                    (k, literal_eval(v))
-                    for k, v in (
-                        pair.split(":")
-                        for pair in self._config.get(
-                            "filter_wheel", "filter_wheel_kwargs", fallback=""
-                        ).split()
-                    )
-                )
-                if self._config.get(
-                    "filter_wheel", "filter_wheel_kwargs", fallback=None
-                )
-                not in (None, "")
-                else None
-            )
-            if self.filter_wheel_driver.lower() in ("maxim", "maximdl"):
-                if self._maxim is None:
-                    raise ObservatoryException(
-                        "MaxIm DL must be used as the camera driver when using MaxIm DL as the filter wheel driver."
-                    )
-                logger.info("Using MaxIm DL as the filter wheel driver")
-                self._filter_wheel = self._maxim.filter_wheel
-            else:
-                self._filter_wheel = _import_driver(
-                    "FilterWheel",
-                    driver_name=self.filter_wheel_driver,
-                    ascom=self.filter_wheel_ascom,
-                    args=self._filter_wheel_args,
-                    kwargs=self._filter_wheel_kwargs,
-                )
-
-            # Focuser
-            self._focuser_driver = self._config.get(
-                "focuser", "focuser_driver", fallback=None
-            )
-            self._focuser_ascom = self._config.get(
-                "focuser", "focuser_ascom", fallback=None
-            )
-            self._focuser_args = (
-                iter(
-                    literal_eval(v)
-                    for v in self._config.get(
-                        "focuser", "focuser_args", fallback=""
-                    ).split()
-                )
-                if self._config.get("focuser", "focuser_args", fallback=None)
-                not in (None, "")
-                else None
-            )
-            self._focuser_kwargs = (
-                dict(
-                    (k, literal_eval(v))
-                    for k, v in (
-                        pair.split(":")
-                        for pair in self._config.get(
-                            "focuser", "focuser_kwargs", fallback=""
-                        ).split()
-                    )
-                )
-                if self._config.get("focuser", "focuser_kwargs", fallback=None)
-                not in (None, "")
-                else None
-            )
-            self._focuser = _import_driver(
-                "Focuser",
-                driver_name=self.focuser_driver,
-                ascom=self.focuser_ascom,
-                kwargs=self._focuser_kwargs,
-            )
-
-            # Observing conditions
-            self._observing_conditions_driver = self._config.get(
-                "observing_conditions", "observing_conditions_driver", fallback=None
-            )
-            self._observing_conditions_ascom = self._config.get(
-                "observing_conditions", "observing_conditions_ascom", fallback=None
-            )
-            self._observing_conditions_args = (
-                iter(
-                    literal_eval(v)
-                    for v in self._config.get(
-                        "observing_conditions", "observing_conditions_args", fallback=""
-                    ).split()
-                )
-                if self._config.get(
-                    "observing_conditions", "observing_conditions_args", fallback=None
-                )
-                not in (None, "")
-                else None
-            )
-            self._observing_conditions_kwargs = (
-                dict(
-                    (k, literal_eval(v))
-                    for k, v in (
-                        pair.split(":")
-                        for pair in self._config.get(
-                            "observing_conditions",
-                            "observing_conditions_kwargs",
-                            fallback="",
-                        ).split()
-                    )
-                )
-                if self._config.get(
-                    "observing_conditions", "observing_conditions_kwargs", fallback=None
-                )
-                not in (None, "")
-                else None
-            )
-            self._observing_conditions = _import_driver(
-                "ObservingConditions",
-                driver_name=self.observing_conditions_driver,
-                ascom=self.observing_conditions_ascom,
-                args=self._observing_conditions_args,
-                kwargs=self._observing_conditions_kwargs,
-            )
-
-            # Rotator
-            self._rotator_driver = self._config.get(
-                "rotator", "rotator_driver", fallback=None
-            )
-            self._rotator_ascom = self._config.get(
-                "rotator", "rotator_ascom", fallback=None
-            )
-            self._rotator_args = (
-                iter(
-                    literal_eval(v)
-                    for v in self._config.get(
-                        "rotator", "rotator_args", fallback=""
-                    ).split()
-                )
-                if self._config.get("rotator", "rotator_args", fallback=None)
-                not in (None, "")
-                else None
-            )
-            self._rotator_kwargs = (
-                dict(
-                    (k, literal_eval(v))
-                    for k, v in (
-                        pair.split(":")
-                        for pair in self._config.get(
-                            "rotator", "rotator_kwargs", fallback=""
-                        ).split()
-                    )
-                )
-                if self._config.get("rotator", "rotator_kwargs", fallback=None)
-                not in (None, "")
-                else None
-            )
-            self._rotator = _import_driver(
-                "Rotator",
-                driver_name=self.rotator_driver,
-                ascom=self.rotator_ascom,
-                args=self._rotator_args,
-                kwargs=self._rotator_kwargs,
-            )
-
-            # Safety monitor
-            for val in self._config["safety_monitor"].values():
-                try:
-                    driver, ascom, ar, kw = val.split(",")
-                    self._safety_monitor_driver.append(driver)
-                    self._safety_monitor_ascom.append(ascom)
-                    self._safety_monitor_args.append(
-                        iter(literal_eval(v) for v in ar.split())
-                        if ar not in (None, "")
-                        else None
-                    )
-                    self._safety_monitor_kwargs.append(
-                        dict(
-                            (k, literal_eval(v))
-                            for k, v in (pair.split(":") for pair in kw.split())
-                        )
-                        if kw not in (None, "")
-                        else None
-                    )
-                    self._safety_monitor.append(
-                        _import_driver(
-                            "SafetyMonitor",
-                            driver_name=driver,
-                            ascom=ascom,
-                            args=self._safety_monitor_args[-1],
-                            kwargs=self._safety_monitor_kwargs[-1],
-                        )
-                    )
-                except:
-                    logger.warning("Error parsing safety monitor config: %s" % val)
-
-            # Switch
-            for val in self._config["switch"].values():
-                try:
-                    driver, ascom, kw = val.split(",")
-                    self._switch_driver.append(driver)
-                    self._switch_ascom.append(ascom)
-                    self._switch_args.append(
-                        iter(literal_eval(v) for v in ar.split())
-                        if ar not in (None, "")
-                        else None
-                    )
-                    self._switch_kwargs.append(
-                        dict(
-                            (k, literal_eval(v))
-                            for k, v in (pair.split(":") for pair in kw.split())
-                        )
-                        if kw not in (None, "")
-                        else None
-                    )
-                    self._switch.append(
-                        _import_driver(
-                            "Switch",
-                            driver_name=driver,
-                            ascom=ascom,
-                            args=self._switch_args[-1],
-                            kwargs=self._switch_kwargs[-1],
-                        )
-                    )
-                except:
-                    logger.warning("Error parsing switch config: %s" % val)
-
-            # Telescope
-            self._telescope_driver = self._config["telescope"]["telescope_driver"]
-            self._telescope_ascom = self._config["telescope"]["telescope_ascom"]
-            self._telescope_args = (
-                iter(
-                    literal_eval(v)
-                    for v in self._config.get(
-                        "telescope", "telescope_args", fallback=""
-                    ).split()
-                )
-                if self._config.get("telescope", "telescope_args", fallback=None)
-                not in (None, "")
-                else None
-            )
-            self._telescope_kwargs = (
-                dict(
-                    (k, literal_eval(v))
-                    for k, v in (
-                        pair.split(":")
-                        for pair in self._config.get(
-                            "telescope", "telescope_kwargs", fallback=""
-                        ).split()
-                    )
-                )
-                if self._config.get("telescope", "telescope_kwargs", fallback=None)
-                not in (None, "")
-                else None
-            )
-            self._telescope = _import_driver(
-                "Telescope",
-                driver_name=self.telescope_driver,
-                ascom=self.telescope_ascom,
-                args=self._telescope_args,
-                kwargs=self._telescope_kwargs,
-            )
-
-            # Autofocus
-            self._autofocus_driver = self._config.get(
-                "autofocus", "autofocus_driver", fallback=None
-            )
-            self._autofocus_args = (
-                iter(
-                    literal_eval(v)
-                    for v in self._config.get(
-                        "autofocus", "autofocus_args", fallback=""
-                    ).split()
-                )
-                if self._config.get("autofocus", "autofocus_args", fallback=None)
-                not in (None, "")
-                else None
-            )
-            self._autofocus_kwargs = (
-                dict(
-                    (k, literal_eval(v))
-                    for k, v in (
-                        pair.split(":")
-                        for pair in self._config.get(
-                            "autofocus", "autofocus_kwargs", fallback=""
-                        ).split()
-                    )
-                )
-                if self._config.get("autofocus", "autofocus_kwargs", fallback=None)
-                not in (None, "")
-                else None
-            )
-            if self.autofocus_driver in ("maxim", "maximdl"):
-                if self._maxim is None:
-                    raise ObservatoryException(
-                        "MaxIm DL must be used as the camera driver when using MaxIm DL as the autofocus driver."
-                    )
-                self._autofocus = self._maxim.autofocus
-                logger.info("Using MaxIm DL as the autofocus driver")
-            self._autofocus = _import_driver(
-                "Autofocus",
-                driver_name=self.autofocus_driver,
-                args=self._autofocus_args,
-                kwargs=self._autofocus_kwargs,
-            )
-
-            # WCS
-            for val in self._config["WCS"].values():
-                try:
-                    driver, ar, kw = val.split(",")
-                    self._wcs_driver.append(val)
-                    self._wcs_args.append(
-                        iter(literal_eval(v) for v in ar.split())
-                        if ar not in (None, "")
-                        else None
-                    )
-                    self._wcs_kwargs.append(
-                        dict(
-                            (k, literal_eval(v))
-                            for k, v in (pair.split(":") for pair in kw.split())
-                        )
-                        if kw not in (None, "")
-                        else None
-                    )
-                    if self._wcs_driver in ("maxim", "maximdl"):
-                        if self._maxim is None:
-                            raise ObservatoryException(
-                                "MaxIm DL must be used as the camera driver when using MaxIm DL as the WCS driver."
-                            )
-                        self._wcs.append(self._maxim.wcs)
-                        logger.info("Using MaxIm DL as the WCS driver")
-                    self._wcs.append(
-                        _import_driver(
-                            "WCS",
-                            driver_name=val,
-                            args=self._wcs_args[-1],
-                            kwargs=self._wcs_kwargs[-1],
-                        )
-                    )
-                except:
-                    logger.warning("Error parsing WCS config: %s" % val)
-
-            # Get other keywords from config file
-            logger.debug("Reading other keywords from config file")
-            master_dict = {
-                **self._config["site"],
-                **self._config["camera"],
-                **self._config["cover_calibrator"],
-                **self._config["dome"],
-                **self._config["filter_wheel"],
-                **self._config["focuser"],
-                **self._config["observing_conditions"],
-                **self._config["rotator"],
-                **self._config["safety_monitor"],
-                **self._config["switch"],
-                **self._config["telescope"],
-                **self._config["autofocus"],
-                **self._config["wcs"],
-                **self._config["scheduling"],
-            }
-            logger.debug("Master dict: %s" % master_dict)
-            self._read_out_kwargs(master_dict)
-            logger.debug("Finished reading other keywords from config file")
+            self._parse_config(config_path)
 
         logger.info("Checking passed kwargs and overriding config file values")
 
-        # Camera
-        self._camera = kwargs.get("camera", self._camera)
-        _check_class_inheritance(type(self._camera), "Camera")
-        self._camera_driver = self._camera.Name
-        self._camera_ascom = ascom.Device in type(self._camera).__bases__
-        self._camera_args = kwargs.get("camera_args", self._camera_args)
-        self._camera_kwargs = kwargs.get("camera_kwargs", self._camera_kwargs)
-        self._config["camera"]["camera_driver"] = self._camera_driver
-        self._config["camera"]["camera_ascom"] = str(self._camera_ascom)
-        self._config["camera"]["camera_args"] = self._args_to_config(self._camera_args)
-        self._config["camera"]["camera_kwargs"] = self._kwargs_to_config(
-            self._camera_kwargs
-        )
-
-        # Cover calibrator
-        self._cover_calibrator = kwargs.get("cover_calibrator", self._cover_calibrator)
-        if self._cover_calibrator is None:
-            self._cover_calibrator = _CoverCalibrator(self)
-        _check_class_inheritance(type(self._cover_calibrator), "CoverCalibrator")
-        self._cover_calibrator_driver = (
-            self._cover_calibrator.Name if self._cover_calibrator is not None else ""
-        )
-        self._cover_calibrator_ascom = (
-            (ascom.Device in type(self._cover_calibrator).__bases__)
-            if self._cover_calibrator is not None
-            else False
-        )
-        self._cover_calibrator_args = kwargs.get(
-            "cover_calibrator_args", self._cover_calibrator_args
-        )
-        self._cover_calibrator_kwargs = kwargs.get(
-            "cover_calibrator_kwargs", self._cover_calibrator_kwargs
-        )
-        self._config["cover_calibrator"][
-            "cover_calibrator_driver"
-        ] = self._cover_calibrator_driver
-        self._config["cover_calibrator"][
-            "cover_calibrator_ascom"
-        ] = self._cover_calibrator_ascom
-        self._config["cover_calibrator"][
-            "cover_calibrator_args"
-        ] = self._args_to_config(self._cover_calibrator_args)
-        self._config["cover_calibrator"][
-            "cover_calibrator_kwargs"
-        ] = self._kwargs_to_config(self._cover_calibrator_kwargs)
-
-        # Dome
-        self._dome = kwargs.get("dome", self._dome)
-        if self._dome is not None:
-            _check_class_inheritance(type(self._dome), "Dome")
-        self._dome_driver = self._dome.Name if self._dome is not None else ""
-        self._dome_ascom = (
-            (ascom.Device in type(self._dome).__bases__)
-            if self._dome is not None
-            else False
-        )
-        self._dome_args = kwargs.get("dome_args", self._dome_args)
-        self._dome_kwargs = kwargs.get("dome_kwargs", self._dome_kwargs)
-        self._config["dome"]["dome_driver"] = str(self._dome_driver)
-        self._config["dome"]["dome_ascom"] = str(self._dome_ascom)
-        self._config["dome"]["dome_args"] = self._args_to_config(self._dome_args)
-        self._config["dome"]["dome_kwargs"] = self._kwargs_to_config(self._dome_kwargs)
-
-        # Filter wheel
-        self._filter_wheel = kwargs.get("filter_wheel", self._filter_wheel)
-        if self._filter_wheel is not None:
-            _check_class_inheritance(type(self._filter_wheel), "FilterWheel")
-        self._filter_wheel_driver = (
-            self._filter_wheel.Name if self._filter_wheel is not None else ""
-        )
-        self._filter_wheel_ascom = (
-            (ascom.Device in type(self._filter_wheel).__bases__)
-            if self._filter_wheel is not None
-            else False
-        )
-        self._filter_wheel_args = kwargs.get(
-            "filter_wheel_args", self._filter_wheel_args
-        )
-        self._filter_wheel_kwargs = kwargs.get(
-            "filter_wheel_kwargs", self._filter_wheel_kwargs
-        )
-        self._config["filter_wheel"]["filter_wheel_driver"] = self._filter_wheel_driver
-        self._config["filter_wheel"]["filter_wheel_ascom"] = self._filter_wheel_ascom
-        self._config["filter_wheel"]["filter_wheel_args"] = self._args_to_config(
-            self._filter_wheel_args
-        )
-        self._config["filter_wheel"]["filter_wheel_kwargs"] = self._kwargs_to_config(
-            self._filter_wheel_kwargs
-        )
-
-        # Focuser
-        self._focuser = kwargs.get("focuser", self._focuser)
-        if self._focuser is not None:
-            _check_class_inheritance(type(self._focuser), "Focuser")
-        self._focuser_driver = self._focuser.Name if self._focuser is not None else ""
-        self._focuser_ascom = (
-            (ascom.Device in type(self._focuser).__bases__)
-            if self._focuser is not None
-            else False
-        )
-        self._focuser_args = kwargs.get("focuser_args", self._focuser_args)
-        self._focuser_kwargs = kwargs.get("focuser_kwargs", self._focuser_kwargs)
-        self._config["focuser"]["focuser_driver"] = self._focuser_driver
-        self._config["focuser"]["focuser_ascom"] = self._focuser_ascom
-        self._config["focuser"]["focuser_args"] = self._args_to_config(
-            self._focuser_args
-        )
-        self._config["focuser"]["focuser_kwargs"] = self._kwargs_to_config(
-            self._focuser_kwargs
-        )
-
-        # Observing conditions
-        self._observing_conditions = kwargs.get(
-            "observing_conditions", self._observing_conditions
-        )
-        if self._observing_conditions is not None:
-            _check_class_inheritance(
-                type(self._observing_conditions), "ObservingConditions"
-            )
-        self._observing_conditions_driver = (
-            self._observing_conditions.Name
-            if self._observing_conditions is not None
-            else ""
-        )
-        self._observing_conditions_ascom = (
-            (ascom.Device in type(self._observing_conditions).__bases__)
-            if self._observing_conditions is not None
-            else False
-        )
-        self._observing_conditions_args = kwargs.get(
-            "observing_conditions_args", self._observing_conditions_args
-        )
-        self._observing_conditions_kwargs = kwargs.get(
-            "observing_conditions_kwargs", self._observing_conditions_kwargs
-        )
-        self._config["observing_conditions"][
-            "observing_conditions_driver"
-        ] = self._observing_conditions_driver
-        self._config["observing_conditions"][
-            "observing_conditions_ascom"
-        ] = self._observing_conditions_ascom
-        self._config["observing_conditions"][
-            "observing_conditions_args"
-        ] = self._args_to_config(self._observing_conditions_args)
-        self._config["observing_conditions"][
-            "observing_conditions_kwargs"
-        ] = self._kwargs_to_config(self._observing_conditions_kwargs)
-
-        # Rotator
-        self._rotator = kwargs.get("rotator", self._rotator)
-        if self._rotator is not None:
-            _check_class_inheritance(type(self._rotator), "Rotator")
-        self._rotator_driver = self._rotator.Name if self._rotator is not None else ""
-        self._rotator_ascom = (
-            (ascom.Device in type(self._rotator).__bases__)
-            if self._rotator is not None
-            else False
-        )
-        self._rotator_args = kwargs.get("rotator_args", self._rotator_args)
-        self._rotator_kwargs = kwargs.get("rotator_kwargs", self._rotator_kwargs)
-        self._config["rotator"]["rotator_driver"] = self._rotator_driver
-        self._config["rotator"]["rotator_ascom"] = self._rotator_ascom
-        self._config["rotator"]["rotator_args"] = self._args_to_config(
-            self._rotator_args
-        )
-        self._config["rotator"]["rotator_kwargs"] = self._kwargs_to_config(
-            self._rotator_kwargs
-        )
-
-        # Safety monitor
-        kwarg = kwargs.get("safety_monitor", self._safety_monitor)
-        if type(kwarg) not in (iter, list, tuple):
-            self._safety_monitor = kwarg
-            if self._safety_monitor is not None:
-                _check_class_inheritance(type(self._safety_monitor), "SafetyMonitor")
-            self._safety_monitor_driver = (
-                self._safety_monitor.Name if self._safety_monitor is not None else ""
-            )
-            self._safety_monitor_ascom = (
-                (ascom.Device in type(self._safety_monitor).__bases__)
-                if self._safety_monitor is not None
-                else False
-            )
-            self._safety_monitor_args = kwargs.get(
-                "safety_monitor_args", self._safety_monitor_args
-            )
-            self._safety_monitor_kwargs = kwargs.get(
-                "safety_monitor_kwargs", self._safety_monitor_kwargs
-            )
-            self._config["safety_monitor"]["driver_0"] = (
-                (
-                    self._safety_monitor_driver
-                    + ","
-                    + str(self._safety_monitor_ascom)
-                    + ","
-                    + self._args_to_config(self._safety_monitor_args)
-                    + ","
-                    + self._kwargs_to_config(self._safety_monitor_kwargs)
-                )
-                if self._safety_monitor_driver != ""
-                else ""
-            )
-        else:
-            self._safety_monitor = kwarg
-            self._safety_monitor_driver = [None] * len(self._safety_monitor)
-            self._safety_monitor_ascom = [None] * len(self._safety_monitor)
-            self._safety_monitor_args = [None] * len(self._safety_monitor)
-            self._safety_monitor_kwargs = [None] * len(self._safety_monitor)
-            for i, safety_monitor in enumerate(self._safety_monitor):
-                if safety_monitor is not None:
-                    _check_class_inheritance(type(safety_monitor), "SafetyMonitor")
-                self._safety_monitor_driver[i] = (
-                    safety_monitor.Name if safety_monitor is not None else ""
-                )
-                self._safety_monitor_ascom[i] = (
-                    (ascom.Device in type(safety_monitor).__bases__)
-                    if safety_monitor is not None
-                    else False
-                )
-                self._safety_monitor_args[i] = (
-                    kwargs.get("safety_monitor_args", None)[i]
-                    if kwargs.get("safety_monitor_args", None) is not None
-                    else None
-                )
-                self._safety_monitor_kwargs[i] = (
-                    kwargs.get("safety_monitor_kwargs", None)[i]
-                    if kwargs.get("safety_monitor_kwargs", None) is not None
-                    else None
-                )
-                self._config["safety_monitor"]["driver_%i" % i] = (
-                    (
-                        self._safety_monitor_driver[i]
-                        + ","
-                        + str(self._safety_monitor_ascom[i])
-                        + ","
-                        + self._args_to_config(self._safety_monitor_args[i])
-                        + ","
-                        + self._kwargs_to_config(self._safety_monitor_kwargs[i])
-                    )
-                    if self._safety_monitor_driver[i] != ""
-                    else ""
-                )
-
-        # Switch
-        kwarg = kwargs.get("switch", self._switch)
-        if type(kwarg) not in (iter, list, tuple):
-            self._switch = kwarg
-            if self._switch is not None:
-                _check_class_inheritance(type(self._switch), "Switch")
-            self._switch_driver = self._switch.Name if self._switch is not None else ""
-            self._switch_ascom = (
-                (ascom.Device in type(self._switch).__bases__)
-                if self._switch is not None
-                else False
-            )
-            self._switch_args = kwargs.get("switch_args", self._switch_args)
-            self._switch_kwargs = kwargs.get("switch_kwargs", self._switch_kwargs)
-            self._config["switch"]["driver_0"] = (
-                (
-                    self._switch_driver
-                    + ","
-                    + str(self._switch_ascom)
-                    + ","
-                    + self._args_to_config(self._switch_args)
-                    + ","
-                    + self._kwargs_to_config(self._switch_kwargs)
-                )
-                if self._switch_driver != ""
-                else ""
-            )
-        else:
-            self._switch = kwarg
-            self._switch_driver = [None] * len(self._switch)
-            self._switch_ascom = [None] * len(self._switch)
-            self._switch_args = [None] * len(self._switch)
-            self._switch_kwargs = [None] * len(self._switch)
-            for i, switch in enumerate(self._switch):
-                if switch is not None:
-                    _check_class_inheritance(switch, "Switch")
-                self._switch_driver[i] = switch.Name if switch is not None else ""
-                self._switch_ascom[i] = (
-                    (ascom.Device in type(switch).__bases__)
-                    if switch is not None
-                    else False
-                )
-                self._switch_args[i] = (
-                    kwargs.get("switch_args", None)[i]
-                    if kwargs.get("switch_args", None) is not None
-                    else None
-                )
-                self._switch_kwargs[i] = (
-                    kwargs.get("switch_kwargs", None)[i]
-                    if kwargs.get("switch_kwargs", None) is not None
-                    else None
-                )
-                self._config["switch"]["driver_%i" % i] = (
-                    (
-                        self._switch_driver[i]
-                        + ","
-                        + str(self._switch_ascom[i])
-                        + ","
-                        + self._args_to_config(self._switch_args[i])
-                        + ","
-                        + self._kwargs_to_config(self._switch_kwargs[i])
-                    )
-                    if self._switch_driver[i] != ""
-                    else ""
-                )
-
-        # Telescope
-        self._telescope = kwargs.get("telescope", self._telescope)
-        _check_class_inheritance(type(self._telescope), "Telescope")
-        self._telescope_driver = self._telescope.Name
-        self._telescope_ascom = ascom.Device in type(self._telescope).__bases__
-        self._telescope_args = kwargs.get("telescope_args", self._telescope_args)
-        self._telescope_kwargs = kwargs.get("telescope_kwargs", self._telescope_kwargs)
-        self._config["telescope"]["telescope_driver"] = self._telescope_driver
-        self._config["telescope"]["telescope_ascom"] = str(self._telescope_ascom)
-        self._config["telescope"]["telescope_args"] = self._args_to_config(
-            self._telescope_args
-        )
-        self._config["telescope"]["telescope_kwargs"] = self._kwargs_to_config(
-            self._telescope_kwargs
-        )
-
-        # Autofocus
-        self._autofocus = kwargs.get("autofocus", self._autofocus)
-        if self._autofocus is not None:
-            _check_class_inheritance(type(self._autofocus), "Autofocus")
-        self._autofocus_driver = (
-            self._autofocus.Name if self._autofocus is not None else ""
-        )
-        self._autofocus_args = kwargs.get("autofocus_args", self._autofocus_args)
-        self._autofocus_kwargs = kwargs.get("autofocus_kwargs", self._autofocus_kwargs)
-        self._config["autofocus"]["autofocus_driver"] = self._autofocus_driver
-        self._config["autofocus"]["autofocus_args"] = self._args_to_config(
-            self._autofocus_args
-        )
-        self._config["autofocus"]["autofocus_kwargs"] = self._kwargs_to_config(
-            self._autofocus_kwargs
-        )
-
-        # WCS
-        kwarg = kwargs.get("wcs", self._wcs)
-        if kwarg is None:
-            self._wcs = _import_driver("WCS", "wcs_astrometrynet")
-            self._wcs_driver = "wcs_astrometrynet"
-            self._config["wcs"]["driver_0"] = self._wcs_driver
-        elif type(kwarg) not in (iter, list, tuple):
-            self._wcs = kwarg
-            _check_class_inheritance(type(self._wcs), "WCS")
-            self._wcs_driver = self._wcs.__name__ if self._wcs is not None else ""
-            self._wcs_args = kwargs.get("wcs_args", self._wcs_args)
-            self._wcs_kwargs = kwargs.get("wcs_kwargs", self._wcs_kwargs)
-            self._config["wcs"]["driver_0"] = (
-                (
-                    self._wcs_driver
-                    + ","
-                    + self._args_to_config(self._wcs_args)
-                    + ","
-                    + self._kwargs_to_config(self._wcs_kwargs)
-                )
-                if self._wcs_driver != ""
-                else ""
-            )
-        else:
-            self._wcs = kwarg
-            self._wcs_driver = [None] * len(self._wcs)
-            self._wcs_args = [None] * len(self._wcs)
-            self._wcs_kwargs = [None] * len(self._wcs)
-            for i, wcs in enumerate(self._wcs):
-                if wcs is not None:
-                    _check_class_inheritance(wcs, "WCS")
-                self._wcs_driver[i] = wcs.__name__ if wcs is not None else ""
-                self._wcs_args[i] = (
-                    kwargs.get("wcs_args", None)[i]
-                    if kwargs.get("wcs_args", None) is not None
-                    else None
-                )
-                self._wcs_kwargs[i] = (
-                    kwargs.get("wcs_kwargs", None)[i]
-                    if kwargs.get("wcs_kwargs", None) is not None
-                    else None
-                )
-                self._config["wcs"]["driver_%i" % i] = (
-                    (
-                        self._wcs_driver[i]
-                        + ","
-                        + self._args_to_config(self._wcs_args[i])
-                        + ","
-                        + self._kwargs_to_config(self._wcs_kwargs[i])
-                    )
-                    if self._wcs_driver[i] != ""
-                    else ""
-                )
+        for spec in self._DEVICES:
+            self._init_device(spec, kwargs)
 
         logger.debug("Reading out keywords passed as kwargs")
-        logger.debug("kwargs: %s" % kwargs)
+        logger.debug("kwargs: %s", kwargs)
         self._read_out_kwargs(kwargs)
         logger.debug("kwargs read out")
 
         # Non-keyword attributes
         self._last_camera_shutter_status = None
-        self.camera.OriginalStartExposure = self.camera.StartExposure
-
-        def NewStartExposure(self, Duration, Light):
-            self._last_camera_shutter_status = Light
-            self.camera.OriginalStartExposure(Duration, Light)
-
-        self.camera.StartExposure = NewStartExposure
+        _wrap_start_exposure(self)
 
         self._current_focus_offset = 0
 
         # Threads
         self._observing_conditions_thread = None
         self._observing_conditions_event = None
+        self._observing_conditions_snapshot = None
 
         self._safety_monitor_thread = None
         self._safety_monitor_event = None
 
-        self.derotation_thread = None
-        self.derotation_event = None
+        self._derotation_thread = None
+        self._derotation_event = None
 
         logger.debug("Config:")
         logger.debug(self._config)
 
-    def connect_all(self):
-        logger.debug("Observatory.connect_all() called")
-
-        self.camera.Connected = True
-        if self.camera.Connected:
-            logger.info("Camera connected")
-        else:
-            logger.warning("Camera failed to connect")
-
-        if self.cover_calibrator is not None:
-            self.cover_calibrator.Connected = True
-            if self.cover_calibrator.Connected:
-                logger.info("Cover calibrator connected")
-            else:
-                logger.warning("Cover calibrator failed to connect")
+    def _parse_config(self, config_path):
+        logger.debug("Observatory._parse_config(%s) called", config_path)
 
-        if self.dome is not None:
-            self.dome.Connected = True
-            if self.dome.Connected:
-                logger.info("Dome connected")
-            else:
-                logger.warning("Dome failed to connect")
-
-        if self.filter_wheel is not None:
-            self.filter_wheel.Connected = True
-            if self.filter_wheel.Connected:
-                logger.info("Filter wheel connected")
-            else:
-                logger.warning("Filter wheel failed to connect")
-
-        if self.focuser is not None:
-            self.focuser.Connected = True
-            if self.focuser.Connected:
-                logger.info("Focuser connected")
+        logger.info("Using config file to initialize observatory: %s", config_path)
+        try:
+            config = _fast_ini_parse(config_path)
+        except (OSError, ValueError) as e:
+            raise ObservatoryException(
+                "Error parsing config file '%s'" % config_path
+            ) from e
+        self._config.read_dict(config)
+
+        for spec in self._DEVICES:
+            section = spec.section
+            values = config.get(section, {})
+            if spec.multi:
+                entries = _parse_multi(values, has_ascom=spec.uses_ascom)
             else:
-                logger.warning("Focuser failed to connect")
+                entries = [
+                    (
+                        values.get(section + "_driver", None),
+                        values.get(section + "_ascom", "") == "True",
+                        _parse_args(values.get(section + "_args", None)),
+                        _parse_kwargs(values.get(section + "_kwargs", None)),
+                    )
+                ]
+            devices = [self._load_driver(spec, *entry) for entry in entries]
+            columns = [list(column) for column in zip(*entries)] or [[], [], [], []]
+            if not spec.multi:
+                devices = devices[0]
+                columns = [column[0] for column in columns]
+            driver, ascom, args, device_kwargs = columns
+            setattr(self, "_" + section, devices)
+            setattr(self, "_%s_driver" % section, driver)
+            if spec.uses_ascom:
+                setattr(self, "_%s_ascom" % section, ascom)
+            setattr(self, "_%s_args" % section, args)
+            setattr(self, "_%s_kwargs" % section, device_kwargs)
+
+        # Get other keywords from config file
+        logger.debug("Reading other keywords from config file")
+        master_dict = {}
+        for section in _SECTIONS:
+            master_dict.update(config.get(section, {}))
+        logger.debug("Master dict: %s", master_dict)
+        self._read_out_kwargs(master_dict)
+        logger.debug("Finished reading other keywords from config file")
+
+    def _load_driver(self, spec, driver, ascom, args, kwargs):
+        logger.debug("Observatory._load_driver(%s, %s) called", spec.section, driver)
+
+        if driver and spec.section in _MAXIM_ROLES and driver.lower() in _MAXIM_ALIASES:
+            if spec.section == "camera":
+                self._maxim = _import_driver("Device", driver_name="Maxim", ascom=False)
+            return self._bind_maxim(spec.section)
+
+        return _import_driver(
+            spec.class_name, driver_name=driver, ascom=ascom, args=args, kwargs=kwargs
+        )
+
+    def _bind_maxim(self, role):
+        """Returns the MaxIm DL object that provides the given device role"""
+        logger.debug("Observatory._bind_maxim(%s) called", role)
+
+        if self._maxim is None:
+            raise ObservatoryException(
+                "MaxIm DL must be used as the camera driver when using MaxIm DL as the %s driver."
+                % role.replace("_", " ")
+            )
+        logger.info("Using MaxIm DL as the %s driver", role.replace("_", " "))
+        return getattr(self._maxim, _MAXIM_ROLES[role])
 
-        if self.observing_conditions is not None:
-            self.observing_conditions.Connected = True
-            if self.observing_conditions.Connected:
-                logger.info("Observing conditions connected")
-            else:
-                logger.warning("Observing conditions failed to connect")
+    def _init_device(self, spec, kwargs):
+        """Applies keyword-argument overrides for a device and records it in config"""
+        logger.debug("Observatory._init_device(%s) called", spec.section)
 
-        if self.rotator is not None:
-            self.rotator.Connected = True
-            if self.rotator.Connected:
-                logger.info("Rotator connected")
-            else:
-                logger.warning("Rotator failed to connect")
+        section = spec.section
+        if section in kwargs:
+            device = kwargs[section]
+            args = kwargs.get(section + "_args", None)
+            device_kwargs = kwargs.get(section + "_kwargs", None)
+        else:
+            device = getattr(self, "_" + section)
+            args = kwargs.get(section + "_args", getattr(self, "_%s_args" % section))
+            device_kwargs = kwargs.get(
+                section + "_kwargs", getattr(self, "_%s_kwargs" % section)
+            )
+        if not device and spec.default is not None:
+            device = _import_driver(spec.class_name, driver_name=spec.default)
+            if spec.multi:
+                device = [device]
+
+        is_list = spec.multi and isinstance(device, (list, tuple))
+        if is_list:
+            devices = list(device)
+            args = args if args is not None else [None] * len(devices)
+            device_kwargs = (
+                device_kwargs if device_kwargs is not None else [None] * len(devices)
+            )
+        else:
+            devices = [device]
+            args = [args]
+            device_kwargs = [device_kwargs]
+
+        drivers = []
+        ascoms = []
+        for dev in devices:
+            if dev is not None or spec.required:
+                _check_class_inheritance(type(dev), spec.class_name)
+            drivers.append(
+                getattr(dev, "Name", type(dev).__name__) if dev is not None else ""
+            )
+            ascoms.append(isinstance(dev, ASCOMDevice))
+
+        if spec.multi:
+            for i, driver in enumerate(drivers):
+                fields = [driver]
+                if spec.uses_ascom:
+                    fields.append(str(ascoms[i]))
+                fields.append(self._args_to_config(args[i]))
+                fields.append(self._kwargs_to_config(device_kwargs[i]))
+                key = _DRIVER_KEYS[i] if i < len(_DRIVER_KEYS) else "driver_%i" % i
+                self._config[section][key] = ",".join(fields) if driver != "" else ""
+        else:
+            values = {
+                section + "_driver": drivers[0],
+                section + "_args": self._args_to_config(args[0]),
+                section + "_kwargs": self._kwargs_to_config(device_kwargs[0]),
+            }
+            if spec.uses_ascom:
+                values[section + "_ascom"] = str(ascoms[0])
+            self._config[section].update(values)
+
+        if not is_list:
+            devices, drivers, ascoms = device, drivers[0], ascoms[0]
+            args, device_kwargs = args[0], device_kwargs[0]
+        setattr(self, "_" + section, devices)
+        setattr(self, "_%s_driver" % section, drivers)
+        if spec.uses_ascom:
+            setattr(self, "_%s_ascom" % section, ascoms)
+        setattr(self, "_%s_args" % section, args)
+        setattr(self, "_%s_kwargs" % section, device_kwargs)
+
+    @classmethod
+    def from_config(cls, config_path, **kwargs):
+        """Creates an observatory from a config file and optional overrides"""
+        logger.debug("Observatory.from_config(%s) called", config_path)
+        return cls(config_path=config_path, **kwargs)
+
+    @classmethod
+    def warmup(cls, config_paths, max_workers=None):
+        """Creates one observatory per config file concurrently
+
+        Reading the config files and connecting to the drivers is mostly I/O,
+        so several observatories can be set up in parallel threads.
 
-        if self.safety_monitor is not None:
-            for safety_monitor in self.safety_monitor:
-                safety_monitor.Connected = True
-                if safety_monitor.Connected:
-                    logger.info("Safety monitor %s connected" % safety_monitor.Name)
-                else:
-                    logger.warning(
-                        "Safety monitor %s failed to connect" % safety_monitor.Name
-                    )
+        Parameters
+        ----------
+        config_paths : iterable of str
+            Paths to the config files.
+        max_workers : int, optional
+            Maximum number of threads to use.
 
-        if self.switch is not None:
-            for switch in self.switch:
-                switch.Connected = True
-                if switch.Connected:
-                    logger.info("Switch %s connected" % switch.Name)
-                else:
-                    logger.warning("Switch %s failed to connect" % switch.Name)
+        Returns
+        -------
+        list of Observatory
+            The observatories, in the same order as config_paths.
 
-        self.telescope.Connected = True
-        if self.telescope.Connected:
-            logger.info("Telescope connected")
-        else:
-            logger.warning("Telescope failed to connect")
+        Notes
+        -----
+        Windows COM drivers require COM to be initialized on the calling
+        thread, so this is intended for Alpaca and other non-COM drivers.
+        """
+        logger.debug("Observatory.warmup(%s) called", config_paths)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(cls.from_config, config_paths))
 
-        return True
+    def connect_all(self):
+        logger.debug("Observatory.connect_all() called")
+        return self._set_connected(True)
 
     def disconnect_all(self):
         """Disconnects from the observatory"""
 
         logger.debug("Observatory.disconnect_all() called")
+        return self._set_connected(False)
+
+    def refresh_capabilities(self):
+        """Forgets every value cached from the drivers so it is read again"""
+
+        logger.debug("Observatory.refresh_capabilities() called")
+        self._capabilities.clear()
+        self._static_info.clear()
+        self._equatorial_system = None
+        self._observing_conditions_snapshot = None
+        self._pixel_scale = None
+
+    def cache_stats(self):
+        """Returns driver cache hit rates and recent info property timings in ms"""
+
+        logger.debug("Observatory.cache_stats() called")
+        stats = {}
+        for cache in ("capabilities", "static_info"):
+            hits = self._cache_hits[cache]
+            misses = self._cache_misses[cache]
+            stats[cache] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else None,
+            }
+        for name, timings in list(self._info_timings.items()):
+            timings = sorted(timings)
+            stats[name] = {
+                "samples": len(timings),
+                "p50": timings[len(timings) // 2] / 1e6,
+                "p99": timings[int(0.99 * (len(timings) - 1))] / 1e6,
+            }
+        return stats
+
+    def _iter_devices(self):
+        """Yields (name, device) for every configured ASCOM-style device"""
+        for spec in self._DEVICES:
+            if not spec.uses_ascom:
+                continue
+            device = getattr(self, spec.section)
+            if device is None:
+                continue
+            name = spec.section.replace("_", " ").capitalize()
+            if spec.multi:
+                # Drivers may not report a Name until they are connected, so
+                # these are labelled by index and configured driver instead
+                drivers = getattr(self, "_%s_driver" % spec.section)
+                for i, (dev, driver) in enumerate(zip(device, drivers)):
+                    yield "%s %i (%s)" % (name, i, driver), dev
+            else:
+                yield name, device
 
-        self.camera.Connected = False
-        if not self.camera.Connected:
-            logger.info("Camera disconnected")
+    def _capability(self, device, name):
+        """Returns a device's Can* capability, reading it from the driver once"""
+        key = (device, name)
+        try:
+            value = self._capabilities[key]
+        except KeyError:
+            self._cache_misses["capabilities"] += 1
+            value = self._capabilities[key] = bool(getattr(device, name))
         else:
-            logger.warning("Camera failed to disconnect")
+            self._cache_hits["capabilities"] += 1
+        return value
 
-        if self.cover_calibrator is not None:
-            self.cover_calibrator.Connected = False
-            if not self.cover_calibrator.Connected:
-                logger.info("Cover calibrator disconnected")
-            else:
-                logger.warning("Cover calibrator failed to disconnect")
+    def _device_static_info(self, device, fields):
+        """Returns a read-only view of the header cards in ``fields``, read once"""
+        try:
+            info = self._static_info[device]
+        except KeyError:
+            self._cache_misses["static_info"] += 1
+            info = self._static_info[device] = MappingProxyType(
+                {key: (getattr(device, name), comment) for key, name, comment in fields}
+            )
+        else:
+            self._cache_hits["static_info"] += 1
+        return info
 
-        if self.dome is not None:
-            self.dome.Connected = False
-            if not self.dome.Connected:
-                logger.info("Dome disconnected")
-            else:
-                logger.warning("Dome failed to disconnect")
+    def _telescope_static_info(self):
+        """Returns the telescope header cards that only change on reconnection"""
+        try:
+            info = self._static_info[self.telescope]
+        except KeyError:
+            self._cache_misses["static_info"] += 1
+        else:
+            self._cache_hits["static_info"] += 1
+            return info
 
-        if self.filter_wheel is not None:
-            self.filter_wheel.Connected = False
-            if not self.filter_wheel.Connected:
-                logger.info("Filter wheel disconnected")
-            else:
-                logger.warning("Filter wheel failed to disconnect")
+        info = {
+            key: (getattr(self.telescope, name), comment)
+            for key, name, comment in _TELESCOPE_STATIC_INFO
+        }
+        info["TELEQSYS"] = (
+            _EQUATORIAL_SYSTEMS[self.telescope.EquatorialSystem],
+            "Telescope equatorial coordinate system",
+        )
+        info.update(_read_device_info(self.telescope, _TELESCOPE_OPTIONAL_STATIC_INFO))
+        try:
+            alignment = _ALIGNMENT_MODES[self.telescope.AlignmentMode]
+        except Exception:
+            alignment = None
+        info["TELALN"] = (alignment, "Telescope alignment mode")
 
-        if self.focuser is not None:
-            self.focuser.Connected = False
-            if not self.focuser.Connected:
-                logger.info("Focuser disconnected")
-            else:
-                logger.warning("Focuser failed to disconnect")
+        info = self._static_info[self.telescope] = MappingProxyType(info)
+        return info
 
-        if self.observing_conditions is not None:
-            self.observing_conditions.Connected = False
-            if not self.observing_conditions.Connected:
-                logger.info("Observing conditions disconnected")
-            else:
-                logger.warning("Observing conditions failed to disconnect")
+    def _switch_static_info(self, i):
+        """Returns the header cards of switch ``i`` that only change on reconnection"""
+        switch = self.switch[i]
+        try:
+            info = self._static_info[switch]
+        except KeyError:
+            self._cache_misses["static_info"] += 1
+        else:
+            self._cache_hits["static_info"] += 1
+            return info
 
-        if self.rotator is not None:
-            self.rotator.Connected = False
-            if not self.rotator.Connected:
-                logger.info("Rotator disconnected")
-            else:
-                logger.warning("Rotator failed to disconnect")
+        info = {
+            ("SW%iNAME" % i): (switch.Name, "Switch name"),
+            ("SW%iDRVER" % i): (switch.DriverVersion, "Switch driver version"),
+            ("SW%iDRV" % i): (switch.DriverInfo, "Switch driver name"),
+            ("SW%iINTF" % i): (switch.InterfaceVersion, "Switch interface version"),
+            ("SW%iDESC" % i): (switch.Description, "Switch description"),
+            ("SW%iSUPAC" % i): (switch.SupportedActions, "Switch supported actions"),
+            ("SW%iMAXSW" % i): (switch.MaxSwitch, "Switch maximum switch"),
+        }
+        for j in range(info["SW%iMAXSW" % i][0]):
+            info[("SW%iSW%iNM" % (i, j))] = (
+                switch.GetSwitchName(j),
+                "Switch %i Device %i name" % (i, j),
+            )
+            info[("SW%iSW%iDS" % (i, j))] = (
+                switch.GetSwitchDescription(j),
+                "Switch %i Device %i description" % (i, j),
+            )
+            info[("SW%iSW%iMN" % (i, j))] = (
+                switch.MinSwitchValue(j),
+                "Switch %i Device %i minimum value" % (i, j),
+            )
+            info[("SW%iSW%iMX" % (i, j))] = (
+                switch.MaxSwitchValue(j),
+                "Switch %i Device %i maximum value" % (i, j),
+            )
+            info[("SW%iSW%iST" % (i, j))] = (
+                switch.SwitchStep(j),
+                "Switch %i Device %i step" % (i, j),
+            )
 
-        if self.safety_monitor is not None:
-            for safety_monitor in self.safety_monitor:
-                safety_monitor.Connected = False
-                if not safety_monitor.Connected:
-                    logger.info("Safety monitor %s disconnected" % safety_monitor.Name)
-                else:
-                    logger.warning(
-                        "Safety monitor %s failed to disconnect" % safety_monitor.Name
-                    )
+        info = self._static_info[switch] = MappingProxyType(info)
+        return info
 
-        if self.switch is not None:
-            for switch in self.switch:
-                switch.Connected = False
-                if not switch.Connected:
-                    logger.info("Switch %s disconnected" % switch.Name)
-                else:
-                    logger.warning("Switch %s failed to disconnect" % switch.Name)
+    def _read_sensor(self, name):
+        """Returns the value, time since last update and description of a sensor"""
+        return (
+            getattr(self.observing_conditions, name),
+            self.observing_conditions.TimeSinceLastUpdate(name),
+            self.observing_conditions.SensorDescription(name),
+        )
 
-        self.telescope.Connected = False
-        if not self.telescope.Connected:
-            logger.info("Telescope disconnected")
+    def _read_sensors(self):
+        """Reads every observing conditions sensor, with None for unavailable ones"""
+        names = [sensor[0] for sensor in _OBSERVING_CONDITIONS_SENSORS]
+
+        # COM objects belong to the thread that created them, so on Windows
+        # the sensors are read one at a time
+        if platform.system() == "Windows":
+            results = []
+            for name in names:
+                try:
+                    results.append(self._read_sensor(name))
+                except Exception:
+                    results.append(None)
+            return results
+
+        # A hung sensor is left behind rather than holding up the others
+        executor = ThreadPoolExecutor(max_workers=len(names))
+        futures = [executor.submit(self._read_sensor, name) for name in names]
+        done, _ = wait(futures, timeout=_SENSOR_TIMEOUT)
+        executor.shutdown(wait=False, cancel_futures=True)
+        return [
+            f.result() if f in done and f.exception() is None else None for f in futures
+        ]
+
+    def _set_connected(self, value):
+        """Connects or disconnects every device, concurrently where it is safe to
+
+        Returns whether every device reached the requested state, and re-raises
+        the first exception a device raised once all of them have been tried.
+        """
+
+        # Capabilities are only defined while a driver is connected
+        self.refresh_capabilities()
+        devices = list(self._iter_devices())
+        if not devices:
+            return True
+
+        def transition(device):
+            device.Connected = value
+            return device.Connected == value
+
+        # COM objects belong to the thread that created them, so on Windows
+        # the devices are switched one at a time
+        if platform.system() == "Windows":
+            results = []
+            for name, device in devices:
+                try:
+                    results.append(transition(device))
+                except Exception as e:
+                    results.append(e)
         else:
-            logger.warning("Telescope failed to disconnect")
+            with ThreadPoolExecutor(max_workers=len(devices)) as executor:
+                futures = [executor.submit(transition, d) for _, d in devices]
+            results = [f.exception() or f.result() for f in futures]
+
+        action = "connect" if value else "disconnect"
+        for (name, _), result in zip(devices, results):
+            if isinstance(result, Exception):
+                logger.error("%s failed to %s: %s", name, action, result)
+            elif result:
+                logger.info("%s %sed", name, action)
+            else:
+                logger.warning("%s failed to %s", name, action)
 
-        return True
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return all(result is True for result in results)
 
     def shutdown(self):
         """Shuts down the observatory"""
 
         logger.info("Shutting down observatory")
 
-        if self.camera.CanAbortExposure:
+        if self._capability(self.camera, "CanAbortExposure"):
             logger.info("Aborting any in-progress camera exposures...")
             try:
                 self.camera.AbortExposure()
                 logger.info("Camera exposure aborted")
-            except:
+            except Exception:
                 logger.exception("Error aborting exposure during shutdown")
 
         logger.info("Attempting to take a dark exposure to close camera shutter...")
         try:
             self.camera.StartExposure(0, False)
-            while self.camera.ImageReady is False:
-                time.sleep(0.1)
-            logger.info("Dark exposure complete")
-        except:
+            deadline = time.monotonic() + 5
+            delay = 0.01
+            while not self.camera.ImageReady:
+                if time.monotonic() >= deadline:
+                    logger.warning("Timed out waiting for the dark exposure")
+                    break
+                time.sleep(delay)
+                delay = min(delay * 2, 1)
+            else:
+                logger.info("Dark exposure complete")
+        except Exception:
             logger.exception("Error closing camera shutter during shutdown")
 
         if self.cover_calibrator is not None:
@@ -1239,7 +1207,7 @@ class Observatory:
                 try:
                     self.cover_calibrator.CalibratorOff()
                     logger.info("Cover calibrator turned off")
-                except:
+                except Exception:
                     logger.exception(
                         "Error turning off cover calibrator during shutdown"
                     )
@@ -1248,7 +1216,7 @@ class Observatory:
                 try:
                     self.cover_calibrator.HaltCover()
                     logger.info("Cover calibrator shutter motion halted")
-                except:
+                except Exception:
                     logger.exception(
                         "Error closing cover calibrator shutter during shutdown"
                     )
@@ -1256,7 +1224,7 @@ class Observatory:
                 try:
                     self.cover_calibrator.CloseCover()
                     logger.info("Cover calibrator shutter closed")
-                except:
+                except Exception:
                     logger.exception(
                         "Error closing cover calibrator shutter during shutdown"
                     )
@@ -1266,23 +1234,23 @@ class Observatory:
             try:
                 self.dome.AbortSlew()
                 logger.info("Dome motion aborted")
-            except:
+            except Exception:
                 logger.exception("Error aborting dome motion during shutdown")
 
-            if self.dome.CanFindPark:
+            if self._capability(self.dome, "CanFindPark"):
                 logger.info("Attempting to park dome...")
                 try:
                     self.dome.Park()
                     logger.info("Dome parked")
-                except:
+                except Exception:
                     logger.exception("Error parking dome during shutdown")
 
-            if self.dome.CanSetShutter:
+            if self._capability(self.dome, "CanSetShutter"):
                 logger.info("Attempting to close dome shutter...")
                 try:
                     self.dome.CloseShutter()
                     logger.info("Dome shutter closed")
-                except:
+                except Exception:
                     logger.exception("Error closing dome shutter during shutdown")
 
         if self.focuser is not None:
@@ -1290,7 +1258,7 @@ class Observatory:
             try:
                 self.focuser.Halt()
                 logger.info("Focuser motion aborted")
-            except:
+            except Exception:
                 logger.exception("Error aborting focuser motion during shutdown")
 
         if self.rotator is not None:
@@ -1298,36 +1266,36 @@ class Observatory:
             try:
                 self.rotator.Halt()
                 logger.info("Rotator motion aborted")
-            except:
+            except Exception:
                 logger.exception("Error stopping rotator during shutdown")
 
         logger.info("Aborting any in-progress telescope slews...")
         try:
             self.telescope.AbortSlew()
             logger.info("Telescope slew aborted")
-        except:
+        except Exception:
             logger.exception("Error aborting slew during shutdown")
 
         logger.info("Attempting to turn off telescope tracking...")
         try:
             self.telescope.Tracking = False
             logger.info("Telescope tracking turned off")
-        except:
+        except Exception:
             logger.exception("Error turning off telescope tracking during shutdown")
 
-        if self.telescope.CanPark:
+        if self._capability(self.telescope, "CanPark"):
             logger.info("Attempting to park telescope...")
             try:
                 self.telescope.Park()
                 logger.info("Telescope parked")
-            except:
+            except Exception:
                 logger.exception("Error parking telescope during shutdown")
-        elif self.telescope.CanFindHome:
+        elif self._capability(self.telescope, "CanFindHome"):
             logger.info("Attempting to find home position...")
             try:
                 self.telescope.FindHome()
                 logger.info("Telescope home position found")
-            except:
+            except Exception:
                 logger.exception("Error finding home position during shutdown")
 
         return True
@@ -1335,12 +1303,12 @@ class Observatory:
     def lst(self, t=None):
         """Returns the local sidereal time"""
 
-        logger.debug(f"Observatory.lst({t}) called")
+        logger.debug("Observatory.lst(%s) called", t)
 
         if t is None:
             t = self.observatory_time
         else:
-            t = Time(t)
+            t = astrotime.Time(t)
         return (
             t.sidereal_time("apparent", self.observatory_location).to("hourangle").value
         )
@@ -1348,12 +1316,12 @@ class Observatory:
     def sun_altaz(self, t=None):
         """Returns the altitude of the sun"""
 
-        logger.debug(f"Observatory.sun_altaz({t}) called")
+        logger.debug("Observatory.sun_altaz(%s) called", t)
 
         if t is None:
             t = self.observatory_time
         else:
-            t = Time(t)
+            t = astrotime.Time(t)
 
         sun = coord.get_sun(t).transform_to(
             coord.AltAz(obstime=t, location=self.observatory_location)
@@ -1364,12 +1332,12 @@ class Observatory:
     def moon_altaz(self, t=None):
         """Returns the current altitude of the moon"""
 
-        logger.debug(f"Observatory.moon_altaz({t}) called")
+        logger.debug("Observatory.moon_altaz(%s) called", t)
 
         if t is None:
             t = self.observatory_time
         else:
-            t = Time(t)
+            t = astrotime.Time(t)
 
         moon = coord.get_moon(t).transform_to(
             coord.AltAz(obstime=t, location=self.observatory_location)
@@ -1378,23 +1346,16 @@ class Observatory:
         return (moon.alt.deg, moon.az.deg)
 
     def moon_illumination(self, t=None):
-        """Returns the current illumination of the moon"""
+        """Returns the illumination of the moon, for one time or an array of times"""
 
-        logger.debug(f"Observatory.moon_illumination({t}) called")
+        logger.debug("Observatory.moon_illumination(%s) called", t)
 
         if t is None:
             t = self.observatory_time
         else:
-            t = Time(t)
-
-        sun = coord.get_sun(t)
-        moon = coord.get_moon(t)
-        elongation = sun.separation(moon)
-        phase_angle = np.arctan2(
-            sun.distance * np.sin(elongation),
-            moon.distance - sun.distance * np.cos(elongation),
-        )
-        return (1.0 + np.cos(phase_angle)) / 2.0
+            t = astrotime.Time(t)
+
+        return _moon_illumination(coord.get_sun(t), coord.get_moon(t))
 
     def get_object_altaz(
         self, obj=None, ra=None, dec=None, unit=("hr", "deg"), frame="icrs", t=None
@@ -1402,13 +1363,19 @@ class Observatory:
         """Returns the altitude and azimuth of the requested object at the requested time"""
 
         logger.debug(
-            f"Observatory.get_object_altaz({obj}, {ra}, {dec}, {unit}, {frame}, {t}) called"
+            "Observatory.get_object_altaz(%s, %s, %s, %s, %s, %s) called",
+            obj,
+            ra,
+            dec,
+            unit,
+            frame,
+            t,
         )
 
         obj = self._parse_obj_ra_dec(obj, ra, dec, unit, frame)
         if t is None:
             t = self.observatory_time
-        t = Time(t)
+        t = astrotime.Time(t)
 
         return obj.transform_to(
             coord.AltAz(obstime=t, location=self.observatory_location)
@@ -1420,64 +1387,65 @@ class Observatory:
         """Determines the slew coordinates of the requested object at the requested time"""
 
         logger.debug(
-            f"Observatory.get_object_slew({obj}, {ra}, {dec}, {unit}, {frame}, {t}) called"
+            "Observatory.get_object_slew(%s, %s, %s, %s, %s, %s) called",
+            obj,
+            ra,
+            dec,
+            unit,
+            frame,
+            t,
         )
 
         obj = self._parse_obj_ra_dec(obj, ra, dec, unit, frame)
         if t is None:
             t = self.observatory_time
-        t = Time(t)
+        t = astrotime.Time(t)
 
-        eq_system = self.telescope.EquatorialSystem
+        eq_system = self._get_equatorial_system()
         if eq_system == 0:
             logger.warning(
                 "Telescope equatorial system is not set, assuming Topocentric"
             )
-            eq_system = 1
-
-        if eq_system == 1:
-            obj_slew = obj.transform_to(
-                coord.TETE(obstime=t, location=self.observatory_location)
-            )
-        elif eq_system == 2:
-            obj_slew = obj.transform_to("icrs")
         elif eq_system == 3:
             logger.info("Astropy does not support J2050 ICRS yet, using FK5")
-            obj_slew = obj.transform_to(coord.FK5(equinox="J2050"))
-        elif eq_system == 4:
-            obj_slew = obj.transform_to(coord.FK4(equinox="B1950"))
+        frame = _EQUATORIAL_FRAMES.get(eq_system, _EQUATORIAL_FRAMES[1])
+        frame = frame(t, self.observatory_location)
+
+        # Distant objects go to apparent coordinates through ERFA with cached
+        # astrometry parameters, skipping astropy's transform graph. This
+        # neglects diurnal aberration (under 0.4 arcseconds); solar system
+        # objects have distances and need the full transform for parallax.
+        if isinstance(frame, coord.TETE) and isinstance(
+            obj.data, coord.UnitSphericalRepresentation
+        ):
+            astrom, eo = _apparent_astrom(int(t.unix // 600))
+            ra, dec = erfa.atciqz(obj.ra.rad, obj.dec.rad, astrom)
+            return coord.SkyCoord(
+                ra=erfa.anp(ra - eo) * u.rad, dec=dec * u.rad, frame=frame
+            )
+        return obj.transform_to(frame)
 
-        return obj_slew
+    def _get_equatorial_system(self, ttl=1.0):
+        """Returns the telescope EquatorialSystem, re-read at most every ttl seconds"""
+        now = time.monotonic()
+        if self._equatorial_system is None or now - self._equatorial_system[0] > ttl:
+            self._equatorial_system = (now, self.telescope.EquatorialSystem)
+        return self._equatorial_system[1]
 
     def get_current_object(self):
         """Returns the current pointing of the telescope in ICRS"""
 
         logger.debug("Observatory.get_current_object() called")
 
-        eq_system = self.telescope.EquatorialSystem
-        if eq_system in (0, 1):
-            obj = self._parse_obj_ra_dec(
-                ra=self.telescope.RightAscension,
-                dec=self.telescope.Declination,
-                frame=coord.TETE(obstime=t, location=self.observatory_location),
-            )
-        elif eq_system == 2:
-            obj = self._parse_obj_ra_dec(
-                ra=self.telescope.RightAscension, dec=self.telescope.Declination
-            )
-        elif eq_system == 3:
-            obj = self._parse_obj_ra_dec(
-                ra=self.telescope.RightAscension,
-                dec=self.telescope.Declination,
-                frame=coord.FK5(equinox="J2050"),
-            )
-        elif eq_system == 4:
-            obj = self._parse_obj_ra_dec(
-                ra=self.telescope.RightAscension,
-                dec=self.telescope.Declination,
-                frame=coord.FK4(equinox="B1950"),
-            )
-        return obj
+        ra = self.telescope.RightAscension
+        dec = self.telescope.Declination
+        eq_system = self._get_equatorial_system()
+        frame = _EQUATORIAL_FRAMES.get(eq_system, _EQUATORIAL_FRAMES[1])
+        return self._parse_obj_ra_dec(
+            ra=ra,
+            dec=dec,
+            frame=frame(self.observatory_time, self.observatory_location),
+        )
 
     def save_last_image(
         self,
@@ -1487,64 +1455,81 @@ class Observatory:
         do_fwhm=False,
         overwrite=False,
         custom_header=None,
+        writer=None,
+        device_cards=None,
         **kwargs,
     ):
-        """Saves the current image"""
+        """Saves the current image
+
+        If ``writer`` is an executor, the file is written in the background
+        on it, unless it must be plate solved first. ``device_cards`` are
+        header cards from `_device_cards` read beforehand; by default they
+        are read for this image.
+        """
 
         logger.debug(
-            f"Observatory.save_last_image({filename}, {frametyp}, {do_wcs}, {do_fwhm}, {overwrite}, {custom_header}, {kwargs}) called"
+            "Observatory.save_last_image(%s, %s, %s, %s, %s, %s, %s, %s) called",
+            filename,
+            frametyp,
+            do_wcs,
+            do_fwhm,
+            overwrite,
+            custom_header,
+            writer,
+            kwargs,
         )
 
         if not self.camera.ImageReady:
             logger.exception("Image is not ready, cannot be saved")
             return False
 
+        image = self.camera.ImageArray
+        if image is not None:
+            # COM and Alpaca drivers return nested sequences indexed [x][y].
+            # Convert them in one pass to a contiguous [y][x] array, the
+            # row-major layout FITS stores, as 16-bit unsigned integers when
+            # the camera's ADU range allows it.
+            max_adu = self._device_static_info(self.camera, _CAMERA_STATIC_INFO)[
+                "MAXADU"
+            ][0]
+            dtype = np.uint16 if max_adu <= 65535 else np.int32
+            image = np.ascontiguousarray(np.asarray(image, dtype=dtype).T)
         if (
-            self.camera.ImageArray is None
-            or self.camera.ImageArray.size == 0
-            or self.camera.ImageArray.shape[0] == 0
-            or self.camera.ImageArray.shape[1] == 0
+            image is None
+            or image.size == 0
+            or image.shape[0] == 0
+            or image.shape[1] == 0
         ):
             logger.exception("Image array is empty, cannot be saved")
             return False
 
-        hdr = fits.Header()
-
-        hdr["SIMPLE"] = True
-        hdr["BITPIX"] = (16, "8 unsigned int, 16 & 32 int, -32 & -64 real")
-        hdr["NAXIS"] = (2, "number of axes")
-        hdr["NAXIS1"] = (self.camera.ImageArray.shape[0], "fastest changing axis")
-        hdr["NAXIS2"] = (
-            self.camera.ImageArray.shape[1],
-            "next to fastest changing axis",
+        from astropy.io import fits
+
+        from .. import __version__
+
+        if frametyp is None:
+            frametyp = "Light" if self.last_camera_shutter_status else "Dark"
+
+        hdr = fits.Header(
+            [
+                ("SIMPLE", True),
+                ("BITPIX", 16, "8 unsigned int, 16 & 32 int, -32 & -64 real"),
+                ("NAXIS", 2, "number of axes"),
+                ("NAXIS1", image.shape[1], "fastest changing axis"),
+                ("NAXIS2", image.shape[0], "next to fastest changing axis"),
+                ("BSCALE", 1, "physical=BZERO + BSCALE*array_value"),
+                ("BZERO", 32768, "physical=BZERO + BSCALE*array_value"),
+                ("SWCREATE", "pyScope", "Software used to create file"),
+                ("SWVERSIO", __version__, "Version of software used to create file"),
+                ("ROWORDER", "TOP-DOWN", "Row order of image"),
+                ("FRAMETYP", frametyp, "Frame type"),
+            ]
         )
-        hdr["BSCALE"] = (1, "physical=BZERO + BSCALE*array_value")
-        hdr["BZERO"] = (32768, "physical=BZERO + BSCALE*array_value")
-        hdr["SWCREATE"] = ("pyScope", "Software used to create file")
-        hdr["SWVERSIO"] = (__version__, "Version of software used to create file")
-        hdr["ROWORDER"] = ("TOP-DOWN", "Row order of image")
-
-        if frametyp is not None:
-            hdr["FRAMETYP"] = (frametyp, "Frame type")
-        elif self.last_camera_shutter_status:
-            hdr["FRAMETYP"] = ("Light", "Frame type")
-        elif not self.last_camera_shutter_status:
-            hdr["FRAMETYP"] = ("Dark", "Frame type")
-
-        hdr.update(self.observatory_info)
+
+        if device_cards is None:
+            device_cards = self._device_cards()
+        hdr.update(device_cards)
         hdr.update(self.camera_info)
-        hdr.update(self.telescope_info)
-        hdr.update(self.cover_calibrator_info)
-        hdr.update(self.dome_info)
-        hdr.update(self.filter_wheel_info)
-        hdr.update(self.focuser_info)
-        hdr.update(self.observing_conditions_info)
-        hdr.update(self.rotator_info)
-        hdr.update(self.safety_monitor_info)
-        hdr.update(self.switch_info)
-        hdr.update(self.threads_info)
-        hdr.update(self.autofocus_info)
-        hdr.update(self.wcs_info)
 
         if custom_header is not None:
             hdr.update(custom_header)
@@ -1553,86 +1538,126 @@ class Observatory:
             logger.info("Attempting to measure FWHM")
             cat = _get_image_source_catalog(filename)
 
-            hdr["FWHMH"] = (
-                np.median(np.sqrt(cat.covar_sigx2)),
-                "Median FWHM in horizontal direction",
-            )
-            hdr["FWHMHS"] = (
-                np.std(np.sqrt(cat.covar_sigx2)),
-                "Std. dev. of FWHM in horizontal direction",
-            )
-            hdr["FWHMV"] = (
-                np.median(np.sqrt(cat.covar_sigy2)),
-                "Median FWHM in vertical direction",
-            )
-            hdr["FWHMVS"] = (
-                np.std(np.sqrt(cat.covar_sigy2)),
-                "Std. dev. of FWHM in vertical direction",
-            )
-            logger.info("FWHMH: %.2f +/- %.2f" % (hdr["FWHMH"], hdr["FWHMHS"]))
-            logger.info("FWHMV: %.2f +/- %.2f" % (hdr["FWHMV"], hdr["FWHMVS"]))
-
-        hdu = fits.PrimaryHDU(self.camera.ImageArray, header=hdr)
-        hdu.writeto(filename, overwrite=overwrite)
+            # One row per axis, so each statistic is a single reduction
+            fwhm = np.sqrt(np.stack((cat.covar_sigx2, cat.covar_sigy2)))
+            median_x, median_y = np.median(fwhm, axis=1)
+            std_x, std_y = np.std(fwhm, axis=1)
+            hdr["FWHMH"] = (median_x, "Median FWHM in horizontal direction")
+            hdr["FWHMHS"] = (std_x, "Std. dev. of FWHM in horizontal direction")
+            hdr["FWHMV"] = (median_y, "Median FWHM in vertical direction")
+            hdr["FWHMVS"] = (std_y, "Std. dev. of FWHM in vertical direction")
+            logger.info("FWHMH: %.2f +/- %.2f", hdr["FWHMH"], hdr["FWHMHS"])
+            logger.info("FWHMV: %.2f +/- %.2f", hdr["FWHMV"], hdr["FWHMVS"])
+
+        hdu = fits.PrimaryHDU(image, header=hdr)
+        if writer is not None and not do_wcs:
+            writer.submit(_write_fits, filename, hdu, overwrite).add_done_callback(
+                _log_write_error
+            )
+            return True
+        _write_fits(filename, hdu, overwrite)
 
         if do_wcs:
             logger.info("Attempting to solve image for WCS")
-            if type(self.wcs) is WCS:
-                logger.info("Using solver %s" % self.wcs_driver)
-                self.wcs.Solve(
-                    filename,
-                    ra_key="TELRAIC",
-                    dec_key="TELDECIC",
-                    ra_dec_units=("hour", "deg"),
-                    solve_timeout=60,
-                    scale_units="arcsecperpix",
-                    scale_type="ev",
-                    scale_est=self.pixel_scale[0],
-                    scale_err=self.pixel_scale[0] * 0.1,
-                    parity=1,
-                    crpix_center=True,
-                )
-            else:
-                for wcs, i in enumerate(self.wcs):
-                    logger.info("Using solver %s" % self.wcs_driver[i])
-                    solution = wcs.Solve(
-                        filename,
-                        ra_key="TELRAIC",
-                        dec_key="TELDECIC",
-                        ra_dec_units=("hour", "deg"),
-                        solve_timeout=60,
-                        scale_units="arcsecperpix",
-                        scale_type="ev",
-                        scale_est=self.pixel_scale[0],
-                        scale_err=self.pixel_scale[0] * 0.1,
-                        parity=1,
-                        crpix_center=True,
-                    )
-                    if solution:
-                        break
-                if not solution:
-                    logger.warning("WCS solution not found.")
+            if not self._solve_wcs(filename):
+                logger.warning("WCS solution not found.")
 
         return True
 
+    def _device_cards(self):
+        """Returns the header cards of every device but the camera"""
+        cards = {}
+        for info in (
+            self.observatory_info,
+            self.telescope_info,
+            self.cover_calibrator_info,
+            self.dome_info,
+            self.filter_wheel_info,
+            self.focuser_info,
+            self.observing_conditions_info,
+            self.rotator_info,
+            self.safety_monitor_info,
+            self.switch_info,
+            self.threads_info,
+            self.autofocus_info,
+            self.wcs_info,
+        ):
+            cards.update(info)
+        return cards
+
+    def _wait_for_image(self, exposure, timeout=None):
+        """Waits for the camera to read out an exposure of the given length
+
+        ASCOM cameras do not signal when an image is ready, and none can be
+        ready before the exposure ends, so this sleeps through the exposure
+        and only polls ImageReady during readout. Polling starts fast and
+        backs off, so short readouts are noticed within a few milliseconds.
+        Raises ObservatoryException if no image is ready after timeout
+        seconds, by default the exposure plus 30 seconds.
+        """
+        logger.debug("Observatory._wait_for_image(%s, %s) called", exposure, timeout)
+
+        if timeout is None:
+            timeout = exposure + 30
+        deadline = time.monotonic() + timeout
+        time.sleep(min(exposure, timeout))
+        delay = 0.002
+        while not self.camera.ImageReady:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ObservatoryException(
+                    "Camera image not ready after %.0f seconds" % timeout
+                )
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.1)
+
+    def _solve_wcs(self, filename):
+        """Tries each WCS solver in turn until one solves the image in place
+
+        The solvers run one after another rather than concurrently, as each
+        one updates the header of the same file and COM-based solvers cannot
+        be moved to another process.
+        """
+        logger.debug("Observatory._solve_wcs(%s) called", filename)
+
+        solvers = self.wcs
+        if not isinstance(solvers, (list, tuple)):
+            solvers = [solvers]
+        drivers = self.wcs_driver
+        if not isinstance(drivers, (list, tuple)):
+            drivers = [drivers]
+        scale = self.pixel_scale[0]
+        kwargs = dict(_WCS_SOLVE_KWARGS, scale_est=scale, scale_err=scale * 0.1)
+        for solver, driver in zip(solvers, drivers):
+            if solver is None:
+                logger.warning("WCS driver %s could not be loaded, skipping", driver)
+                continue
+            logger.info("Using solver %s", driver)
+            if solver.Solve(filename, **kwargs):
+                return True
+        return False
+
     def set_filter_offset_focuser(self, filter_index=None, filter_name=None):
         logger.debug(
-            f"Observatory.set_filter_offset_focuser({filter_index}, {filter_name}) called"
+            "Observatory.set_filter_offset_focuser(%s, %s) called",
+            filter_index,
+            filter_name,
         )
 
         if filter_index is None:
             try:
                 filter_index = self.filters.index(filter_name)
-                logger.info("Filter %s found at index %i" % (filter_name, filter_index))
-            except:
+                logger.info("Filter %s found at index %i", filter_name, filter_index)
+            except Exception:
                 raise ObservatoryException(
                     "Filter %s not found in filter list" % filter_name
                 )
 
         if self.filter_wheel is not None:
             if self.filter_wheel.Connected:
-                logger.info("Setting filter wheel to filter %i" % filter_index)
+                logger.info("Setting filter wheel to filter %i", filter_index)
                 self.filter_wheel.Position = filter_index
+                self._wait_for_filter(filter_index)
                 logger.info("Filter wheel set")
             else:
                 raise ObservatoryException("Filter wheel is not connected.")
@@ -1653,8 +1678,8 @@ class Observatory:
                             < self.focuser.MaxStep
                         ):
                             logger.info(
-                                "Focuser moving to position %i"
-                                % (self.focuser.Position + self.current_focus_offset)
+                                "Focuser moving to position %i",
+                                self.focuser.Position + self.current_focus_offset,
                             )
                             self.focuser.Move(
                                 self.focuser.Position + self.current_focus_offset
@@ -1667,8 +1692,8 @@ class Observatory:
                             )
                     else:
                         logger.info(
-                            "Focuser moving to relative position %i"
-                            % self.current_focus_offset
+                            "Focuser moving to relative position %i",
+                            self.current_focus_offset,
                         )
                         self.focuser.Move(self.current_focus_offset)
                         logger.info("Focuser moved")
@@ -1694,23 +1719,33 @@ class Observatory:
         home_first=False,
         wait_for_slew=True,
         track=True,
+        slew_timeout=180,
     ):
         """Slews the telescope to a given ra and dec"""
 
         logger.debug(
-            f"Observatory.slew_to_coordinates({obj}, {ra}, {dec}, {unit}, {frame}, {control_dome}, {control_rotator}, {home_first}, {wait_for_slew}, {track}) called"
+            "Observatory.slew_to_coordinates(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) called",
+            obj,
+            ra,
+            dec,
+            unit,
+            frame,
+            control_dome,
+            control_rotator,
+            home_first,
+            wait_for_slew,
+            track,
+            slew_timeout,
         )
 
         obj = self._parse_obj_ra_dec(obj, ra, dec, unit, frame)
 
-        logger.info(
-            "Slewing to RA %i:%i:%.2f and Dec %i:%i:%.2f" % obj.ra.hms[0],
-            obj.ra.hms[1],
-            obj.ra.hms[2],
-            obj.dec.dms[0],
-            obj.dec.dms[1],
-            obj.dec.dms[2],
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Slewing to RA %s and Dec %s",
+                _sexagesimal(obj.ra.hour, hours=True),
+                _sexagesimal(obj.dec.deg),
+            )
         slew_obj = self.get_object_slew(obj)
         altaz_obj = self.get_object_altaz(obj)
 
@@ -1719,34 +1754,34 @@ class Observatory:
 
         if altaz_obj.alt.deg <= self.min_altitude:
             logger.exception(
-                "Target is below the minimum altitude of %.2f degrees"
-                % self.min_altitude
+                "Target is below the minimum altitude of %.2f degrees",
+                self.min_altitude,
             )
             return False
 
         if control_rotator and self.rotator is not None:
             self.stop_derotation_thread()
 
-        if self.telescope.CanPark:
+        if self._capability(self.telescope, "CanPark"):
             if self.telescope.AtPark:
                 logger.info("Telescope is parked, unparking...")
                 self.telescope.Unpark()
                 logger.info("Unparked.")
-                if self.telescope.CanFindHome and home_first:
+                if self._capability(self.telescope, "CanFindHome") and home_first:
                     logger.info("Finding home position...")
                     self.telescope.FindHome()
                     logger.info("Found home position.")
 
         logger.info("Attempting to slew to coordinates...")
-        if self.telescope.CanSlew:
-            if self.telescope.CanSlewAsync:
+        if self._capability(self.telescope, "CanSlew"):
+            if self._capability(self.telescope, "CanSlewAsync"):
                 self.telescope.SlewToCoordinatesAsync(
                     slew_obj.ra.hour, slew_obj.dec.deg
                 )
             else:
                 self.telescope.SlewToCoordinates(slew_obj.ra.hour, slew_obj.dec.deg)
-        elif self.telescope.CanSlewAltAz:
-            if self.telescope.CanSlewAltAzAsync:
+        elif self._capability(self.telescope, "CanSlewAltAz"):
+            if self._capability(self.telescope, "CanSlewAltAzAsync"):
                 self.telescope.SlewToAltAzAsync(altaz_obj.alt.deg, altaz_obj.az.deg)
             else:
                 self.telescope.SlewToAltAz(altaz_obj.alt.deg, altaz_obj.az.deg)
@@ -1754,25 +1789,29 @@ class Observatory:
             raise ObservatoryException("The telescope cannot slew to coordinates.")
 
         if control_dome and self.dome is not None:
-            if self.dome.ShutterState != 0 and self.CanSetShutter:
+            if self.dome.ShutterState != 0 and self._capability(
+                self.dome, "CanSetShutter"
+            ):
                 logger.info("Opening the dome shutter...")
                 self.dome.OpenShutter()
                 logger.info("Opened.")
-                if self.dome.CanFindHome:
+                if self._capability(self.dome, "CanFindHome"):
                     logger.info("Finding the dome home...")
                     self.dome.FindHome()
+                    self._wait_while_moving([(self.dome, "Slewing")], slew_timeout)
                     logger.info("Found.")
-            if self.dome.CanPark:
-                if self.dome.AtPark and self.dome.CanFindHome:
+            if self._capability(self.dome, "CanPark"):
+                if self.dome.AtPark and self._capability(self.dome, "CanFindHome"):
                     logger.info("Finding the dome home...")
                     self.dome.FindHome()
+                    self._wait_while_moving([(self.dome, "Slewing")], slew_timeout)
                     logger.info("Found.")
             if not self.dome.Slaved:
-                if self.dome.CanSetAltitude:
+                if self._capability(self.dome, "CanSetAltitude"):
                     logger.info("Setting the dome altitude...")
                     self.dome.SlewToAltitude(altaz_obj.alt.deg)
                     logger.info("Set.")
-                if self.dome.CanSetAzimuth:
+                if self._capability(self.dome, "CanSetAzimuth"):
                     logger.info("Setting the dome azimuth...")
                     logger.info("Set.")
                     self.dome.SlewToAzimuth(altaz_obj.az.deg)
@@ -1791,23 +1830,22 @@ class Observatory:
                 )
                 control_rotator = False
 
-            logger.info("Rotating the rotator to hour angle %.2f" % hour_angle)
-            self.rotator.MoveAbsolute(rotation_angle)
-            logger.info("Rotated.")
-
-        condition = wait_for_slew
-        while condition:
-            condition = self.telescope.Slewing
-            if self.control_dome and self.dome is not None:
-                condition = condition or self.dome.Slewing
-            if self.control_rotator and self.rotator is not None:
-                condition = condition or self.rotator.IsMoving
-            time.sleep(0.1)
-        else:
-            logger.info("Settling for %.2f seconds..." % self.settle_time)
-            time.sleep(self.settle_time)
+            logger.info("Rotating the rotator by %.2f degrees", rotation_angle)
+            self.rotator.MoveAbsolute(rotation_angle)
+            logger.info("Rotated.")
 
-        if track and self.telescope.CanSetTracking:
+        if wait_for_slew:
+            # (device, property) pairs that are true while the device moves
+            moving = [(self.telescope, "Slewing")]
+            if control_dome and self.dome is not None:
+                moving.append((self.dome, "Slewing"))
+            if control_rotator and self.rotator is not None:
+                moving.append((self.rotator, "IsMoving"))
+            self._wait_while_moving(moving, slew_timeout)
+        logger.info("Settling for %.2f seconds...", self.settle_time)
+        time.sleep(self.settle_time)
+
+        if track and self._capability(self.telescope, "CanSetTracking"):
             logger.info("Turning on sidereal tracking...")
             self.telescope.TrackingRate = 0
             self.telescope.Tracking = True
@@ -1817,6 +1855,44 @@ class Observatory:
 
         return True
 
+    def _wait_while_moving(self, moving, timeout, poll=0.05):
+        """Polls (device, property) pairs until none of the properties is true
+
+        The pairs are checked in order and polling stops at the first device
+        still moving, so usually only one driver is queried per poll. Raises
+        ObservatoryException if a device is still moving after timeout seconds.
+        """
+        logger.debug("Observatory._wait_while_moving(%s, %s) called", moving, timeout)
+
+        deadline = time.monotonic() + timeout
+        while any(getattr(device, name) for device, name in moving):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ObservatoryException(
+                    "Devices still moving after %.0f seconds" % timeout
+                )
+            time.sleep(min(poll, remaining))
+
+    def _wait_for_filter(self, position, timeout=30):
+        """Waits for the filter wheel to reach a position
+
+        ASCOM filter wheels report position -1 while moving. Raises
+        ObservatoryException if the wheel has not arrived after timeout seconds.
+        """
+        logger.debug("Observatory._wait_for_filter(%s, %s) called", position, timeout)
+
+        deadline = time.monotonic() + timeout
+        delay = 0.01
+        while self.filter_wheel.Position != position:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ObservatoryException(
+                    "Filter wheel did not reach position %i after %.0f seconds"
+                    % (position, timeout)
+                )
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.1)
+
     def start_observing_conditions_thread(self, update_interval=60):
         """Starts the observing conditions updating thread"""
 
@@ -1848,6 +1924,7 @@ class Observatory:
         self._observing_conditions_thread.join()
         self._observing_conditions_event = None
         self._observing_conditions_thread = None
+        self._observing_conditions_snapshot = None
         logger.info("Observing conditions thread stopped.")
 
         return True
@@ -1857,7 +1934,10 @@ class Observatory:
         while not self._observing_conditions_event.is_set():
             logger.debug("Updating observing conditions...")
             self.observing_conditions.Refresh()
-            time.sleep(wait_time)
+            self._observing_conditions_snapshot = MappingProxyType(
+                self._read_observing_conditions_info()
+            )
+            self._observing_conditions_event.wait(wait_time)
 
     def start_safety_monitor_thread(self, on_fail=None, update_interval=60):
         """Starts the safety monitor updating thread"""
@@ -1905,18 +1985,22 @@ class Observatory:
 
     def _update_safety_monitor(self, on_fail, wait_time=0):
         """Updates the safety monitor"""
-        while not self._safety_monitor_event.is_set():
+        event = self._safety_monitor_event
+        while not event.is_set():
             logger.debug("Updating safety monitor...")
             safety_array = self.safety_status()
             if not all(safety_array):
                 logger.warning(
-                    'Safety monitor is not safe, calling on_fail function "%s" and ending thread...'
-                    % on_fail.__name__
+                    'Safety monitor is not safe, calling on_fail function "%s" and ending thread...',
+                    on_fail.__name__,
                 )
+                # This thread cannot join itself, so it only marks itself stopped
+                event.set()
+                self._safety_monitor_event = None
+                self._safety_monitor_thread = None
                 on_fail()
-                self.stop_safety_monitor_thread()
                 return
-            time.sleep(wait_time)
+            event.wait(wait_time)
 
     def start_derotation_thread(self, update_interval=0.05):
         """Begin a derotation thread for the current ra and dec"""
@@ -1925,14 +2009,16 @@ class Observatory:
             raise ObservatoryException("There is no rotator object.")
 
         obj = self.get_current_object().transform_to(
-            coord.AltAz(obstime=Time.now(), location=self.location)
+            coord.AltAz(
+                obstime=self.observatory_time, location=self.observatory_location
+            )
         )
 
         logger.info("Starting derotation thread...")
         self._derotation_event = threading.Event()
         self._derotation_thread = threading.Thread(
             target=self._update_rotator,
-            args=(obj,),
+            args=(obj, update_interval),
             daemon=True,
             name="Derotation Thread",
         )
@@ -1962,9 +2048,10 @@ class Observatory:
         # mean sidereal rate (at J2000) in radians per second
         SR = 7.292115855306589e-5
 
-        while not self._derotation_event.is_set():
-            self.rotator.Move(command)
+        # Rotation in degrees over one update, apart from the alt/az terms
+        scale = math.cos(self.latitude.rad) * math.degrees(SR) * wait_time
 
+        while not self._derotation_event.is_set():
             t0 = self.observatory_time
             obj = obj.transform_to(
                 coord.AltAz(
@@ -1973,43 +2060,43 @@ class Observatory:
                 )
             )
 
-            command = (
-                -(
-                    np.cos(obj.az.rad)
-                    * np.cos(self.latitude * deg)
-                    / np.cos(obj.alt.rad)
-                )
-                * SR
-                / deg
-                * wait_time
+            self.rotator.Move(-math.cos(obj.az.rad) * scale / math.cos(obj.alt.rad))
+
+            self._derotation_event.wait(
+                max(0, wait_time - (self.observatory_time - t0).sec)
             )
 
-            time.sleep(wait_time - (self.observatory_time - t0).sec)
+    def get_observing_condition(self, name):
+        """Returns the value, time since last update and description of one sensor"""
+
+        logger.debug("Observatory.get_observing_condition(%s) called", name)
+
+        if self.observing_conditions is None:
+            raise ObservatoryException("There is no observing conditions object.")
+        if not any(name == sensor[0] for sensor in _OBSERVING_CONDITIONS_SENSORS):
+            raise ObservatoryException("Unknown observing condition %s" % name)
+        return self._read_sensor(name)
 
     def safety_status(self):
         """Returns the status of the safety monitors"""
 
         logger.debug("Observatory.safety_status() called")
 
-        safety_array = []
-        if self.safety_monitor is not None:
-            for safety_monitor in self.safety_monitor:
-                safety_array.append(safety_monitor.IsSafe)
-        return safety_array
+        if not self.safety_monitor:
+            return []
+        return _map_devices(lambda monitor: monitor.IsSafe, self.safety_monitor)
 
     def switch_status(self):
         """Returns the status of the switches"""
 
         logger.debug("Observatory.switch_status() called")
 
-        switch_array = []
-        if self.switch is not None:
-            for switch in self.switch:
-                temp = []
-                for i in range(switch.MaxSwitch):
-                    temp.append(switch.GetSwitch(i))
-                switch_array.append(temp)
-        return switch_array
+        if not self.switch:
+            return []
+        return _map_devices(
+            lambda switch: [switch.GetSwitch(i) for i in range(switch.MaxSwitch)],
+            self.switch,
+        )
 
     def run_autofocus(
         self,
@@ -2022,7 +2109,7 @@ class Observatory:
         """Runs the autofocus routine"""
 
         if self.autofocus is not None:
-            logger.info("Using %s to run autofocus..." % self.autofocus_driver)
+            logger.info("Using %s to run autofocus...", self.autofocus_driver)
             result = self.autofocus.Run(exposure=exposure)
             logger.info("Autofocus routine completed.")
             return result
@@ -2047,39 +2134,42 @@ class Observatory:
             )
             test_positions = np.round(test_positions, -2)
 
-            focus_values = []
-            for position, i in enumerate(test_positions):
-                logger.info("Moving focuser to %s..." % position)
-                if self.focuser.Absolute:
-                    self.focuser.Move(position)
-                elif i == 0:
-                    self.focuser.Move(-position[0])
+            # A relative focuser starts from the midpoint and steps between
+            # consecutive test positions
+            absolute = self.focuser.Absolute
+            previous = midpoint
+            filename = os.path.join(tempfile.gettempdir(), "autofocus.fts")
+            focus_values = np.empty(nsteps)
+            for i, position in enumerate(test_positions):
+                logger.info("Moving focuser to %s...", position)
+                if absolute:
+                    self.focuser.Move(int(position))
                 else:
-                    self.focuser.Move(step_size)
+                    self.focuser.Move(int(position - previous))
+                previous = position
                 logger.info("Focuser moved.")
 
-                logger.info("Taking %s second exposure..." % exposure)
+                logger.info("Taking %s second exposure...", exposure)
                 self.camera.StartExposure(exposure, True)
-                while not image.ImageReady:
-                    time.sleep(0.1)
+                self._wait_for_image(exposure)
                 logger.info("Exposure complete.")
 
                 logger.info("Calculating mean star fwhm...")
-                filename = tempfile.gettempdir() + "/autofocus.fts"
-                self.save_last_image(filename, overwrite=True, do_wcs=True)
+                self.save_last_image(filename, overwrite=True)
                 cat = _get_image_source_catalog(filename)
-                focus_values.append(np.mean(cat.fwhm))
-                logger.info("FWHM = %.1f pixels" % focus_values[-1])
+                focus_values[i] = np.mean(cat.fwhm)
+                logger.info("FWHM = %.1f pixels", focus_values[i])
 
-            popt, pcov = np.polyfit(test_positions, focus_values, 2)
-            result = np.round(-popt[1] / (2 * popt[0]), 0)
-            logger.info("Best focus position is %i" % result)
+            # Vertex of the best-fit parabola through (position, fwhm)
+            a, b, _ = np.polyfit(test_positions, focus_values, 2)
+            result = np.round(-b / (2 * a), 0)
+            logger.info("Best focus position is %i", result)
 
             logger.info("Moving focuser to best focus position...")
-            if self.focuser.Absolute:
-                self.focuer.Move(result)
+            if absolute:
+                self.focuser.Move(int(result))
             else:
-                self.focuser.Move(test_positions[-1] - result)
+                self.focuser.Move(int(result - test_positions[-1]))
             logger.info("Focuser moved.")
             logger.info("Autofocus routine complete.")
 
@@ -2168,106 +2258,72 @@ class Observatory:
 
         obj = self._parse_obj_ra_dec(obj, ra, dec, unit, frame)
 
-        logger.info(
-            "Attempting to put %s RA %i:%i:%.2f and Dec %i:%i:%.2f on pixel (%.2f, %.2f)"
-            % (
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Attempting to put %s RA %s and Dec %s on pixel (%.2f, %.2f)",
                 frame,
-                obj.ra.hms[0],
-                obj.ra.hms[1],
-                obj.ra.hms[2],
-                obj.dec.dms[0],
-                obj.dec.dms[1],
-                obj.dec.dms[2],
+                _sexagesimal(obj.ra.hour, hours=True),
+                _sexagesimal(obj.dec.deg),
                 target_x_pixel,
                 target_y_pixel,
             )
-        )
 
         if initial_offset_dec != 0 and do_initial_slew:
             logger.info(
-                "Offseting the initial slew declination by %.2f arcseconds"
-                % initial_offset_dec
+                "Offseting the initial slew declination by %.2f arcseconds",
+                initial_offset_dec,
             )
 
-        for attempt in range(max_attempts):
-            slew_obj = self.get_object_slew(obj)
+        from astropy import wcs as astropy_wcs
+        from astropy.io import fits
 
+        for attempt in range(max_attempts):
             if check_and_refine:
-                logger.info("Attempt %i of %i" % (attempt + 1, max_attempts))
+                logger.info("Attempt %i of %i", attempt + 1, max_attempts)
 
+            # slew_to_coordinates takes ICRS coordinates and converts them to
+            # the mount's equatorial system itself
             if attempt == 0:
                 if do_initial_slew:
                     self.slew_to_coordinates(
-                        ra=slew_obj.ra.hour,
-                        dec=slew_obj.dec.deg + initial_offset_dec / 3600,
+                        ra=obj.ra.hour,
+                        dec=obj.dec.deg + initial_offset_dec / 3600,
+                        unit=("hour", "deg"),
                         control_dome=(self.dome is not None),
                         control_rotator=(self.rotator is not None),
                     )
             else:
                 self.slew_to_coordinates(
-                    slew_obj.ra.hour,
-                    slew_obj.dec.deg,
+                    obj,
                     control_dome=(self.dome is not None),
                     control_rotator=(self.rotator is not None),
                 )
 
-            logger.info("Settling for %.2f seconds" % self.settle_time)
+            logger.info("Settling for %.2f seconds", self.settle_time)
             time.sleep(self.settle_time)
 
-            if not check_and_refine and attempt_number > 0:
+            if not check_and_refine and attempt > 0:
                 logger.info(
                     "Check and recenter is off, single-shot recentering complete"
                 )
                 return True
 
-            logger.info("Taking %.2f second exposure" % exposure)
+            logger.info("Taking %.2f second exposure", exposure)
             self.camera.ReadoutMode = self.camera.ReadoutModes[readout]
             self.camera.StartExposure(exposure, True)
-            while not self.camera.ImageReady:
-                time.sleep(0.1)
+            self._wait_for_image(exposure)
             logger.info("Exposure complete")
 
-            temp_image = (
-                tempfile.gettempdir()
-                + "%s.fts" % astrotime.Time(self.observatory_time, format="fits").value
+            temp_image = os.path.join(
+                tempfile.gettempdir(), "recenter_%i.fts" % time.time_ns()
             )
             self.save_last_image(temp_image)
 
             logger.info("Searching for a WCS solution...")
-            if type(self.wcs) is WCS:
-                self.wcs.Solve(
-                    filename,
-                    ra_key="TELRAIC",
-                    dec_key="TELDECIC",
-                    ra_dec_units=("hour", "deg"),
-                    solve_timeout=60,
-                    scale_units="arcsecperpix",
-                    scale_type="ev",
-                    scale_est=self.pixel_scale[0],
-                    scale_err=self.pixel_scale[0] * 0.1,
-                    parity=1,
-                    crpix_center=True,
-                )
-            else:
-                for wcs, i in enumerate(self.wcs):
-                    solution_found = wcs.Solve(
-                        filename,
-                        ra_key="TELRAIC",
-                        dec_key="TELDECIC",
-                        ra_dec_units=("hour", "deg"),
-                        solve_timeout=60,
-                        scale_units="arcsecperpix",
-                        scale_type="ev",
-                        scale_est=self.pixel_scale[0],
-                        scale_err=self.pixel_scale[0] * 0.1,
-                        parity=1,
-                        crpix_center=True,
-                    )
-                    if solution_found:
-                        break
+            solution_found = self._solve_wcs(temp_image)
 
             if save_images:
-                logger.info("Saving the centering image to %s" % save_path)
+                logger.info("Saving the centering image to %s", save_path)
                 shutil.copy(temp_image, save_path)
 
             if not solution_found:
@@ -2278,75 +2334,71 @@ class Observatory:
                 "WCS solution found, solving for the pixel location of the target"
             )
             try:
-                hdulist = fits.open(temp_image)
-                w = astropy.wcs.WCS(hdulist[0].header)
-
-                center_coord = w.pixel_to_world(
-                    int(self.camera.CameraXSize / 2), int(self.camera.CameraYSize / 2)
-                )
-                center_ra = center_coord.ra.hour
-                center_dec = center_coord.dec.deg
-                logger.debug(
-                    "Center of the image is at RA %i:%i:%.2f and Dec %i:%i:%.2f"
-                    % (
-                        center_coord.ra.hms[0],
-                        center_coord.ra.hms[1],
-                        center_coord.ra.hms[2],
-                        center_coord.dec.dms[0],
-                        center_coord.dec.dms[1],
-                        center_coord.dec.dms[2],
+                w = astropy_wcs.WCS(fits.getheader(temp_image))
+
+                # Low-level calls on bare degrees skip the SkyCoord round trip,
+                # and the all_* variants still apply any SIP distortion
+                pixels = [
+                    [
+                        int(self.camera.CameraXSize / 2),
+                        int(self.camera.CameraYSize / 2),
+                    ],
+                    [target_x_pixel, target_y_pixel],
+                ]
+                center, target = w.all_pix2world(pixels, 0).tolist()
+                center_ra, center_dec = center
+                target_pixel_ra, target_pixel_dec = target
+                center_ra /= 15
+                target_pixel_ra /= 15
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Center of the image is at RA %s and Dec %s",
+                        _sexagesimal(center_ra, hours=True),
+                        _sexagesimal(center_dec),
                     )
-                )
-
-                coord = w.pixel_to_world(target_x_pixel, target_y_pixel)
-                target_pixel_ra = coord.ra.hour
-                target_pixel_dec = coord.dec.deg
-                logger.debug(
-                    "Target is at RA %i:%i:%.2f and Dec %i:%i:%.2f"
-                    % (
-                        coord.ra.hms[0],
-                        coord.ra.hms[1],
-                        coord.ra.hms[2],
-                        coord.dec.dms[0],
-                        coord.dec.dms[1],
-                        coord.dec.dms[2],
+                    logger.debug(
+                        "Target is at RA %s and Dec %s",
+                        _sexagesimal(target_pixel_ra, hours=True),
+                        _sexagesimal(target_pixel_dec),
                     )
-                )
 
-                pixels = w.world_to_pixel(obj)
-                obj_x_pixel = pixels[0]
-                obj_y_pixel = pixels[1]
+                obj_x_pixel, obj_y_pixel = w.all_world2pix(
+                    [[obj.ra.deg, obj.dec.deg]], 0
+                )[0].tolist()
                 logger.debug(
-                    "Object is at pixel (%.2f, %.2f)" % (obj_x_pixel, obj_y_pixel)
+                    "Object is at pixel (%.2f, %.2f)", obj_x_pixel, obj_y_pixel
                 )
-            except:
+            except Exception:
                 logger.warning(
                     "Could not solve for the pixel location of the target, skipping this attempt"
                 )
                 continue
 
-            error_ra = obj.ra.hour - target_pixel_ra
-            error_dec = obj.dec.deg - target_pixel_dec
+            obj_ra = float(obj.ra.hour)
+            obj_dec = float(obj.dec.deg)
+            error_ra = obj_ra - target_pixel_ra
+            error_dec = obj_dec - target_pixel_dec
             error_x_pixels = obj_x_pixel - target_x_pixel
             error_y_pixels = obj_y_pixel - target_y_pixel
-            logger.debug("Error in RA is %.2f arcseconds" % (error_ra * 15 * 3600))
-            logger.debug("Error in Dec is %.2f arcseconds" % (error_dec * 3600))
-            logger.debug("Error in x pixels is %.2f" % error_x_pixels)
-            logger.debug("Error in y pixels is %.2f" % error_y_pixels)
+            logger.debug("Error in RA is %.2f arcseconds", error_ra * 15 * 3600)
+            logger.debug("Error in Dec is %.2f arcseconds", error_dec * 3600)
+            logger.debug("Error in x pixels is %.2f", error_x_pixels)
+            logger.debug("Error in y pixels is %.2f", error_y_pixels)
 
-            if max(error_x_pixels, error_y_pixels) <= max_pixel_error:
+            if max(abs(error_x_pixels), abs(error_y_pixels)) <= tolerance:
                 break
 
             logger.info("Offsetting next slew coordinates")
             obj = self._parse_obj_ra_dec(
-                ra=obj.ra.hour + error_ra,
-                dec=obj.dec.deg + error_dec,
+                ra=obj_ra + error_ra,
+                dec=obj_dec + error_dec,
                 unit=("hour", "deg"),
                 frame="icrs",
             )
         else:
             logger.warning(
-                "Target could not be centered after %d attempts" % max_attempts
+                "Target could not be centered after %d attempts", max_attempts
             )
             return False
 
@@ -2362,7 +2414,7 @@ class Observatory:
             self.telescope.SyncToCoordinates(sync_obj.ra.hour, sync_obj.dec.deg)
             logger.info("Sync complete")
 
-        logger.info("Target is now in position after %d attempts" % (attempt + 1))
+        logger.info("Target is now in position after %d attempts", attempt + 1)
 
         return True
 
@@ -2392,37 +2444,19 @@ class Observatory:
             )
             return False
 
-        if save_path is None:
-            save_path = os.getcwd()
-            logger.debug(
-                "Setting save path to current working directory: %s" % save_path
-            )
+        save_path = _resolve_save_path(save_path, new_folder, "Flats")
 
-        if type(new_folder) is bool:
-            if new_folder:
-                save_path = os.path.join(
-                    save_path,
-                    datetime.datetime.now().strftime("Flats_%Y-%m-%d_%H-%M-%S"),
-                )
-                os.makedirs(save_path)
-                logger.info("Created new directory: %s" % save_path)
-        elif type(new_folder) is str:
-            save_path = os.path.join(save_path, new_folder)
-            if not os.path.exists(save_path):
-                os.makedirs(save_path)
-            logger.info("Created new directory: %s" % save_path)
-
-        if home_telescope and self.telescope.CanFindHome:
+        if home_telescope and self._capability(self.telescope, "CanFindHome"):
             logger.info("Homing the telescope")
             self.telescope.FindHome()
             logger.info("Homing complete")
 
         logger.info("Slewing to point at cover calibrator")
-        if self.telescope.CanSlewAltAz:
+        if self._capability(self.telescope, "CanSlewAltAz"):
             self.telescope.SlewToAltAz(
                 self.cover_calibrator_az, self.cover_calibrator_alt
             )
-        elif self.telescope.CanSlew:
+        elif self._capability(self.telescope, "CanSlew"):
             obj = self.get_object_slew(
                 obj=coord.AltAz(
                     alt=self.cover_calibrator_alt,
@@ -2435,81 +2469,99 @@ class Observatory:
         self.telescope.Tracking = False
         logger.info("Slew complete")
 
-        if self.cover_calibrator.CoverState != "NotPresent":
+        # Whether a cover or calibrator is present cannot change during the run
+        has_cover = self.cover_calibrator.CoverState != "NotPresent"
+        has_calibrator = self.cover_calibrator.CalibratorState != "NotPresent"
+
+        if has_cover:
             logger.info("Opening the cover calibrator")
             self.cover_calibrator.OpenCover()
             logger.info("Cover open")
 
+        check_temperature = self._capability(self.camera, "CanSetCCDTemperature")
+        if check_temperature:
+            temperature_limit = self.cooler_setpoint + self.cooler_tolerance
+
+        # Frames are written in the background while the next one is exposed
+        writer = ThreadPoolExecutor(max_workers=1)
         for i in range(len(self.filters)):
             if filter_exposure[i] == 0:
                 continue
+            # The filter and calibrator brightness only change between filters
+            self.filter_wheel.Position = i
+            self._wait_for_filter(i)
+            if has_calibrator and filter_brightness is not None:
+                logger.info(
+                    "Setting the cover calibrator brightness to %i",
+                    filter_brightness[i],
+                )
+                self.cover_calibrator.CalibratorOn(filter_brightness[i])
+                logger.info("Cover calibrator on")
+            # Nothing but the camera changes until the next filter
+            device_cards = self._device_cards()
             for readout in readouts:
                 self.camera.ReadoutMode = readout
+                readout_name = self.camera.ReadoutModes[readout].replace(" ", "")
                 for binning in binnings:
-                    if type(binnings[0]) is tuple:
-                        self.camera.BinX = binning[0]
-                        self.camera.BinY = binning[1]
+                    if isinstance(binning, tuple):
+                        bin_x, bin_y = binning
                     else:
-                        self.camera.BinX = binning
-                        self.camera.BinY = binning
+                        bin_x = bin_y = binning
+                    self.camera.BinX = bin_x
+                    self.camera.BinY = bin_y
+                    save_prefix = os.path.join(
+                        save_path,
+                        "flat_%s_%ix%i_%4.4f_%s_"
+                        % (
+                            self.filters[i],
+                            bin_x,
+                            bin_y,
+                            filter_exposure[i],
+                            readout_name,
+                        ),
+                    )
                     for j in range(repeat):
-                        if self.camera.CanSetCCDTemperature:
-                            while self.camera.CCDTemperature > (
-                                self.cooler_setpoint + self.cooler_tolerance
-                            ):
+                        if check_temperature:
+                            while self.camera.CCDTemperature > temperature_limit:
                                 logger.warning(
                                     "Cooler is not at setpoint, waiting 10 seconds..."
                                 )
                                 time.sleep(10)
-                        self.filter_wheel.Position = i
-                        if (
-                            self.cover_calibrator.CalibratorState != "NotPresent"
-                            or filter_brightness is not None
-                        ):
-                            logger.info(
-                                "Setting the cover calibrator brightness to %i"
-                                % filter_brightness[i]
-                            )
-                            self.cover_calibrator.CalibratorOn(filter_brightness[i])
-                            logger.info("Cover calibrator on")
-                        logger.info("Starting %s exposure" % self.filters[i])
-                        camera.StartExposure(filter_exposure[i], False)
-                        save_string = save_path + (
-                            "flat_%s_%ix%i_%4.4f_%i_%i.fts"
-                            % (
-                                self.filters[i],
-                                self.camera.BinX,
-                                self.camera.BinY,
-                                filter_exposure[i],
-                                self.camera.ReadoutModes[
-                                    self.camera.ReadoutMode
-                                ].replace(" ", ""),
-                                j,
-                            )
+                        logger.info("Starting %s exposure", self.filters[i])
+                        self.camera.StartExposure(filter_exposure[i], False)
+                        save_string = "%s%i.fts" % (save_prefix, j)
+                        self._wait_for_image(filter_exposure[i])
+                        self.save_last_image(
+                            save_string,
+                            frametyp="Flat",
+                            writer=writer,
+                            device_cards=device_cards,
                         )
-                        while not camera.ImageReady:
-                            time.sleep(0.1)
-                        self.save_last_image(save_string, frametyp="Flat")
-                        logger.info("Flat %i of %i complete" % (j, repeat))
-                        logger.debug("Saved flat frame to %s" % save_string)
+                        logger.info("Flat %i of %i complete", j, repeat)
+                        logger.debug("Saved flat frame to %s", save_string)
+        writer.shutdown()
 
-        if self.cover_calibrator.CalibratorState != "NotPresent":
+        if has_calibrator:
             logger.info("Turning off the cover calibrator")
             self.cover_calibrator.CalibratorOff()
             logger.info("Cover calibrator off")
 
-        if self.cover_calibrator.CoverState != "NotPresent":
+        if has_cover:
             logger.info("Closing the cover calibrator")
             self.cover_calibrator.CloseCover()
             logger.info("Cover closed")
 
             if final_telescope_position == "no change":
                 logger.info("No change to telescope position requested, exiting")
-            elif final_telescope_position == "home" and self.telescope.CanFindHome:
+            elif final_telescope_position == "home" and self._capability(
+                self.telescope, "CanFindHome"
+            ):
                 logger.info("Homing the telescope")
                 self.telescope.FindHome()
                 logger.info("Homing complete")
-            elif final_telescope_position == "park" and self.telescope.CanPark:
+            elif final_telescope_position == "park" and self._capability(
+                self.telescope, "CanPark"
+            ):
                 logger.info("Parking the telescope")
                 self.telescope.Park()
                 logger.info("Parking complete")
@@ -2525,68 +2577,60 @@ class Observatory:
 
         logger.info("Taking dark frames")
 
-        if save_path is None:
-            save_path = os.getcwd()
-            logger.info(
-                "Setting save path to current working directory: %s" % save_path
-            )
+        save_path = _resolve_save_path(save_path, new_folder, "Darks")
 
-        if type(new_folder) is bool:
-            save_path = os.path.join(
-                save_path, datetime.datetime.now().strftime("Flats_%Y-%m-%d_%H-%M-%S")
-            )
-            os.makedirs(save_path)
-            logger.info("Created new directory: %s" % save_path)
-        elif type(new_folder) is str:
-            save_path = os.path.join(save_path, new_folder)
-            os.makedirs(save_path)
-            logger.info("Created new directory: %s" % save_path)
+        check_temperature = self._capability(self.camera, "CanSetCCDTemperature")
+        if check_temperature:
+            temperature_limit = self.cooler_setpoint + self.cooler_tolerance
+
+        # Nothing but the camera changes while taking darks
+        device_cards = self._device_cards()
 
+        # Frames are written in the background while the next one is exposed
+        writer = ThreadPoolExecutor(max_workers=1)
         for exposure in exposures:
             for readout in readouts:
                 self.camera.ReadoutMode = readout
+                readout_name = self.camera.ReadoutModes[readout].replace(" ", "")
                 for binning in binnings:
-                    if type(binnings[0]) is tuple:
-                        self.camera.BinX = binning[0]
-                        self.camera.BinY = binning[1]
+                    if isinstance(binning, tuple):
+                        bin_x, bin_y = binning
                     else:
-                        self.camera.BinX = binning
-                        self.camera.BinY = binning
+                        bin_x = bin_y = binning
+                    self.camera.BinX = bin_x
+                    self.camera.BinY = bin_y
+                    save_prefix = os.path.join(
+                        save_path,
+                        "dark_%s_%ix%i_%4.4gs__"
+                        % (readout_name, bin_x, bin_y, exposure),
+                    )
                     for j in range(repeat):
-                        if self.camera.CanSetCCDTemperature:
-                            while self.camera.CCDTemperature > (
-                                self.cooler_setpoint + self.cooler_tolerance
-                            ):
+                        if check_temperature:
+                            while self.camera.CCDTemperature > temperature_limit:
                                 logger.warning(
                                     "Cooler is not at setpoint, waiting 10 seconds..."
                                 )
                                 time.sleep(10)
-                        logger.info("Starting %4.4gs dark exposure" % exposure)
-                        camera.StartExposure(exposure, False)
-                        save_string = save_path + (
-                            "dark_%s_%ix%i_%4.4gs__%i.fts"
-                            % (
-                                self.camera.ReadoutModes[
-                                    self.camera.ReadoutMode
-                                ].replace(" ", ""),
-                                self.camera.BinX,
-                                self.camera.BinY,
-                                exposure,
-                                j,
-                            )
+                        logger.info("Starting %4.4gs dark exposure", exposure)
+                        self.camera.StartExposure(exposure, False)
+                        save_string = "%s%i.fts" % (save_prefix, j)
+                        self._wait_for_image(exposure)
+                        self.save_last_image(
+                            save_string,
+                            frametyp="Dark",
+                            writer=writer,
+                            device_cards=device_cards,
                         )
-                        while not camera.ImageReady:
-                            time.sleep(0.1)
-                        self.save_last_image(save_string, frametyp="Dark")
-                        logger.info("Dark %i of %i complete" % (j, repeat))
-                        logger.debug("Saved dark frame to %s" % save_string)
+                        logger.info("Dark %i of %i complete", j, repeat)
+                        logger.debug("Saved dark frame to %s", save_string)
+        writer.shutdown()
 
         logger.info("Darks complete")
 
         return True
 
     def save_config(self, filename):
-        logger.debug("Saving observatory configuration to %s" % filename)
+        logger.debug("Saving observatory configuration to %s", filename)
         with open(filename, "w") as configfile:
             self._config.write(configfile)
 
@@ -2594,104 +2638,51 @@ class Observatory:
         self, obj=None, ra=None, dec=None, unit=("hour", "deg"), frame="icrs", t=None
     ):
         logger.debug(
-            f"""Observatory._parse_obj_ra_dec({obj}, {ra}, {dec}, {unit}, {frame}, {t}) called"""
-        )
-
-        if type(obj) is str:
-            try:
-                obj = coord.SkyCoord.from_name(obj)
-            except:
-                try:
-                    if t is None:
-                        t = self.observatory_time
-                    else:
-                        t = Time(t)
-                    eph = MPC.get_ephemeris(
-                        obj,
-                        start=t,
-                        location=self.observatory_location,
-                        number=1,
-                        proper_motion="sky",
-                    )
-                    obj = coord.SkyCoord(
-                        ra=eph["RA"],
-                        dec=eph["Dec"],
-                        unit=("deg", "deg"),
-                        pm_ra_cosdec=eph["dRA cos(Dec)"],
-                        pm_dec=eph["dDec"],
-                        frame="icrs",
-                    )
-                except:
-                    try:
-                        obj = coord.get_body(obj, t, self.observatory_location)
-                    except:
-                        raise ObservatoryException(
-                            "The requested object could not be found using "
-                            + "Sesame resolver, the Minor Planet Center Query, or the astropy.coordinates get_body function."
-                        )
-        elif type(obj) is coord.SkyCoord:
+            "Observatory._parse_obj_ra_dec(%s, %s, %s, %s, %s, %s) called",
+            obj,
+            ra,
+            dec,
+            unit,
+            frame,
+            t,
+        )
+
+        if isinstance(obj, str):
+            if t is None:
+                t = self.observatory_time
+            else:
+                t = astrotime.Time(t)
+            # Resolutions are cached to the minute, which is well below the
+            # precision that moving object ephemerides need here
+            geocentric = tuple(
+                float(c.to_value(u.m)) for c in self.observatory_location.geocentric
+            )
+            obj = _resolve_name(obj, t.isot[:16], geocentric)
+        elif isinstance(obj, coord.SkyCoord):
             pass
         elif ra is not None and dec is not None:
             obj = coord.SkyCoord(ra=ra, dec=dec, unit=unit, frame=frame)
         else:
             raise Exception("Either the object, the ra, or the dec must be specified.")
 
+        # Transforming to the frame a coordinate is already in still runs
+        # the whole transform machinery
+        if obj.frame.name == "icrs":
+            return obj
         return obj.transform_to("icrs")
 
     def _read_out_kwargs(self, dictionary):
         logger.debug("Observatory._read_out_kwargs() called")
 
-        self.site_name = dictionary.get("site_name", self.site_name)
-        self.instrument_name = dictionary.get("instrument_name", self.instrument_name)
-        self.instrument_description = dictionary.get(
-            "instrument_description", self.instrument_description
-        )
-        self.latitude = dictionary.get("latitude", self.latitude)
-        self.longitude = dictionary.get("longitude", self.longitude)
-        self.elevation = dictionary.get("elevation", self.elevation)
-        self.diameter = dictionary.get("diameter", self.diameter)
-        self.focal_length = dictionary.get("focal_length", self.focal_length)
-
-        self.cooler_setpoint = dictionary.get("cooler_setpoint", self.cooler_setpoint)
-        self.cooler_tolerance = dictionary.get(
-            "cooler_tolerance", self.cooler_tolerance
-        )
-        self.max_dimension = dictionary.get("max_dimension", self.max_dimension)
-
-        self.cover_calibrator_alt = dictionary.get(
-            "cover_calibrator_alt", self.cover_calibrator_alt
-        )
-        self.cover_calibrator_az = dictionary.get(
-            "cover_calibrator_az", self.cover_calibrator_az
-        )
-
-        self.filters = dictionary.get("filters", self.filters)
-        self.filter_focus_offsets = dictionary.get(
-            "filter_focus_offsets", self.filter_focus_offsets
-        )
-
-        self.focuser_max_error = dictionary.get(
-            "focuser_max_error", self.focuser_max_error
-        )
-
-        self.rotator_reverse = dictionary.get("rotator_reverse", self.rotator_reverse)
-        self.rotator_min_angle = dictionary.get(
-            "rotator_min_angle", self.rotator_min_angle
-        )
-        self.rotator_max_angle = dictionary.get(
-            "rotator_max_angle", self.rotator_max_angle
-        )
-
-        self.min_altitude = dictionary.get("min_altitude", self.min_altitude)
-        self.settle_time = dictionary.get("settle_time", self.settle_time)
+        for name in _KWARG_ATTRIBUTES:
+            if name in dictionary:
+                setattr(self, name, dictionary[name])
 
-        self.slew_rate = dictionary.get("slew_rate", self.slew_rate)
-        self.instrument_reconfiguration_times = json.loads(
-            dictionary.get(
-                "instrument_reconfiguration_times",
-                self.instrument_reconfiguration_times,
-            )
-        )
+        times = dictionary.get("instrument_reconfiguration_times")
+        if times is not None:
+            if isinstance(times, str):
+                times = json.loads(times)
+            self.instrument_reconfiguration_times = times
 
     @property
     def autofocus_info(self):
@@ -2699,129 +2690,41 @@ class Observatory:
         return {"Autofocus Driver": self.autofocus_driver}
 
     @property
+    @_timed
     def camera_info(self):
         logger.debug("Observatory.camera_info() called")
         try:
             self.camera.Connected = True
-        except:
+        except Exception:
             return {"CONNECT": (False, "Camera connection")}
-        info = {
-            "CAMCON": (True, "Camera connection"),
-            "CAMREADY": (self.camera.ImageReady, "Image ready"),
-            "CAMSTATE": (
-                ["Idle", "Waiting", "Exposing", "Reading", "Download", "Error"][
-                    self.camera.CameraState
-                ],
-                "Camera state",
-            ),
-            "PCNTCOMP": (None, "Function percent completed"),
-            "DATE-OBS": (None, "YYYY-MM-DDThh:mm:ss observation start [UT]"),
-            "JD": (None, "Julian date"),
-            "MJD": (None, "Modified Julian date"),
-            "EXPTIME": (None, "Exposure time [seconds]"),
-            "EXPOSURE": (None, "Exposure time [seconds]"),
-            "SUBEXP": (None, "Subexposure time [seconds]"),
-            "XBINNING": (self.camera.BinX, "Image binning factor in width"),
-            "YBINNING": (self.camera.BinY, "Image binning factor in height"),
-            "XORGSUBF": (self.camera.StartX, "Subframe X position"),
-            "YORGSUBF": (self.camera.StartY, "Subframe Y position"),
-            "XPOSSUBF": (self.camera.NumX, "Subframe X dimension"),
-            "YPOSSUBF": (self.camera.NumY, "Subframe Y dimension"),
-            "READOUT": (None, "Image readout mode"),
-            "READOUTM": (None, "Image readout mode"),
-            "FASTREAD": (None, "Fast readout mode"),
-            "GAIN": (None, "Electronic gain"),
-            "OFFSET": (None, "Image offset"),
-            "PULSGUID": (None, "Pulse guiding"),
-            "SENSTYP": (None, "Sensor type"),
-            "BAYERPAT": (None, "Bayer color pattern"),
-            "BAYOFFX": (None, "Bayer X offset"),
-            "BAYOFFY": (None, "Bayer Y offset"),
-            "HSINKT": (self.camera.HeatSinkTemperature, "Heat sink temperature [C]"),
-            "COOLERON": (None, "Whether the cooler is on"),
-            "COOLPOWR": (None, "Cooler power in percent"),
-            "SET-TEMP": (None, "Camera temperature setpoint [C]"),
-            "CCD-TEMP": (None, "Camera temperature [C]"),
-            "CMOS-TMP": (None, "Camera temperature [C]"),
-            "CAMNAME": (self.camera.Name, "Name of camera"),
-            "CAMERA": (self.camera.Name, "Name of camera"),
-            "CAMDRVER": (self.camera.DriverVersion, "Camera driver version"),
-            "CAMDRV": (self.camera.DriverInfo, "Camera driver info"),
-            "CAMINTF": (self.camera.InterfaceVersion, "Camera interface version"),
-            "CAMDESC": (self.camera.Description, "Camera description"),
-            "SENSOR": (self.camera.SensorName, "Name of sensor"),
-            "WIDTH": (self.camera.CameraXSize, "Width of sensor in pixels"),
-            "HEIGHT": (self.camera.CameraYSize, "Height of sensor in pixels"),
-            "XPIXSIZE": (self.camera.PixelSizeX, "Pixel width in microns"),
-            "YPIXSIZE": (self.camera.PixelSizeY, "Pixel height in microns"),
-            "MECHSHTR": (
-                self.camera.HasShutter,
-                "Whether a camera mechanical shutter is present",
-            ),
-            "ISSHUTTR": (
-                self.camera.HasShutter,
-                "Whether a camera mechanical shutter is present",
-            ),
-            "MINEXP": (self.camera.ExposureMin, "Minimum exposure time [seconds]"),
-            "MAXEXP": (self.camera.ExposureMax, "Maximum exposure time [seconds]"),
-            "EXPRESL": (
-                self.camera.ExposureResolution,
-                "Exposure time resolution [seconds]",
-            ),
-            "MAXBINSX": (self.camera.MaxBinX, "Maximum binning factor in width"),
-            "MAXBINSY": (self.camera.MaxBinY, "Maximum binning factor in height"),
-            "CANASBIN": (self.camera.CanAsymmetricBin, "Can asymmetric bin"),
-            "CANABRT": (self.camera.CanAbortExposure, "Can abort exposures"),
-            "CANSTP": (self.camera.CanStopExposure, "Can stop exposures"),
-            "CANCOOLP": (self.camera.CanGetCoolerPower, "Can get cooler power"),
-            "CANSETTE": (
-                self.camera.CanSetCCDTemperature,
-                "Can camera set temperature",
-            ),
-            "CANPULSE": (self.camera.CanPulseGuide, "Can camera pulse guide"),
-            "FULLWELL": (self.camera.FullWellCapacity, "Full well capacity [e-]"),
-            "MAXADU": (self.camera.MaxADU, "Camera maximum ADU value possible"),
-            "E-ADU": (self.camera.ElectronsPerADU, "Gain [e- per ADU]"),
-            "EGAIN": (self.camera.Gain, "Electronic gain"),
-            "CANFASTR": (self.camera.CanFastReadout, "Can camera fast readout"),
-            "READMDS": (None, "Possible readout modes"),
-            "GAINS": (None, "Possible electronic gains"),
-            "GAINMIN": (None, "Minimum possible electronic gain"),
-            "GAINMAX": (None, "Maximum possible electronic gain"),
-            "OFFSETS": (None, "Possible offsets"),
-            "OFFSETMN": (None, "Minimum possible offset"),
-            "OFFSETMX": (None, "Maximum possible offset"),
-            "CAMSUPAC": (self.camera.SupportedActions, "Camera supported actions"),
-        }
-        try:
-            info["Percent Completed"][0] = self.camera.PercentCompleted
-        except:
-            pass
+        info = _copy_cards(_CAMERA_INFO)
+        info["CAMREADY"][0] = self.camera.ImageReady
+        info["CAMSTATE"][0] = _CAMERA_STATES[self.camera.CameraState]
+        info["XBINNING"][0] = self.camera.BinX
+        info["YBINNING"][0] = self.camera.BinY
+        info["XORGSUBF"][0] = self.camera.StartX
+        info["YORGSUBF"][0] = self.camera.StartY
+        info["XPOSSUBF"][0] = self.camera.NumX
+        info["YPOSSUBF"][0] = self.camera.NumY
+        info["HSINKT"][0] = self.camera.HeatSinkTemperature
+        info["FULLWELL"][0] = self.camera.FullWellCapacity
+        info["E-ADU"][0] = self.camera.ElectronsPerADU
+        info["EGAIN"][0] = self.camera.Gain
+        info.update(self._device_static_info(self.camera, _CAMERA_STATIC_INFO))
+        _read_optional_info(self.camera, info, _CAMERA_OPTIONAL_INFO)
         try:
             info["DATE-OBS"][0] = self.camera.LastExposureStartTime
-            info["JD"][0] = astrotime.Time(self.camera.LastExposureStartTime).jd
-            info["MJD"][0] = astrotime.Time(self.camera.LastExposureStartTime).mjd
-        except:
-            pass
-        try:
-            info["EXPTIME"][0] = self.camera.ExposureTime
-            info["EXPOSURE"][0] = self.camera.ExposureTime
-        except:
-            pass
-        try:
-            info["SUBEXP"][0] = self.camera.SubExposureDuration
-        except:
+            start_time = astrotime.Time(info["DATE-OBS"][0])
+            info["JD"][0] = start_time.jd
+            info["MJD"][0] = start_time.mjd
+        except Exception:
             pass
-        info["CANFAST"][0] = self.camera.CanFastReadout
-        if self.camera.CanFastReadout:
+        if self._capability(self.camera, "CanFastReadout"):
             info["READOUT"][0] = self.camera.ReadoutModes[self.camera.ReadoutMode]
             info["READOUTM"][0] = self.camera.ReadoutModes[self.camera.ReadoutMode]
             info["FASTREAD"][0] = self.camera.FastReadout
             info["READMDS"][0] = self.camera.ReadoutModes
-            info["SENSTYP"][0] = [
-                "Monochrome, Color, \
-                RGGB, CMYG, CMYG2, LRGB"
-            ][self.camera.SensorType]
+            info["SENSTYP"][0] = _SENSOR_TYPES[self.camera.SensorType]
             if not self.camera.SensorType in (0, 1):
                 info["BAYERPAT"][0] = self.camera.SensorType
                 info["BAYOFFX"][0] = self.camera.BayerOffsetX
@@ -2829,575 +2732,249 @@ class Observatory:
         try:
             info["GAINS"][0] = self.camera.Gains
             info["GAIN"][0] = self.camera.Gains[self.camera.Gain]
-        except:
+        except Exception:
             try:
                 info["GAINMIN"][0] = self.camera.GainMin
                 info["GAINMAX"][0] = self.camera.GainMax
                 info["GAIN"][0] = self.camera.Gain
-            except:
+            except Exception:
                 pass
         try:
             info["OFFSETS"][0] = self.camera.Offsets
             info["OFFSET"][0] = self.camera.Offsets[self.camera.Offset]
-        except:
+        except Exception:
             try:
                 info["OFFSETMN"][0] = self.camera.OffsetMin
                 info["OFFSETMX"][0] = self.camera.OffsetMax
                 info["OFFSET"][0] = self.camera.Offset
-            except:
+            except Exception:
                 pass
-        info["CANPULSE"][0] = self.camera.CanPulseGuide
-        if self.camera.CanPulseGuide:
+        if self._capability(self.camera, "CanPulseGuide"):
             info["PULSGUID"][0] = self.camera.IsPulseGuiding
-        try:
-            info["COOLERON"][0] = self.camera.CoolerOn
-        except:
-            pass
-        info["CANCOOLP"][0] = self.camera.CanGetCoolerPower
-        if self.camera.CanGetCoolerPower:
+        if self._capability(self.camera, "CanGetCoolerPower"):
             info["COOLPOWR"][0] = self.camera.CoolerPower
-        info["CANSETTE"][0] = self.camera.CanSetCCDTemperature
-        if self.camera.CanSetCCDTemperature:
+        if self._capability(self.camera, "CanSetCCDTemperature"):
             info["SET-TEMP"][0] = self.camera.SetCCDTemperature
-        try:
-            info["CCD-TEMP"][0] = self.camera.CCDTemperature
-            info["CMOS-TMP"][0] = self.camera.CMOSTemperature
-        except:
-            pass
 
-        return info
+        return _freeze_cards(info)
 
     @property
+    @_timed
     def cover_calibrator_info(self):
         logger.debug("Observatory.cover_calibrator_info() called")
         if self.cover_calibrator is not None:
             try:
                 self.cover_calibrator.Connected = True
-            except:
+            except Exception:
                 return {"CCALCONN": (False, "Cover calibrator connected")}
-            info = {
-                "CCALCONN": (True, "Cover calibrator connected"),
-                "CALSTATE": (self.cover_calibrator.CalibratorState, "Calibrator state"),
-                "COVSTATE": (self.cover_calibrator.CoverState, "Cover state"),
-                "BRIGHT": (None, "Brightness of cover calibrator"),
-                "CCNAME": (self.cover_calibrator.Name, "Cover calibrator name"),
-                "COVCAL": (self.cover_calibrator.Name, "Cover calibrator name"),
-                "CCDRVER": (
-                    self.cover_calibrator.DriverVersion,
-                    "Cover calibrator driver version",
-                ),
-                "CCDRV": (
-                    self.cover_calibrator.DriverInfo,
-                    "Cover calibrator driver info",
-                ),
-                "CCINTF": (
-                    self.cover_calibrator.InterfaceVersion,
-                    "Cover calibrator interface version",
-                ),
-                "CCDESC": (
-                    self.cover_calibrator.Description,
-                    "Cover calibrator description",
-                ),
-                "MAXBRITE": (
-                    self.cover_calibrator.MaxBrightness,
-                    "Cover calibrator maximum possible brightness",
-                ),
-                "CCSUPAC": (
-                    self.cover_calibrator.SupportedActions,
-                    "Cover calibrator supported actions",
-                ),
-            }
-            try:
-                info["BRIGHT"][0] = self.cover_calibrator.Brightness
-            except:
-                pass
-            return info
+            info = _copy_cards(_COVER_CALIBRATOR_INFO)
+            info["CALSTATE"][0] = self.cover_calibrator.CalibratorState
+            info["COVSTATE"][0] = self.cover_calibrator.CoverState
+            info.update(
+                self._device_static_info(
+                    self.cover_calibrator, _COVER_CALIBRATOR_STATIC_INFO
+                )
+            )
+            _read_optional_info(
+                self.cover_calibrator, info, _COVER_CALIBRATOR_OPTIONAL_INFO
+            )
+            return _freeze_cards(info)
         else:
             return {"CCALCONN": (False, "Cover calibrator connected")}
 
     @property
+    @_timed
     def dome_info(self):
         logger.debug("Observatory.dome_info() called")
         if self.dome is not None:
             try:
                 self.dome.Connected = True
-            except:
+            except Exception:
                 return {"DOMECONN": (False, "Dome connected")}
-            info = {
-                "DOMECONN": (True, "Dome connected"),
-                "DOMEALT": (None, "Dome altitude [deg]"),
-                "DOMEAZ": (None, "Dome azimuth [deg]"),
-                "DOMESHUT": (None, "Dome shutter status"),
-                "DOMESLEW": (self.dome.Slewing, "Dome slew status"),
-                "DOMESLAV": (None, "Dome slave status"),
-                "DOMEHOME": (None, "Dome home status"),
-                "DOMEPARK": (None, "Dome park status"),
-                "DOMENAME": (self.dome.Name, "Dome name"),
-                "DOMDRVER": (self.dome.DriverVersion, "Dome driver version"),
-                "DOMEDRV": (self.dome.DriverInfo, "Dome driver info"),
-                "DOMEINTF": (self.dome.InterfaceVersion, "Dome interface version"),
-                "DOMEDESC": (self.dome.Description, "Dome description"),
-                "DOMECALT": (self.dome.CanSetAltitude, "Can dome set altitude"),
-                "DOMECAZ": (self.dome.CanSetAzimuth, "Can dome set azimuth"),
-                "DOMECSHT": (self.dome.CanSetShutter, "Can dome set shutter"),
-                "DOMECSLV": (self.dome.CanSlave, "Can dome slave to mount"),
-                "DCANSYNC": (
-                    self.dome.CanSyncAzimuth,
-                    "Can dome sync to azimuth value",
-                ),
-                "DCANHOME": (self.dome.CanFindHome, "Can dome home"),
-                "DCANPARK": (self.dome.CanPark, "Can dome park"),
-                "DCANSPRK": (self.dome.CanSetPark, "Can dome set park"),
-                "DOMSUPAC": (self.dome.SupportedActions, "Dome supported actions"),
-            }
-            try:
-                info["DOMEALT"][0] = self.dome.Altitude
-            except:
-                pass
-            try:
-                info["DOMEAZ"][0] = self.dome.Azimuth
-            except:
-                pass
-            try:
-                info["DOMESHUT"][0] = self.dome.ShutterStatus
-            except:
-                pass
-            try:
-                info["DOMESLAV"][0] = self.dome.Slaved
-            except:
-                pass
-            try:
-                info["DOMEHOME"][0] = self.dome.AtHome
-            except:
-                pass
-            try:
-                info["DOMEPARK"][0] = self.dome.AtPark
-            except:
-                pass
-            return info
+            info = _copy_cards(_DOME_INFO)
+            info["DOMESLEW"][0] = self.dome.Slewing
+            info.update(self._device_static_info(self.dome, _DOME_STATIC_INFO))
+            _read_optional_info(self.dome, info, _DOME_OPTIONAL_INFO)
+            return _freeze_cards(info)
         else:
             return {"DOMECONN": (False, "Dome connected")}
 
     @property
+    @_timed
     def filter_wheel_info(self):
         logger.debug("Observatory.filter_wheel_info() called")
         if self.filter_wheel is not None:
             try:
                 self.filter_wheel.Connected = True
-            except:
+            except Exception:
                 return {"FWCONN": (False, "Filter wheel connected")}
+            static_info = self._device_static_info(
+                self.filter_wheel, _FILTER_WHEEL_STATIC_INFO
+            )
+            names = static_info["FWALLNAM"][0]
+            offsets = static_info["FWALLOFF"][0]
+            position = self.filter_wheel.Position
+
+            # The position is -1 while the wheel is moving
+            moving = position < 0
             info = {
                 "FWCONN": (True, "Filter wheel connected"),
-                "FWPOS": (self.filter_wheel.Position, "Filter wheel position"),
+                "FWPOS": (position, "Filter wheel position"),
                 "FWNAME": (
-                    self.filter_wheel.Names[self.filter_wheel.Position],
+                    None if moving else names[position],
                     "Filter wheel name (from filter wheel object configuration)",
                 ),
                 "FILTER": (
-                    self.filters[self.filter_wheel.Position],
+                    None if moving else self.filters[position],
                     "Filter name (from pyscope observatory object configuration)",
                 ),
                 "FOCOFFCG": (
-                    self.filter_wheel.FocusOffsets[self.filter_wheel.Position],
+                    None if moving else offsets[position],
                     "Filter focus offset (from filter wheel object configuration)",
                 ),
-                "FWNAME": (self.filter_wheel.Name, "Filter wheel name"),
-                "FWDRVER": (
-                    self.filter_wheel.DriverVersion,
-                    "Filter wheel driver version",
-                ),
-                "FWDRV": (self.filter_wheel.DriverInfo, "Filter wheel driver info"),
-                "FWINTF": (
-                    self.filter_wheel.InterfaceVersion,
-                    "Filter wheel interface version",
-                ),
-                "FWDESC": (self.filter_wheel.Description, "Filter wheel description"),
-                "FWALLNAM": (self.filter_wheel.Names, "Filter wheel names"),
-                "FWALLOFF": (
-                    self.filter_wheel.FocusOffsets,
-                    "Filter wheel focus offsets",
-                ),
-                "FWSUPAC": (
-                    self.filter_wheel.SupportedActions,
-                    "Filter wheel supported actions",
-                ),
-            }
-            return info
-        else:
-            return {"FWCONN": (False, "Filter wheel connected")}
-
-    @property
-    def focuser_info(self):
-        logger.debug("Observatory.focuser_info() called")
-        if self.focuser is not None:
-            try:
-                self.focuser.Connected = True
-            except:
-                return {"FOCCONN": (False, "Focuser connected")}
-            info = {
-                "FOCCONN": (True, "Focuser connected"),
-                "FOCPOS": (None, "Focuser position"),
-                "FOCMOV": (self.focuser.IsMoving, "Focuser moving"),
-                "TEMPCOMP": (None, "Focuser temperature compensation"),
-                "FOCTEMP": (None, "Focuser temperature"),
-                "FOCNAME": (self.focuser.Name, "Focuser name"),
-                "FOCDRVER": (self.focuser.DriverVersion, "Focuser driver version"),
-                "FOCDRV": (self.focuser.DriverInfo, "Focuser driver info"),
-                "FOCINTF": (self.focuser.InterfaceVersion, "Focuser interface version"),
-                "FOCDESC": (self.focuser.Description, "Focuser description"),
-                "FOCSTEP": (None, "Focuser step size"),
-                "FOCABSOL": (
-                    self.focuser.Absolute,
-                    "Can focuser move to absolute position",
-                ),
-                "FOCMAXIN": (self.focuser.MaxIncrement, "Focuser maximum increment"),
-                "FOCMAXST": (self.focuser.MaxStep, "Focuser maximum step"),
-                "FOCTEMPC": (
-                    self.focuser.TempCompAvailable,
-                    "Focuser temperature compensation available",
-                ),
             }
-            try:
-                info["FOCPOS"][0] = self.focuser.Position
-            except:
-                pass
-            try:
-                info["TEMPCOMP"][0] = self.focuser.TempComp
-            except:
-                pass
-            try:
-                info["FOCTEMP"][0] = self.focuser.Temperature
-            except:
-                pass
-            try:
-                info["FOCSTEP"][0] = self.focuser.StepSize
-            except:
-                pass
+            info.update(static_info)
             return info
-        else:
-            return {"FOCCONN": (False, "Focuser connected")}
-
-    @property
-    def observatory_info(self):
-        logger.debug("Observatory.observatory_info() called")
-        return {
-            "OBSNAME": (self.site_name, "Observatory name"),
-            "OBSINSTN": (self.instrument_name, "Instrument name"),
-            "OBSINSTD": (self.instrument_description, "Instrument description"),
-            "OBSLAT": (self.latitude, "Observatory latitude"),
-            "OBSLONG": (self.longitude, "Observatory longitude"),
-            "OBSELEV": (self.elevation, "Observatory altitude"),
-            "OBSDIA": (self.diameter, "Observatory diameter"),
-            "OBSFL": (self.focal_length, "Observatory focal length"),
-            "XPIXSCAL": (self.pixel_scale[0], "Observatory x-pixel scale"),
-            "YPIXSCAL": (self.pixel_scale[1], "Observatory y-pixel scale"),
-        }
-
-    @property
-    def observing_conditions_info(self):
-        logger.debug("Observatory.observing_conditions_info() called")
-        if self.observing_conditions is not None:
-            try:
-                self.observing_conditions.Connected = True
-            except:
-                return {"WXCONN": (False, "Observing conditions connected")}
-            info = {
-                "WXCONN": (True, "Observing conditions connected"),
-                "WXAVGTIM": (
-                    self.observing_conditions.AveragePeriod,
-                    "Observing conditions average period",
-                ),
-                "WXCLD": (None, "Observing conditions cloud cover"),
-                "WXCLDUPD": (None, "Observing conditions cloud cover last updated"),
-                "WCCLDD": (None, "Observing conditions cloud cover sensor description"),
-                "WXDEW": (None, "Observing conditions dew point"),
-                "WXDEWUPD": (None, "Observing conditions dew point last updated"),
-                "WXDEWD": (None, "Observing conditions dew point sensor description"),
-                "WXHUM": (None, "Observing conditions humidity"),
-                "WXHUMUPD": (None, "Observing conditions humidity last updated"),
-                "WXHUMD": (None, "Observing conditions humidity sensor description"),
-                "WXPRES": (None, "Observing conditions pressure"),
-                "WXPREUPD": (None, "Observing conditions pressure last updated"),
-                "WXPRESD": (None, "Observing conditions pressure sensor description"),
-                "WXRAIN": (None, "Observing conditions rain rate"),
-                "WXRAIUPD": (None, "Observing conditions rain rate last updated"),
-                "WXRAIND": (None, "Observing conditions rain rate sensor description"),
-                "WXSKY": (None, "Observing conditions sky brightness"),
-                "WXSKYUPD": (None, "Observing conditions sky brightness last updated"),
-                "WXSKYD": (
-                    None,
-                    "Observing conditions sky brightness sensor description",
-                ),
-                "WXSKYQ": (None, "Observing conditions sky quality"),
-                "WXSKYQUP": (None, "Observing conditions sky quality last updated"),
-                "WXSKYQD": (
-                    None,
-                    "Observing conditions sky quality sensor description",
-                ),
-                "WXSKYTMP": (None, "Observing conditions sky temperature"),
-                "WXSKTUPD": (None, "Observing conditions sky temperature last updated"),
-                "WXSKTD": (
-                    None,
-                    "Observing conditions sky temperature sensor description",
-                ),
-                "WXFWHM": (None, "Observing conditions seeing"),
-                "WXFWHUP": (None, "Observing conditions seeing last updated"),
-                "WXFWHMD": (None, "Observing conditions seeing sensor description"),
-                "WXTEMP": (None, "Observing conditions temperature"),
-                "WXTEMUPD": (None, "Observing conditions temperature last updated"),
-                "WXTEMPD": (
-                    None,
-                    "Observing conditions temperature sensor description",
-                ),
-                "WXWIND": (None, "Observing conditions wind speed"),
-                "WXWINUPD": (None, "Observing conditions wind speed last updated"),
-                "WXWINDD": (None, "Observing conditions wind speed sensor description"),
-                "WXWINDIR": (None, "Observing conditions wind direction"),
-                "WXWDIRUP": (None, "Observing conditions wind direction last updated"),
-                "WXWDIRD": (
-                    None,
-                    "Observing conditions wind direction sensor description",
-                ),
-                "WXWDGST": (
-                    None,
-                    "Observing conditions wind gust over last two minutes",
-                ),
-                "WXWGDUPD": (None, "Observing conditions wind gust last updated"),
-                "WXWGDSTD": (None, "Observing conditions wind gust sensor description"),
-                "WXNAME": (self.observing_conditions.Name, "Observing conditions name"),
-                "WXDRVER": (
-                    self.observing_conditions.DriverVersion,
-                    "Observing conditions driver version",
-                ),
-                "WXDRIV": (
-                    self.observing_conditions.DriverInfo,
-                    "Observing conditions driver info",
-                ),
-                "WXINTF": (
-                    self.observing_conditions.InterfaceVersion,
-                    "Observing conditions interface version",
-                ),
-                "WXDESC": (
-                    self.observing_conditions.Description,
-                    "Observing conditions description",
-                ),
-            }
-            try:
-                info["WXCLD"][0] = self.observing_conditions.CloudCover
-                info["WXCLDUPD"][0] = self.observing_conditions.TimeSinceLastUpdate(
-                    "CloudCover"
-                )
-                info["WXCLDD"][0] = self.observing_conditions.SensorDescription(
-                    "CloudCover"
-                )
-            except:
-                pass
-            try:
-                info["WXDEW"][0] = self.observing_conditions.DewPoint
-                info["WXDEWUPD"][0] = self.observing_conditions.TimeSinceLastUpdate(
-                    "DewPoint"
-                )
-                info["WXDEWD"][0] = self.observing_conditions.SensorDescription(
-                    "DewPoint"
-                )
-            except:
-                pass
-            try:
-                info["WXHUM"][0] = self.observing_conditions.Humidity
-                info["WXHUMUPD"][0] = self.observing_conditions.TimeSinceLastUpdate(
-                    "Humidity"
-                )
-                info["WXHUMD"][0] = self.observing_conditions.SensorDescription(
-                    "Humidity"
-                )
-            except:
-                pass
-            try:
-                info["WXPRES"][0] = self.observing_conditions.Pressure
-                info["WXPREUPD"][0] = self.observing_conditions.TimeSinceLastUpdate(
-                    "Pressure"
-                )
-                info["WXPRESD"][0] = self.observing_conditions.SensorDescription(
-                    "Pressure"
-                )
-            except:
-                pass
-            try:
-                info["WXRAIN"][0] = self.observing_conditions.RainRate
-                info["WXRAIUPD"][0] = self.observing_conditions.TimeSinceLastUpdate(
-                    "RainRate"
-                )
-                info["WXRAIND"][0] = self.observing_conditions.SensorDescription(
-                    "RainRate"
-                )
-            except:
-                pass
-            try:
-                info["WXSKY"][0] = self.observing_conditions.SkyBrightness
-                info["WXSKYUPD"][0] = self.observing_conditions.TimeSinceLastUpdate(
-                    "SkyBrightness"
-                )
-                info["WXSKYD"][0] = self.observing_conditions.SensorDescription(
-                    "SkyBrightness"
-                )
-            except:
-                pass
-            try:
-                info["WXSKYQ"][0] = self.observing_conditions.SkyQuality
-                info["WXSKYQUP"][0] = self.observing_conditions.TimeSinceLastUpdate(
-                    "SkyQuality"
-                )
-                info["WXSKYQD"][0] = self.observing_conditions.SensorDescription(
-                    "SkyQuality"
-                )
-            except:
-                pass
-            try:
-                info["WXSKYTMP"][0] = self.observing_conditions.SkyTemperature
-                info["WXSKTUPD"][0] = self.observing_conditions.TimeSinceLastUpdate(
-                    "SkyTemperature"
-                )
-                info["WXSKTD"][0] = self.observing_conditions.SensorDescription(
-                    "SkyTemperature"
-                )
-            except:
-                pass
-            try:
-                info["WXFWHM"][0] = self.observing_conditions.Seeing
-                info["WXFWHUP"][0] = self.observing_conditions.TimeSinceLastUpdate(
-                    "Seeing"
-                )
-                info["WXFWHMD"][0] = self.observing_conditions.SensorDescription(
-                    "Seeing"
-                )
-            except:
-                pass
-            try:
-                info["WXTEMP"][0] = self.observing_conditions.Temperature
-                info["WXTEMUPD"][0] = self.observing_conditions.TimeSinceLastUpdate(
-                    "Temperature"
-                )
-                info["WXTEMPD"][0] = self.observing_conditions.SensorDescription(
-                    "Temperature"
-                )
-            except:
-                pass
-            try:
-                info["WXWIND"][0] = self.observing_conditions.WindSpeed
-                info["WXWINUPD"][0] = self.observing_conditions.TimeSinceLastUpdate(
-                    "WindSpeed"
-                )
-                info["WXWINDD"][0] = self.observing_conditions.SensorDescription(
-                    "WindSpeed"
-                )
-            except:
-                pass
+        else:
+            return {"FWCONN": (False, "Filter wheel connected")}
+
+    @property
+    @_timed
+    def focuser_info(self):
+        logger.debug("Observatory.focuser_info() called")
+        if self.focuser is not None:
             try:
-                info["WXWINDIR"][0] = self.observing_conditions.WindDirection
-                info["WXWDIRUP"][0] = self.observing_conditions.TimeSinceLastUpdate(
-                    "WindDirection"
-                )
-                info["WXWDIRD"][0] = self.observing_conditions.SensorDescription(
-                    "WindDirection"
-                )
-            except:
-                pass
+                self.focuser.Connected = True
+            except Exception:
+                return {"FOCCONN": (False, "Focuser connected")}
+            static_info = self._device_static_info(self.focuser, _FOCUSER_STATIC_INFO)
+
+            # Position and TempComp are only defined when the focuser says so
+            info = {
+                "FOCCONN": (True, "Focuser connected"),
+                "FOCPOS": (
+                    self.focuser.Position if static_info["FOCABSOL"][0] else None,
+                    "Focuser position",
+                ),
+                "FOCMOV": (self.focuser.IsMoving, "Focuser moving"),
+                "TEMPCOMP": (
+                    self.focuser.TempComp if static_info["FOCTEMPC"][0] else None,
+                    "Focuser temperature compensation",
+                ),
+                "FOCTEMP": (None, "Focuser temperature"),
+                "FOCSTEP": (None, "Focuser step size"),
+            }
+            info.update(static_info)
+            for key, name in (("FOCTEMP", "Temperature"), ("FOCSTEP", "StepSize")):
+                try:
+                    info[key] = (getattr(self.focuser, name), info[key][1])
+                except Exception:
+                    pass
+            return info
+        else:
+            return {"FOCCONN": (False, "Focuser connected")}
+
+    @property
+    def observatory_info(self):
+        logger.debug("Observatory.observatory_info() called")
+        return {
+            "OBSNAME": (self.site_name, "Observatory name"),
+            "OBSINSTN": (self.instrument_name, "Instrument name"),
+            "OBSINSTD": (self.instrument_description, "Instrument description"),
+            "OBSLAT": (self.latitude, "Observatory latitude"),
+            "OBSLONG": (self.longitude, "Observatory longitude"),
+            "OBSELEV": (self.elevation, "Observatory altitude"),
+            "OBSDIA": (self.diameter, "Observatory diameter"),
+            "OBSFL": (self.focal_length, "Observatory focal length"),
+            "XPIXSCAL": (self.pixel_scale[0], "Observatory x-pixel scale"),
+            "YPIXSCAL": (self.pixel_scale[1], "Observatory y-pixel scale"),
+        }
+
+    @property
+    @_timed
+    def observing_conditions_info(self):
+        logger.debug("Observatory.observing_conditions_info() called")
+
+        # The observing conditions thread keeps a read-only snapshot from its
+        # last refresh. Callers get a copy, as they do without the thread
+        snapshot = self._observing_conditions_snapshot
+        if snapshot is not None:
+            return dict(snapshot)
+        return self._read_observing_conditions_info()
+
+    def _read_observing_conditions_info(self):
+        """Reads the observing conditions header cards from the driver"""
+        if self.observing_conditions is not None:
             try:
-                info["WXWDGST"][0] = self.observing_conditions.WindGust
-                info["WXWGDUPD"][0] = self.observing_conditions.TimeSinceLastUpdate(
-                    "WindGust"
-                )
-                info["WXWGDSTD"][0] = self.observing_conditions.SensorDescription(
-                    "WindGust"
+                self.observing_conditions.Connected = True
+            except Exception:
+                return {"WXCONN": (False, "Observing conditions connected")}
+            info = {
+                "WXCONN": (True, "Observing conditions connected"),
+                "WXAVGTIM": (
+                    self.observing_conditions.AveragePeriod,
+                    "Observing conditions average period",
+                ),
+            }
+            info.update(_OBSERVING_CONDITIONS_INFO)
+            info.update(
+                self._device_static_info(
+                    self.observing_conditions, _OBSERVING_CONDITIONS_STATIC_INFO
                 )
-            except:
-                pass
+            )
+            for (_, _, *keys), readings in zip(
+                _OBSERVING_CONDITIONS_SENSORS, self._read_sensors()
+            ):
+                if readings is not None:
+                    for key, value in zip(keys, readings):
+                        info[key] = (value, info[key][1])
             return info
         else:
             return {"WXCONN": (False, "Observing conditions connected")}
 
     @property
+    @_timed
     def rotator_info(self):
         logger.debug("Observatory.rotator_info() called")
         if self.rotator is not None:
             try:
                 self.rotator.Connected = True
-            except:
+            except Exception:
                 return {"ROTCONN": (False, "Rotator connected")}
-            info = {
-                "ROTCONN": (True, "Rotator connected"),
-                "ROTPOS": (self.rotator.Position, "Rotator position"),
-                "ROTMECHP": (
-                    self.rotator.MechanicalPosition,
-                    "Rotator mechanical position",
-                ),
-                "ROTTARGP": (self.rotator.TargetPosition, "Rotator target position"),
-                "ROTMOV": (self.rotator.IsMoving, "Rotator moving"),
-                "ROTREVSE": (self.rotator.Reverse, "Rotator reverse"),
-                "ROTNAME": (self.rotator.Name, "Rotator name"),
-                "ROTDRVER": (self.rotator.DriverVersion, "Rotator driver version"),
-                "ROTDRV": (self.rotator.DriverInfo, "Rotator driver name"),
-                "ROTINTFC": (
-                    self.rotator.InterfaceVersion,
-                    "Rotator interface version",
-                ),
-                "ROTDESC": (self.rotator.Description, "Rotator description"),
-                "ROTSTEP": (None, "Rotator step size [degrees]"),
-                "ROTCANRV": (self.rotator.CanReverse, "Can rotator reverse"),
-                "ROTSUPAC": (
-                    self.rotator.SupportedActions,
-                    "Rotator supported actions",
-                ),
-            }
-            try:
-                info["ROTSTEP"][0] = self.rotator.StepSize
-            except:
-                pass
+            info = {"ROTCONN": (True, "Rotator connected")}
+            info.update(_read_device_info(self.rotator, _ROTATOR_DYNAMIC_INFO))
+            info.update(self._device_static_info(self.rotator, _ROTATOR_STATIC_INFO))
             return info
         else:
             return {"ROTCONN": (False, "Rotator connected")}
 
     @property
+    @_timed
     def safety_monitor_info(self, index=None):
         logger.debug("Observatory.safety_monitor_info() called")
         if self.safety_monitor is not None:
             all_info = []
-            for i in range(len(self.safety_monitor)):
+            for i, safety_monitor in enumerate(self.safety_monitor):
                 try:
-                    self.safety_monitor[i].Connected = True
-                except:
-                    info = {"SM%iCONN" % i: (False, "Safety monitor connected")}
+                    safety_monitor.Connected = True
+                except Exception:
+                    all_info.append(
+                        {("SM%iCONN" % i): (False, "Safety monitor connected")}
+                    )
+                    continue
                 info = {
                     ("SM%iCONN" % i): (True, "Safety monitor connected"),
-                    ("SM%iISSAF" % i): (
-                        self.safety_monitor[i].IsSafe,
-                        "Safety monitor safe",
-                    ),
-                    ("SM%iNAME" % i): (
-                        self.safety_monitor[i].Name,
-                        "Safety monitor name",
-                    ),
-                    ("SM%iDRVER" % i): (
-                        self.safety_monitor[i].DriverVersion,
-                        "Safety monitor driver version",
-                    ),
-                    ("SM%iDRV" % i): (
-                        self.safety_monitor[i].DriverInfo,
-                        "Safety monitor driver name",
-                    ),
-                    ("SM%iINTF" % i): (
-                        self.safety_monitor[i].InterfaceVersion,
-                        "Safety monitor interface version",
-                    ),
-                    ("SM%iDESC" % i): (
-                        self.safety_monitor[i].Description,
-                        "Safety monitor description",
-                    ),
-                    ("SM%iSUPAC" % i): (
-                        self.safety_monitor[i].SupportedActions,
-                        "Safety monitor supported actions",
-                    ),
+                    ("SM%iISSAF" % i): (safety_monitor.IsSafe, "Safety monitor safe"),
                 }
+                info.update(
+                    self._device_static_info(
+                        safety_monitor,
+                        [
+                            (key % i, name, comment)
+                            for key, name, comment in _SAFETY_MONITOR_STATIC_INFO
+                        ],
+                    )
+                )
                 all_info.append(info)
         else:
             return {"SM0CONN": (False, "Safety monitor connected")}
@@ -3410,70 +2987,31 @@ class Observatory:
             return all_info
 
     @property
+    @_timed
     def switch_info(self, index=None):
         logger.debug("Observatory.switch_info() called")
         if self.switch is not None:
             all_info = []
-            for i in range(len(self.switch)):
+            for i, switch in enumerate(self.switch):
                 try:
-                    self.switch.Connected = True
-                except:
-                    info = {("SW%iCONN" % i): (False, "Switch connected")}
-                info = {
-                    ("SW%iCONN" % i): (True, "Switch connected"),
-                    ("SW%iNAME" % i): (self.switch[i].Name, "Switch name"),
-                    ("SW%iDRVER" % i): (
-                        self.switch[i].DriverVersion,
-                        "Switch driver version",
-                    ),
-                    ("SW%iDRV" % i): (self.switch[i].DriverInfo, "Switch driver name"),
-                    ("SW%iINTF" % i): (
-                        self.switch[i].InterfaceVersion,
-                        "Switch interface version",
-                    ),
-                    ("SW%iDESC" % i): (
-                        self.switch[i].Description,
-                        "Switch description",
-                    ),
-                    ("SW%iSUPAC" % i): (
-                        self.switch[i].SupportedActions,
-                        "Switch supported actions",
-                    ),
-                    ("SW%iMAXSW" % i): (
-                        self.switch[i].MaxSwitch,
-                        "Switch maximum switch",
-                    ),
-                }
-                for j in range(self.switch[i].MaxSwitch):
-                    info[("SW%iSW%iNM" % (i, j))] = (
-                        self.switch[i].GetSwitchName(j),
-                        "Switch %i Device %i name" % (i, j),
-                    )
-                    info[("SW%iSW%iDS" % (i, j))] = (
-                        self.switch[i].GetSwitchDescription(j),
-                        "Switch %i Device %i description" % (i, j),
-                    )
+                    switch.Connected = True
+                except Exception:
+                    all_info.append({("SW%iCONN" % i): (False, "Switch connected")})
+                    continue
+                static_info = self._switch_static_info(i)
+
+                # Only the state and value of each port change between reads
+                info = {("SW%iCONN" % i): (True, "Switch connected")}
+                for j in range(static_info["SW%iMAXSW" % i][0]):
                     info[("SW%iSW%i" % (i, j))] = (
-                        self.switch[i].GetSwitch(j),
+                        switch.GetSwitch(j),
                         "Switch %i Device %i state" % (i, j),
                     )
                     info[("SW%iSW%iVA" % (i, j))] = (
-                        self.switch[i].GetSwitchValue(j),
+                        switch.GetSwitchValue(j),
                         "Switch %i Device %i value" % (i, j),
                     )
-                    info[("SW%iSW%iMN" % (i, j))] = (
-                        self.switch[i].MinSwitchValue(j),
-                        "Switch %i Device %i minimum value" % (i, j),
-                    )
-                    info[("SW%iSW%iMX" % (i, j))] = (
-                        self.switch[i].MaxSwitchValue(j),
-                        "Switch %i Device %i maximum value" % (i, j),
-                    )
-                    info[("SW%iSW%iST" % (i, j))] = (
-                        self.switch[i].SwitchStep(j),
-                        "Switch %i Device %i step" % (i, j),
-                    )
-
+                info.update(static_info)
                 all_info.append(info)
         else:
             return {"SW0CONN": (False, "Switch connected")}
@@ -3486,287 +3024,68 @@ class Observatory:
             return all_info
 
     @property
+    @_timed
     def telescope_info(self):
         logger.debug("Observatory.telescope_info() called")
+        telescope = self.telescope
         try:
-            self.telescope.Connected = True
-        except:
+            telescope.Connected = True
+        except Exception:
             return {"TELCONN": (False, "Telescope connected")}
-        info = {
-            "TELCONN": (True, "Telescope connected"),
-            "TELHOME": (self.telescope.AtHome, "Is telescope at home position"),
-            "TELPARK": (self.telescope.AtPark, "Is telescope at park position"),
-            "TELALT": (None, "Telescope altitude [degrees]"),
-            "TELAZ": (
-                None,
-                "Telescope azimuth North-referenced positive East (clockwise) [degrees]",
-            ),
-            "TELRA": (
-                self.telescope.RightAscension,
-                "Telescope right ascension in TELEQSYS coordinate frame [hours]",
-            ),
-            "TELDEC": (
-                self.telescope.Declination,
-                "Telescope declination in TELEQSYS coordinate frame [degrees]",
-            ),
-            "TELRAIC": (
-                None,
-                "Telescope right ascension in ICRS coordinate frame [hours]",
-            ),
-            "TELDECIC": (
-                None,
-                "Telescope declination in ICRS coordinate frame [degrees]",
-            ),
-            "TARGRA": (
-                None,
-                "Telescope target right ascension in TELEQSYS coordinate frame [hours]",
-            ),
-            "TARGDEC": (
-                None,
-                "Telescope target declination in TELEQSYS coordinate frame [degrees]",
-            ),
-            "OBJCTALT": (None, "Object altitude [degrees]"),
-            "OBJCTAZ": (
-                None,
-                "Object azimuth North-referenced positive East (clockwise) [degrees]",
-            ),
-            "OBJCTHA": (None, "Object hour angle [hours]"),
-            "AIRMASS": (None, "Airmass"),
-            "MOONANGL": (None, "Angle between object and moon [degrees]"),
-            "MOONPHAS": (None, "Moon phase [percent]"),
-            "TELSLEW": (None, "Is telescope slewing"),
-            "TELSETT": (None, "Telescope settling time [seconds]"),
-            "TELPIER": (None, "Telescope pier side"),
-            "TELTRACK": (None, "Is telescope tracking"),
-            "TELTRKRT": (None, "Telescope tracking rate (sidereal)"),
-            "TELOFFRA": (
-                None,
-                "Telescope RA tracking offset [seconds per sidereal second]",
-            ),
-            "TELOFFDC": (
-                None,
-                "Telescope DEC tracking offset [arcseconds per sidereal second]",
-            ),
-            "TELPULSE": (None, "Is telescope pulse guiding"),
-            "TELGUIDR": (None, "Telescope pulse guiding RA rate [degrees/sec]"),
-            "TELGUIDD": (None, "Telescope pulse guiding DEC rate [arcseconds/sec]"),
-            "TELDOREF": (None, "Does telescope do refraction"),
-            "TELLST": (
-                self.telescope.SiderealTime,
-                "Telescope local sidereal time [hours]",
-            ),
-            "TELUT": (None, "Telescope UTC date"),
-            "TELNAME": (self.telescope.Name, "Telescope name"),
-            "TELDRVER": (self.telescope.DriverVersion, "Telescope driver version"),
-            "TELDRV": (self.telescope.DriverInfo, "Telescope driver name"),
-            "TELINTF": (self.telescope.InterfaceVersion, "Telescope interface version"),
-            "TELDESC": (self.telescope.Description, "Telescope description"),
-            "TELAPAR": (None, "Telescope aperture area [m^2]"),
-            "TELDIAM": (None, "Telescope aperture diameter [m]"),
-            "TELFOCL": (None, "Telescope focal length [m]"),
-            "TELELEV": (None, "Telescope elevation [degrees]"),
-            "TELLAT": (None, "Telescope latitude [degrees]"),
-            "TELLONG": (None, "Telescope longitude [degrees]"),
-            "TELALN": (None, "Telescope alignment mode"),
-            "TELEQSYS": (
-                ["equOther", "equTopocentric", "equJ2000", "equJ2050", "equB1950"][
-                    self.telescope.EquatorialSystem
-                ],
-                "Telescope equatorial coordinate system",
-            ),
-            "TELCANHM": (self.telescope.CanFindHome, "Can telescope find home"),
-            "TELCANPA": (self.telescope.CanPark, "Can telescope park"),
-            "TELCANUN": (self.telescope.CanUnpark, "Can telescope unpark"),
-            "TELCANPP": (self.telescope.CanSetPark, "Can telescope set park position"),
-            "TELCANPG": (self.telescope.CanPulseGuide, "Can telescope pulse guide"),
-            "TELCANGR": (
-                self.telescope.CanSetGuideRates,
-                "Can telescope set guide rates",
-            ),
-            "TELCANTR": (self.telescope.CanSetTracking, "Can telescope set tracking"),
-            "TELCANSR": (
-                self.telescope.CanSetRightAscensionRate,
-                "Can telescope set RA offset rate",
-            ),
-            "TELCANSD": (
-                self.telescope.CanSetDeclinationRate,
-                "Can telescope set DEC offset rate",
-            ),
-            "TELCANSP": (self.telescope.CanSetPierSide, "Can telescope set pier side"),
-            "TELCANSL": (
-                self.telescope.CanSlew,
-                "Can telescope slew to equatorial coordinates",
-            ),
-            "TELCNSLA": (
-                self.telescope.CanSlewAsync,
-                "Can telescope slew asynchronously",
-            ),
-            "TELCANSF": (
-                self.telescope.CanSlewAltAz,
-                "Can telescope slew to alt-azimuth coordinates",
-            ),
-            "TELCNSFA": (
-                self.telescope.CanSlewAltAzAsync,
-                "Can telescope slew to alt-azimuth coordinates asynchronously",
-            ),
-            "TELCANSY": (
-                self.telescope.CanSync,
-                "Can telescope sync to equatorial coordinates",
-            ),
-            "TELCNSYA": (
-                self.telescope.CanSyncAltAz,
-                "Can telescope sync to alt-azimuth coordinates",
-            ),
-            "TELTRCKS": (self.telescope.TrackingRates, "Telescope tracking rates"),
-            "TELSUPAC": (
-                self.telescope.SupportedActions,
-                "Telescope supported actions",
-            ),
-        }
-        try:
-            info["TELALT"][0] = self.telescope.Altitude
-        except:
-            pass
-        try:
-            info["TELAZ"][0] = self.telescope.Azimuth
-        except:
-            pass
-        try:
-            info["TARGRA"][0] = self.telescope.TargetRightAscension
-        except:
-            pass
-        try:
-            info["TARGDEC"][0] = self.telescope.TargetDeclination
-        except:
-            pass
+        static_info = self._telescope_static_info()
+        info = _copy_cards(_TELESCOPE_INFO)
+        info["TELHOME"][0] = telescope.AtHome
+        info["TELPARK"][0] = telescope.AtPark
+        info["TELRA"][0] = telescope.RightAscension
+        info["TELDEC"][0] = telescope.Declination
+        info["TELLST"][0] = telescope.SiderealTime
+        _read_optional_info(telescope, info, _TELESCOPE_OPTIONAL_INFO)
         obj = self.get_current_object()
+
+        # Every derived card is computed for the same instant and frame
+        t = self.observatory_time
+        location = self.observatory_location
+        altaz = obj.transform_to(coord.AltAz(obstime=t, location=location))
         info["TELRAIC"][0] = obj.ra.to_string(unit=u.hour)
         info["TELDECIC"][0] = obj.dec.to_string(unit=u.degree)
-        info["OBJCTALT"][0] = obj.transform_to(
-            coord.AltAz(
-                obstime=self.observatory_time, location=self.observatory_location
-            )
-        ).alt.to(u.degree)
-        info["OBJCTAZ"][0] = obj.transform_to(
-            coord.AltAz(
-                obstime=self.observatory_time, location=self.observatory_location
-            )
-        ).az.to(u.degree)
-        info["OBJCTHA"][0] = abs(self.lst - obj.ra).to(u.hour)
-        info["AIRMASS"][0] = _airmass(
-            obj.transform_to(
-                coord.AltAz(
-                    obstime=self.observatory_time, location=self.observatory_location
-                )
-            ).alt.to(u.rad)
-        )
-        info["MOONANGL"][0] = (
-            coord.get_moon(self.observatory_time, location=self.observatory_location)
-            .separation(obj)
-            .to(u.degree)
-        )
-        info["MOONPHAS"][0] = self.moon_illumination(self.observatory_time)
-        try:
-            info["TELSLEW"][0] = self.telescope.Slewing
-        except:
-            pass
-        try:
-            info["TELSETT"][0] = self.telescope.SlewSettleTime
-        except:
-            pass
-        try:
-            info["TELPIER"][0] = ["pierEast", "pierWest", "pierUnknown"][
-                self.telescope.SideOfPier
-            ]
-        except:
-            pass
-        try:
-            info["TELTRACK"][0] = self.telescope.Tracking
-        except:
-            pass
-        try:
-            info["TELTRKRT"][0] = self.telescope.TrackingRates[
-                self.telescope.TrackingRate
-            ]
-        except:
-            pass
-        try:
-            info["TELOFFRA"][0] = self.telescope.RightAscensionRate
-        except:
-            pass
-        try:
-            info["TELOFFDC"][0] = self.telescope.DeclinationRate
-        except:
-            pass
-        try:
-            info["TELPULSE"][0] = self.telescope.IsPulseGuiding
-        except:
-            pass
-        try:
-            info["TELGUIDR"][0] = self.telescope.GuideRateRightAscension
-        except:
-            pass
-        try:
-            info["TELGUIDD"][0] = self.telescope.GuideRateDeclination
-        except:
-            pass
+        info["OBJCTALT"][0] = altaz.alt.deg
+        info["OBJCTAZ"][0] = altaz.az.deg
+        info["OBJCTHA"][0] = abs(self.lst(t) - obj.ra.hour)
+        info["AIRMASS"][0] = airmass(altaz.alt.rad)
+        geocentric = tuple(float(c.to_value(u.m)) for c in location.geocentric)
+        moon, illumination = _moon_ephemeris(int(t.unix // 10), geocentric)
+        info["MOONANGL"][0] = moon.separation(obj).deg
+        info["MOONPHAS"][0] = illumination
         try:
-            info["TELDOREF"][0] = self.telescope.DoesRefraction
-        except:
+            info["TELPIER"][0] = _PIER_SIDES[telescope.SideOfPier]
+        except Exception:
             pass
         try:
-            info["TELUT"][0] = self.telescope.UTCDate
-        except:
+            info["TELTRKRT"][0] = static_info["TELTRCKS"][0][telescope.TrackingRate]
+        except Exception:
             pass
-        try:
-            info["TELAPAR"][0] = self.telescope.ApertureArea
-        except:
-            pass
-        try:
-            info["TELDIAM"][0] = self.telescope.ApertureDiameter
-        except:
-            pass
-        try:
-            info["TELFOCL"][0] = self.telescope.FocalLength
-        except:
-            pass
-        try:
-            info["TELELEV"][0] = self.telescope.SiteElevation
-        except:
-            pass
-        try:
-            info["TELLAT"][0] = self.telescope.SiteLatitude
-        except:
-            pass
-        try:
-            info["TELLONG"][0] = self.telescope.SiteLongitude
-        except:
-            pass
-        try:
-            info["TELALN"][0] = ["AltAz", "Polar", "GermanPolar"][
-                self.telescope.AlignmentMode
-            ]
-        except:
-            pass
-        return info
+        info.update(static_info)
+        return _freeze_cards(info)
 
     @property
     def threads_info(self):
         logger.debug("Observatory.threads_info() called")
-        return {
-            "DEROTATE": (
-                not self.derotation_thread is None,
-                "Is derotation thread active",
-            ),
-            "OCTHREAD": (
-                not self.observing_conditions_thread is None,
-                "Is observing conditions thread active",
-            ),
-            "SMTHREAD": (
-                not self.safety_monitor_thread is None,
-                "Is status monitor thread active",
-            ),
-        }
+        state = (
+            self._derotation_thread is not None,
+            self._observing_conditions_thread is not None,
+            self._safety_monitor_thread is not None,
+        )
+        try:
+            return _THREADS_INFO[state]
+        except KeyError:
+            info = _THREADS_INFO[state] = MappingProxyType(
+                {
+                    "DEROTATE": (state[0], "Is derotation thread active"),
+                    "OCTHREAD": (state[1], "Is observing conditions thread active"),
+                    "SMTHREAD": (state[2], "Is status monitor thread active"),
+                }
+            )
+            return info
 
     @property
     def wcs_info(self):
@@ -3777,9 +3096,11 @@ class Observatory:
     def observatory_location(self):
         """Returns the EarthLocation object for the observatory"""
         logger.debug("Observatory.observatory_location() called")
-        return coord.EarthLocation(
-            lat=self.latitude, lon=self.longitude, height=self.elevation
-        )
+        if self._observatory_location is None:
+            self._observatory_location = coord.EarthLocation(
+                lat=self.latitude, lon=self.longitude, height=self.elevation
+            )
+        return self._observatory_location
 
     @property
     def observatory_time(self):
@@ -3791,16 +3112,19 @@ class Observatory:
     def plate_scale(self):
         """Returns the plate scale of the telescope in arcsec/mm"""
         logger.debug("Observatory.plate_scale() called")
-        return 206265 / self.focal_length
+        return self._plate_scale
 
     @property
     def pixel_scale(self):
         """Returns the pixel scale of the camera"""
         logger.debug("Observatory.pixel_scale() called")
-        return (
-            self.plate_scale * self.camera.PixelSizeX * 1e-3,
-            self.plate_scale * self.camera.PixelSizeY * 1e-3,
-        )
+        if self._pixel_scale is None:
+            camera = self.camera
+            self._pixel_scale = (
+                self._plate_scale * camera.PixelSizeX * 1e-3,
+                self._plate_scale * camera.PixelSizeY * 1e-3,
+            )
+        return self._pixel_scale
 
     @property
     def site_name(self):
@@ -3809,8 +3133,8 @@ class Observatory:
 
     @site_name.setter
     def site_name(self, value):
-        logger.debug(f"Observatory.site_name = {value} called")
-        self._site_name = value if value is not None or value != "" else None
+        logger.debug("Observatory.site_name = %s called", value)
+        self._site_name = value if value not in (None, "") else None
         self._config["site"]["site_name"] = (
             self._site_name if self._site_name is not None else ""
         )
@@ -3822,8 +3146,8 @@ class Observatory:
 
     @instrument_name.setter
     def instrument_name(self, value):
-        logger.debug(f"Observatory.instrument_name = {value} called")
-        self._instrument_name = value if value is not None or value != "" else None
+        logger.debug("Observatory.instrument_name = %s called", value)
+        self._instrument_name = value if value not in (None, "") else None
         self._config["site"]["instrument_name"] = (
             self._instrument_name if self._instrument_name is not None else ""
         )
@@ -3835,10 +3159,8 @@ class Observatory:
 
     @instrument_description.setter
     def instrument_description(self, value):
-        logger.debug(f"Observatory.instrument_description = {value} called")
-        self._instrument_description = (
-            value if value is not None or value != "" else None
-        )
+        logger.debug("Observatory.instrument_description = %s called", value)
+        self._instrument_description = value if value not in (None, "") else None
         self._config["site"]["instrument_description"] = (
             self._instrument_description
             if self._instrument_description is not None
@@ -3852,21 +3174,11 @@ class Observatory:
 
     @latitude.setter
     def latitude(self, value):
-        logger.debug(f"Observatory.latitude = {value} called")
-        self._latitude = (
-            coord.Latitude(value) if value is not None or value != "" else None
-        )
+        logger.debug("Observatory.latitude = %s called", value)
+        self._observatory_location = None
+        self._latitude = coord.Latitude(value) if value not in (None, "") else None
         self._config["site"]["latitude"] = (
-            self._latitude.to_string(
-                unit=u.deg,
-                sep=":",
-                precision=5,
-                pad=True,
-                alwayssign=True,
-                decimal=True,
-            )
-            if self._latitude is not None
-            else ""
+            "%+.5f" % self._latitude.degree if self._latitude is not None else ""
         )
 
     @property
@@ -3876,21 +3188,11 @@ class Observatory:
 
     @longitude.setter
     def longitude(self, value):
-        logger.debug(f"Observatory.longitude = {value} called")
-        self._longitude = (
-            coord.Longitude(value) if value is not None or value != "" else None
-        )
+        logger.debug("Observatory.longitude = %s called", value)
+        self._observatory_location = None
+        self._longitude = coord.Longitude(value) if value not in (None, "") else None
         self._config["site"]["longitude"] = (
-            self._longitude.to_string(
-                unit=u.deg,
-                sep=":",
-                precision=5,
-                pad=True,
-                alwayssign=True,
-                decimal=True,
-            )
-            if self._longitude is not None
-            else ""
+            "%+.5f" % self._longitude.degree if self._longitude is not None else ""
         )
 
     @property
@@ -3900,10 +3202,9 @@ class Observatory:
 
     @elevation.setter
     def elevation(self, value):
-        logger.debug(f"Observatory.elevation = {value} called")
-        self._elevation = (
-            max(float(value), 0) if value is not None or value != "" else None
-        )
+        logger.debug("Observatory.elevation = %s called", value)
+        self._observatory_location = None
+        self._elevation = _clamp(value, 0)
         self._config["site"]["elevation"] = (
             str(self._elevation) if self._elevation is not None else ""
         )
@@ -3915,10 +3216,8 @@ class Observatory:
 
     @diameter.setter
     def diameter(self, value):
-        logger.debug(f"Observatory.diameter = {value} called")
-        self._diameter = (
-            max(float(value), 0) if value is not None or value != "" else None
-        )
+        logger.debug("Observatory.diameter = %s called", value)
+        self._diameter = _clamp(value, 0)
         self._config["site"]["diameter"] = (
             str(self._diameter) if self._diameter is not None else ""
         )
@@ -3930,10 +3229,12 @@ class Observatory:
 
     @focal_length.setter
     def focal_length(self, value):
-        logger.debug(f"Observatory.focal_length = {value} called")
-        self._focal_length = (
-            max(float(value), 0) if value is not None or value != "" else None
+        logger.debug("Observatory.focal_length = %s called", value)
+        self._focal_length = _clamp(value, 0)
+        self._plate_scale = (
+            _ARCSEC_PER_RAD / self._focal_length if self._focal_length else None
         )
+        self._pixel_scale = None
         self._config["site"]["focal_length"] = (
             str(self._focal_length) if self._focal_length is not None else ""
         )
@@ -3960,14 +3261,15 @@ class Observatory:
 
     @cooler_setpoint.setter
     def cooler_setpoint(self, value):
-        logger.debug(f"Observatory.cooler_setpoint = {value} called")
-        self._cooler_setpoint = (
-            max(float(value), -273.15) if value is not None or value != "" else None
-        )
+        logger.debug("Observatory.cooler_setpoint = %s called", value)
+        self._cooler_setpoint = _clamp(value, -273.15)
         self._config["camera"]["cooler_setpoint"] = (
             str(self._cooler_setpoint) if self._cooler_setpoint is not None else ""
         )
-        if self.camera.CanSetCCDTemperature and self._cooler_setpoint is not None:
+        if (
+            self._capability(self.camera, "CanSetCCDTemperature")
+            and self._cooler_setpoint is not None
+        ):
             self.camera.SetCCDTemperature = self._cooler_setpoint
         else:
             raise ObservatoryException(
@@ -3981,10 +3283,8 @@ class Observatory:
 
     @cooler_tolerance.setter
     def cooler_tolerance(self, value):
-        logger.debug(f"Observatory.cooler_tolerance = {value} called")
-        self._cooler_tolerance = (
-            max(float(value), 0) if value is not None or value != "" else None
-        )
+        logger.debug("Observatory.cooler_tolerance = %s called", value)
+        self._cooler_tolerance = _clamp(value, 0)
         self._config["camera"]["cooler_tolerance"] = (
             str(self._cooler_tolerance) if self._cooler_tolerance is not None else ""
         )
@@ -3996,10 +3296,8 @@ class Observatory:
 
     @max_dimension.setter
     def max_dimension(self, value):
-        logger.debug(f"Observatory.max_dimension = {value} called")
-        self._max_dimension = (
-            max(int(value), 1) if value is not None or value != "" else None
-        )
+        logger.debug("Observatory.max_dimension = %s called", value)
+        self._max_dimension = _clamp(value, 1, cast=int)
         self._config["camera"]["max_dimension"] = (
             str(self._max_dimension) if self._max_dimension is not None else ""
         )
@@ -4035,10 +3333,8 @@ class Observatory:
 
     @cover_calibrator_alt.setter
     def cover_calibrator_alt(self, value):
-        logger.debug(f"Observatory.cover_calibrator_alt = {value} called")
-        self._cover_calibrator_alt = (
-            min(max(float(value), 0), 90) if value is not None or value != "" else None
-        )
+        logger.debug("Observatory.cover_calibrator_alt = %s called", value)
+        self._cover_calibrator_alt = _clamp(value, 0, 90)
         self._config["cover_calibrator"]["cover_calibrator_alt"] = (
             str(self._cover_calibrator_alt)
             if self._cover_calibrator_alt is not None
@@ -4052,10 +3348,8 @@ class Observatory:
 
     @cover_calibrator_az.setter
     def cover_calibrator_az(self, value):
-        logger.debug(f"Observatory.cover_calibrator_az = {value} called")
-        self._cover_calibrator_az = (
-            min(max(float(value), 0), 360) if value is not None or value != "" else None
-        )
+        logger.debug("Observatory.cover_calibrator_az = %s called", value)
+        self._cover_calibrator_az = _clamp(value, 0, 360)
         self._config["cover_calibrator"]["cover_calibrator_az"] = (
             str(self._cover_calibrator_az)
             if self._cover_calibrator_az is not None
@@ -4099,13 +3393,11 @@ class Observatory:
 
     @filters.setter
     def filters(self, value, position=None):
-        logger.debug(f"Observatory.filters = {value} called")
+        logger.debug("Observatory.filters = %s called", value)
         if position is None:
-            self._filters = list(value) if value is not None or value != "" else None
+            self._filters = list(value) if value not in (None, "") else None
         else:
-            self._filters[position] = (
-                char(value) if value is not None or value != "" else None
-            )
+            self._filters[position] = char(value) if value not in (None, "") else None
         self._config["filter_wheel"]["filters"] = (
             ", ".join(self._filters) if self._filters is not None else ""
         )
@@ -4117,19 +3409,21 @@ class Observatory:
 
     @filter_focus_offsets.setter
     def filter_focus_offsets(self, value, filt=None):
-        logger.debug(f"Observatory.filter_focus_offsets = {value} called")
+        logger.debug("Observatory.filter_focus_offsets = %s called", value)
         if filt is None:
+            if isinstance(value, str):
+                value = value.split(",") if value.strip() else None
             self._filter_focus_offsets = (
-                dict(zip(self.filters, value))
-                if value is not None or value != ""
+                {f: float(v) for f, v in zip(self.filters, value, strict=True)}
+                if value is not None
                 else None
             )
+        elif value not in (None, ""):
+            self._filter_focus_offsets[filt] = float(value)
         else:
-            self._filter_focus_offsets[filt] = (
-                float(value) if value is not None or value != "" else None
-            )
+            self._filter_focus_offsets.pop(filt, None)
         self._config["filter_wheel"]["filter_focus_offsets"] = (
-            ", ".join(self._filter_focus_offsets.values())
+            ", ".join("%g" % v for v in self._filter_focus_offsets.values())
             if self._filter_focus_offsets is not None
             else ""
         )
@@ -4156,10 +3450,8 @@ class Observatory:
 
     @focuser_max_error.setter
     def focuser_max_error(self, value):
-        logger.debug(f"Observatory.focuser_max_error = {value} called")
-        self._focuser_max_error = (
-            max(float(value), 0) if value is not None or value != "" else None
-        )
+        logger.debug("Observatory.focuser_max_error = %s called", value)
+        self._focuser_max_error = _clamp(value, 0)
         self._config["focuser"]["focuser_max_error"] = (
             str(self._focuser_max_error) if self._focuser_max_error is not None else ""
         )
@@ -4201,10 +3493,8 @@ class Observatory:
 
     @rotator_reverse.setter
     def rotator_reverse(self, value):
-        logger.debug(f"Observatory.rotator_reverse = {value} called")
-        self._rotator_reverse = (
-            bool(value) if value is not None or value != "" else None
-        )
+        logger.debug("Observatory.rotator_reverse = %s called", value)
+        self._rotator_reverse = bool(value) if value not in (None, "") else None
         self._config["rotator"]["rotator_reverse"] = (
             str(self._rotator_reverse) if self._rotator_reverse is not None else ""
         )
@@ -4217,10 +3507,8 @@ class Observatory:
 
     @rotator_min_angle.setter
     def rotator_min_angle(self, value):
-        logger.debug(f"Observatory.rotator_min_angle = {value} called")
-        self._rotator_min_angle = (
-            float(value) if value is not None or value != "" else None
-        )
+        logger.debug("Observatory.rotator_min_angle = %s called", value)
+        self._rotator_min_angle = float(value) if value not in (None, "") else None
         self._config["rotator"]["rotator_min_angle"] = (
             str(self._rotator_min_angle) if self._rotator_min_angle is not None else ""
         )
@@ -4232,10 +3520,8 @@ class Observatory:
 
     @rotator_max_angle.setter
     def rotator_max_angle(self, value):
-        logger.debug(f"Observatory.rotator_max_angle = {value} called")
-        self._rotator_max_angle = (
-            float(value) if value is not None or value != "" else None
-        )
+        logger.debug("Observatory.rotator_max_angle = %s called", value)
+        self._rotator_max_angle = float(value) if value not in (None, "") else None
         self._config["rotator"]["rotator_max_angle"] = (
             str(self._rotator_max_angle) if self._rotator_max_angle is not None else ""
         )
@@ -4292,10 +3578,8 @@ class Observatory:
 
     @min_altitude.setter
     def min_altitude(self, value):
-        logger.debug(f"Observatory.min_altitude = {value} called")
-        self._min_altitude = (
-            min(max(float(value), 0), 90) if value is not None or value != "" else None
-        )
+        logger.debug("Observatory.min_altitude = %s called", value)
+        self._min_altitude = _clamp(value, 0, 90)
         self._config["telescope"]["min_altitude"] = (
             str(self._min_altitude) if self._min_altitude is not None else ""
         )
@@ -4307,10 +3591,8 @@ class Observatory:
 
     @settle_time.setter
     def settle_time(self, value):
-        logger.debug(f"Observatory.settle_time = {value} called")
-        self._settle_time = (
-            max(float(value), 0) if value is not None or value != "" else None
-        )
+        logger.debug("Observatory.settle_time = %s called", value)
+        self._settle_time = _clamp(value, 0)
         self._config["telescope"]["settle_time"] = (
             str(self._settle_time) if self._settle_time is not None else ""
         )
@@ -4325,6 +3607,11 @@ class Observatory:
         logger.debug("Observatory.autofocus_driver property called")
         return self._autofocus_driver
 
+    @property
+    def wcs(self):
+        logger.debug("Observatory.wcs property called")
+        return self._wcs
+
     @property
     def wcs_driver(self):
         logger.debug("Observatory.wcs_driver property called")
@@ -4337,8 +3624,8 @@ class Observatory:
 
     @slew_rate.setter
     def slew_rate(self, value):
-        logger.debug(f"Observatory.slew_rate = {value} called")
-        self._slew_rate = float(value) if value is not None or value != "" else None
+        logger.debug("Observatory.slew_rate = %s called", value)
+        self._slew_rate = float(value) if value not in (None, "") else None
         self._config["telescope"]["slew_rate"] = (
             str(self._slew_rate) if self._slew_rate is not None else ""
         )
@@ -4359,6 +3646,11 @@ class Observatory:
         return self._maxim
 
 
+def _drivers():
+    """Returns the pyscope.observatory package, where drivers are looked up by name"""
+    return sys.modules[__package__]
+
+
 def _import_driver(device, driver_name=None, ascom=False, filepath=None, **kwargs):
     """Imports a driver"""
 
@@ -4368,20 +3660,27 @@ def _import_driver(device, driver_name=None, ascom=False, filepath=None, **kwarg
         return None
 
     if ascom:
-        return getattr(observatory, "ASCOM" + device)(driver_name)
+        return getattr(_drivers(), "ASCOM" + device)(driver_name)
     else:
-        try:
-            device_class = getattr(observatory, driver_name)
-        except:
+        device_class = _driver_classes.get((filepath, driver_name))
+        if device_class is None:
             try:
-                module_name = filepath.split("/")[-1].split(".")[0]
-                spec = importlib.util.spec_from_file_location(module_name, filepath)
-                module = importlib.util.module_from_spec(spec)
-                sys.modules[module_name] = module
-                spec.loader.exec_module(module)
-                device_class = getattr(module, driver_name)
-            except:
-                return None
+                device_class = getattr(_drivers(), driver_name)
+            except AttributeError:
+                try:
+                    module_name = filepath.split("/")[-1].split(".")[0]
+                    module = sys.modules.get(module_name)
+                    if getattr(module, "__file__", None) != filepath:
+                        spec = importlib.util.spec_from_file_location(
+                            module_name, filepath
+                        )
+                        module = importlib.util.module_from_spec(spec)
+                        sys.modules[module_name] = module
+                        spec.loader.exec_module(module)
+                    device_class = getattr(module, driver_name)
+                except (AttributeError, ImportError, OSError, SyntaxError):
+                    return None
+                _driver_classes[(filepath, driver_name)] = device_class
 
     _check_class_inheritance(device_class, device)
 
@@ -4391,14 +3690,282 @@ def _import_driver(device, driver_name=None, ascom=False, filepath=None, **kwarg
         return device_class(**kwargs)
 
 
+_LITERAL_CONSTANTS = {"True": True, "False": False, "None": None}
+
+
+def _fast_literal(value):
+    """Evaluates a config literal, skipping literal_eval for common scalars"""
+    if value in _LITERAL_CONSTANTS:
+        return _LITERAL_CONSTANTS[value]
+    if value[0].isdigit() or value[0] == "-":
+        try:
+            return int(value)
+        except ValueError:
+            try:
+                return float(value)
+            except ValueError:
+                pass
+    quote = value[0]
+    if (
+        len(value) >= 2
+        and quote in "\"'"
+        and value[-1] == quote
+        and quote not in value[1:-1]
+        and "\\" not in value
+    ):
+        return value[1:-1]
+    return literal_eval(value)
+
+
+def _parse_args(value):
+    """Parses a whitespace-separated string of literals into a tuple"""
+    if not value:
+        return None
+    return tuple(_fast_literal(v) for v in value.split())
+
+
+def _parse_kwargs(value):
+    """Parses a whitespace-separated string of key:literal pairs into a dict"""
+    if not value:
+        return None
+    return dict((k, _fast_literal(v)) for k, v in _KV_RE.findall(value))
+
+
+def _parse_multi(values, has_ascom=True):
+    """Parses the driver_N entries of a multi-device config section
+
+    Each entry is "driver,ascom,args,kwargs", or "driver,args,kwargs" when
+    has_ascom is False. Missing trailing fields are treated as empty, blank
+    entries are skipped and entries whose args or kwargs cannot be parsed
+    are logged and skipped. Returns a list of (driver, ascom, args, kwargs).
+    """
+    n_fields = 4 if has_ascom else 3
+    entries = []
+    for val in values.values():
+        if not val:
+            continue
+        fields = [field.strip() for field in val.split(",", n_fields - 1)]
+        fields += [""] * (n_fields - len(fields))
+        if not has_ascom:
+            fields.insert(1, "False")
+        driver, ascom, ar, kw = fields
+        try:
+            entries.append(
+                (driver, ascom == "True", _parse_args(ar), _parse_kwargs(kw))
+            )
+        except (ValueError, SyntaxError):
+            logger.warning("Error parsing device config: %s", val)
+    return entries
+
+
 def _check_class_inheritance(device_class, device):
     logger.debug("observatory._check_class_inheritance() called")
-    if not getattr(observatory, device) in device_class.__bases__:
+    checked = _checked_classes.get(device_class)
+    if checked is not None and device in checked:
+        return
+    if getattr(_drivers(), device) not in device_class.__mro__:
         raise ObservatoryException(
             "Driver %s does not inherit from the required _abstract classes"
             % device_class
         )
     else:
         logger.debug(
-            "Driver %s inherits from the required _abstract classes" % device_class
+            "Driver %s inherits from the required _abstract classes", device_class
+        )
+        _checked_classes.setdefault(device_class, set()).add(device)
+
+
+def _sexagesimal(value, hours=False):
+    """Formats decimal hours or degrees as [-]hh:mm:ss.ss or [+-]dd:mm:ss.ss"""
+    if hours:
+        sign = "-" if value < 0 else ""
+        fields = erfa.a2tf(2, math.radians(abs(value) * 15))[1]
+    else:
+        sign = "-" if value < 0 else "+"
+        fields = erfa.a2af(2, math.radians(abs(value)))[1]
+    return "%s%02i:%02i:%02i.%02i" % (sign, *fields)
+
+
+def _map_devices(func, devices):
+    """Returns [func(device) for device in devices], querying devices concurrently
+
+    COM objects belong to the thread that created them, so on Windows the
+    devices are queried one at a time.
+    """
+    if platform.system() == "Windows" or len(devices) == 1:
+        return [func(device) for device in devices]
+    with ThreadPoolExecutor(max_workers=len(devices)) as executor:
+        return list(executor.map(func, devices))
+
+
+def _log_write_error(future):
+    """Logs the failure of a background FITS write"""
+    if future.exception() is not None:
+        logger.error("Could not write image: %s", future.exception())
+
+
+@functools.lru_cache(maxsize=16)
+def _apparent_astrom(interval):
+    """Returns ERFA's ICRS to CIRS astrometry parameters and the equation of
+    the origins for the start of a ten minute interval since the Unix epoch
+
+    These change by milliarcseconds over an interval.
+    """
+    t = astrotime.Time(interval * 600, format="unix").tdb
+    return erfa.apci13(t.jd1, t.jd2)
+
+
+@functools.lru_cache(maxsize=32)
+def _moon_ephemeris(interval, geocentric):
+    """Returns the moon's position and illuminated fraction for the start of a
+    ten second interval since the Unix epoch
+
+    The moon moves under two arcseconds over an interval. ``geocentric`` is the
+    observatory's geocentric position in meters, so that results can be cached.
+    """
+    t = astrotime.Time(interval * 10, format="unix")
+    location = coord.EarthLocation.from_geocentric(*geocentric, unit=u.m)
+    moon = coord.get_moon(t, location=location)
+    return moon, _moon_illumination(coord.get_sun(t), moon)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_name(name, minute, geocentric):
+    """Resolves an object name with Sesame, the MPC, or astropy's get_body
+
+    ``minute`` is an ISO time truncated to the minute and ``geocentric`` the
+    observatory's geocentric position in meters, so that results can be cached.
+    """
+    try:
+        return _sesame_lookup(name)
+    except Exception:
+        pass
+
+    t = astrotime.Time(minute)
+    location = coord.EarthLocation.from_geocentric(*geocentric, unit=u.m)
+    try:
+        from astroquery.mpc import MPC
+
+        eph = MPC.get_ephemeris(
+            name,
+            start=t,
+            location=location,
+            number=1,
+            proper_motion="sky",
+        )
+        return coord.SkyCoord(
+            ra=eph["RA"],
+            dec=eph["Dec"],
+            unit=("deg", "deg"),
+            pm_ra_cosdec=eph["dRA cos(Dec)"],
+            pm_dec=eph["dDec"],
+            frame="icrs",
+        )
+    except Exception:
+        try:
+            return coord.get_body(name, t, location)
+        except Exception:
+            raise ObservatoryException(
+                "The requested object could not be found using "
+                + "Sesame resolver, the Minor Planet Center Query, or the astropy.coordinates get_body function."
+            )
+
+
+@functools.lru_cache(maxsize=256)
+def _sesame_lookup(name):
+    """Returns the fixed position of a named object from Sesame"""
+    return coord.SkyCoord.from_name(name)
+
+
+def _resolve_save_path(save_path, new_folder, prefix):
+    """Returns the directory to save calibration frames to, creating it if needed
+
+    ``new_folder`` is either a folder name or a true value for a timestamped
+    folder named after ``prefix``.
+    """
+    if save_path is None:
+        save_path = os.getcwd()
+        logger.debug("Setting save path to current working directory: %s", save_path)
+
+    if isinstance(new_folder, str):
+        save_path = os.path.join(save_path, new_folder)
+    elif new_folder:
+        save_path = os.path.join(
+            save_path, datetime.datetime.now().strftime(prefix + "_%Y-%m-%d_%H-%M-%S")
         )
+    else:
+        return save_path
+    os.makedirs(save_path, exist_ok=True)
+    logger.info("Saving to directory: %s", save_path)
+    return save_path
+
+
+def _read_device_info(device, fields):
+    """Returns the header cards in ``fields``, empty where the driver raises"""
+    info = {}
+    for key, name, comment in fields:
+        try:
+            value = getattr(device, name)
+        except Exception:
+            value = None
+        info[key] = (value, comment)
+    return info
+
+
+def _read_optional_info(device, info, fields):
+    """Fills in the cards of each optional property the driver implements"""
+    for name, keys in fields:
+        try:
+            value = getattr(device, name)
+        except Exception:
+            continue
+        for key in keys:
+            info[key][0] = value
+
+
+def _clamp(value, lo, hi=None, cast=float):
+    """Converts a setter value with cast and clamps it, treating None and "" as unset"""
+    if value in (None, ""):
+        return None
+    value = max(cast(value), lo)
+    return value if hi is None else min(value, hi)
+
+
+def _moon_illumination(sun, moon):
+    """Returns the illuminated fraction of the moon from its and the sun's positions"""
+    elongation = sun.separation(moon).to_value(u.rad)
+    sun_distance = sun.distance.to_value(u.au)
+    moon_distance = moon.distance.to_value(u.au)
+    phase_angle = np.arctan2(
+        sun_distance * np.sin(elongation),
+        moon_distance - sun_distance * np.cos(elongation),
+    )
+    return (1.0 + np.cos(phase_angle)) / 2.0
+
+
+def _copy_cards(template):
+    """Returns a copy of a card template with its own [value, comment] lists"""
+    # Copying the dict keeps the template's table size, and replacing the
+    # values of existing keys never resizes it
+    info = template.copy()
+    for key, card in template.items():
+        info[key] = card[:]
+    return info
+
+
+def _freeze_cards(info):
+    """Converts header cards built as [value, comment] lists to tuples in place"""
+    for key, card in info.items():
+        info[key] = tuple(card)
+    return info
+
+
+def _wrap_start_exposure(observatory):
+    """Record the shutter state of every exposure started on the camera."""
+    start_exposure = observatory.camera.StartExposure
+
+    def wrapper(Duration, Light):
+        observatory._last_camera_shutter_status = Light
+        return start_exposure(Duration, Light)
+
+    observatory.camera.StartExposure = wrapper
@@ -40,13 +40,12 @@ class PinpointWCS(WCS):
 
         self._solver.AttachFITS(filepath)
 
-        if kwargs.get("ra", None) is None or kwargs.get("dec", None) is None:
+        ra = kwargs.get("ra", None)
+        dec = kwargs.get("dec", None)
+        if ra is None or dec is None:
             with pyfits.open(filepath) as hdul:
                 ra = hdul[0].header[ra_key]
                 dec = hdul[0].header[dec_key]
-        else:
-            ra = kwargs.get("ra", self._solver.TargetRightAscension)
-            dec = kwargs.get("dec", self._solver.TargetDeclination)
 
         obj = coord.SkyCoord(ra, dec, unit=ra_dec_units, frame="icrs")
         self._solver.RightAscension = obj.ra.hour
@@ -42,7 +42,7 @@ def avg_fits_cli(mode, outfile, fnames, verbose):
     if verbose:
         logger.setLevel(logging.DEBUG)
 
-    logger.debug(f"avg_fits(mode={mode}, outfile={outfile}, fnames={fnames})")
+    logger.debug("avg_fits(mode=%s, outfile=%s, fnames=%s)", mode, outfile, fnames)
 
     logger.info("Loading FITS files...")
     images = np.array([fits.open(fname)[0].data for fname in fnames])
@@ -57,8 +57,9 @@ def avg_fits_cli(mode, outfile, fnames, verbose):
         logger.debug("Calculating mean...")
         image_avg = np.mean(images, axis=0)
 
-    logger.debug(f"Image mean: {np.mean(image_avg)}")
-    logger.debug(f"Image median: {np.median(image_avg)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Image mean: %s", np.mean(image_avg))
+        logger.debug("Image median: %s", np.median(image_avg))
 
     image_avg = image_avg.astype(np.uint16)
 
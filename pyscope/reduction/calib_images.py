@@ -135,7 +135,7 @@ def calib_images_cli(
         fnames = []
         for ext in (".fts", ".fits", ".fit"):
             fnames.extend(glob.glob(f"{image_dir}/*{ext}"))
-        logger.debug(f"fnames = {fnames}")
+        logger.debug("fnames = %s", fnames)
 
     logger.info(f"Calibrating {len(fnames)} images.")
     for fname in fnames:
@@ -197,12 +197,12 @@ def calib_images_cli(
             )
 
         logger.debug("Using calibration frames:")
-        logger.debug(f"Flat: {flat_frame}")
-        logger.debug(f"Dark: {dark_frame}")
+        logger.debug("Flat: %s", flat_frame)
+        logger.debug("Dark: %s", dark_frame)
         if camera_type == "ccd":
-            logger.debug(f"Bias: {bias_frame}")
+            logger.debug("Bias: %s", bias_frame)
         elif camera_type == "cmos":
-            logger.debug(f"Flat dark: {flat_dark_frame}")
+            logger.debug("Flat dark: %s", flat_dark_frame)
 
         logger.debug("Running ccd_calib...")
         ccd_calib(
@@ -1,4 +1,5 @@
 import logging
+import os
 import time
 
 import astroscrappy
@@ -6,6 +7,8 @@ import click
 import numpy as np
 from astropy.io import fits
 
+from ..utils import _write_fits
+
 logger = logging.getLogger(__name__)
 
 
@@ -129,11 +132,11 @@ def ccd_calib_cli(
             except:
                 bias_ybin = hdr["YBIN"]
 
-            logger.debug(f"Bias frame readout mode: {bias_readout_mode}")
-            logger.debug(f"Bias frame exposure time: {bias_exptime}")
-            logger.debug(f"Bias frame X binning: {bias_xbin}")
-            logger.debug(f"Bias frame Y binning: {bias_ybin}")
-            logger.debug(f"Bias frame pedestal: {bias_pedestal}")
+            logger.debug("Bias frame readout mode: %s", bias_readout_mode)
+            logger.debug("Bias frame exposure time: %s", bias_exptime)
+            logger.debug("Bias frame X binning: %s", bias_xbin)
+            logger.debug("Bias frame Y binning: %s", bias_ybin)
+            logger.debug("Bias frame pedestal: %s", bias_pedestal)
     elif camera_type == "cmos":
         if flat_dark_frame is not None:
             logger.info(f"Loading flat-dark frame: {flat_dark_frame}")
@@ -167,10 +170,10 @@ def ccd_calib_cli(
             except:
                 flat_dark_ybin = hdr["YBIN"]
 
-            logger.debug(f"Flat-dark frame readout mode: {flat_dark_readout_mode}")
-            logger.debug(f"Flat-dark frame exposure time: {flat_dark_exptime}")
-            logger.debug(f"Flat-dark frame X binning: {flat_dark_xbin}")
-            logger.debug(f"Flat-dark frame Y binning: {flat_dark_ybin}")
+            logger.debug("Flat-dark frame readout mode: %s", flat_dark_readout_mode)
+            logger.debug("Flat-dark frame exposure time: %s", flat_dark_exptime)
+            logger.debug("Flat-dark frame X binning: %s", flat_dark_xbin)
+            logger.debug("Flat-dark frame Y binning: %s", flat_dark_ybin)
 
     logger.info("Loading calibration frames...")
     if dark_frame is not None:
@@ -200,10 +203,10 @@ def ccd_calib_cli(
         except:
             dark_ybin = hdr["YBIN"]
 
-        logger.debug(f"Dark frame readout mode: {dark_readout_mode}")
-        logger.debug(f"Dark frame exposure time: {dark_exptime}")
-        logger.debug(f"Dark frame X binning: {dark_xbin}")
-        logger.debug(f"Dark frame Y binning: {dark_ybin}")
+        logger.debug("Dark frame readout mode: %s", dark_readout_mode)
+        logger.debug("Dark frame exposure time: %s", dark_exptime)
+        logger.debug("Dark frame X binning: %s", dark_xbin)
+        logger.debug("Dark frame Y binning: %s", dark_ybin)
 
     if flat_frame is not None:
         logger.info(f"Loading flat frame: {flat_frame}")
@@ -238,10 +241,10 @@ def ccd_calib_cli(
         except:
             flat_ybin = hdr["YBIN"]
 
-        logger.debug(f"Flat frame readout mode: {flat_readout_mode}")
-        logger.debug(f"Flat frame exposure time: {flat_exptime}")
-        logger.debug(f"Flat frame X binning: {flat_xbin}")
-        logger.debug(f"Flat frame Y binning: {flat_ybin}")
+        logger.debug("Flat frame readout mode: %s", flat_readout_mode)
+        logger.debug("Flat frame exposure time: %s", flat_exptime)
+        logger.debug("Flat frame X binning: %s", flat_xbin)
+        logger.debug("Flat frame Y binning: %s", flat_ybin)
 
     logger.info("Looping through images...")
     for fname in fnames:
@@ -276,10 +279,10 @@ def ccd_calib_cli(
         except:
             image_ybin = hdr["YBIN"]
 
-        logger.debug(f"Image readout mode: {image_readout_mode}")
-        logger.debug(f"Image exposure time: {image_exptime}")
-        logger.debug(f"Image X binning: {image_xbin}")
-        logger.debug(f"Image Y binning: {image_ybin}")
+        logger.debug("Image readout mode: %s", image_readout_mode)
+        logger.debug("Image exposure time: %s", image_exptime)
+        logger.debug("Image X binning: %s", image_xbin)
+        logger.debug("Image Y binning: %s", image_ybin)
 
         if image_readout_mode != dark_readout_mode:
             logger.warning(
@@ -426,7 +429,7 @@ def ccd_calib_cli(
                 f"Removed hot pixels using astroscrappy, {astro_scrappy[0]} iterations"
             )
             hdr.add_comment("Hot pixel removal took %.1f seconds" % t)
-            logger.debug(f"Hot pixel removal took {t} seconds")
+            logger.debug("Hot pixel removal took %s seconds", t)
 
         if len(bad_columns) > 0:
             logger.info("Fixing bad columns...")
@@ -444,11 +447,13 @@ def ccd_calib_cli(
 
         if in_place:
             logger.info(f"Overwriting {fname}")
-            fits.writeto(fname, cal_image, hdr, overwrite=True)
+            _write_fits(fname, fits.PrimaryHDU(cal_image, hdr), overwrite=True)
         else:
             logger.info(f"Writing calibrated image to {fname}")
-            fits.writeto(
-                fname.split(".")[:-1] + "_cal.fts", cal_image, hdr, overwrite=True
+            _write_fits(
+                os.path.splitext(fname)[0] + "_cal.fts",
+                fits.PrimaryHDU(cal_image, hdr),
+                overwrite=True,
             )
 
         logger.info("Done!")
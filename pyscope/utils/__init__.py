@@ -1,6 +1,8 @@
 from ._args_kwargs_config import _args_to_config, _kwargs_to_config
+from ._fast_ini_parse import _fast_ini_parse
 from ._function_synchronicity import _force_async, _force_sync
 from ._get_image_source_catalog import _get_image_source_catalog
+from ._write_fits import _write_fits
 from .airmass import airmass
 from .pyscope_exception import PyscopeException
 
@@ -0,0 +1,51 @@
+import os
+import re
+from functools import lru_cache
+from types import MappingProxyType
+
+# One pass over the whole file: section headers and "key = value" (or
+# "key: value") lines. Full-line comments and blank lines never match, and a
+# "#" or ";" preceded by whitespace starts an inline comment.
+_INI_RE = re.compile(
+    r"^[ \t]*(?:\[(?P<section>[^\]\n]+)\][ \t]*"
+    r"|(?P<key>[^=:\s;#][^=:\n]*?)[ \t]*[=:][ \t]*(?P<value>.*?)[ \t]*"
+    r"(?:(?<=[ \t])[;#].*)?)$",
+    re.MULTILINE,
+)
+
+
+def _fast_ini_parse(path):
+    """Parse an INI file into a dict of sections, each a dict of strings.
+
+    This reads the simple subset of the INI format used by pyscope's
+    configuration files. Keys are lower-cased as :class:`configparser.ConfigParser`
+    does by default. Keys that appear before any section header are ignored.
+
+    Parsed files are cached by path, modification time and size, so reading an
+    unchanged file again only costs a ``stat`` and a copy of the result.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    parsed = _parse_cached(path, stat.st_mtime_ns, stat.st_size)
+    return {section: dict(values) for section, values in parsed.items()}
+
+
+@lru_cache(maxsize=32)
+def _parse_cached(path, mtime_ns, size):
+    with open(path, "r") as f:
+        if hasattr(os, "posix_fadvise"):
+            # Start readahead of the whole file before the first read
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        text = f.read()
+
+    config = {}
+    section = None
+    for match in _INI_RE.finditer(text):
+        name = match.group("section")
+        if name is not None:
+            section = config.setdefault(name, {})
+        elif section is not None:
+            section[match.group("key").lower()] = match.group("value")
+    return MappingProxyType(
+        {name: MappingProxyType(values) for name, values in config.items()}
+    )
@@ -0,0 +1,13 @@
+import io
+
+
+def _write_fits(filename, hdu, overwrite=False):
+    """Writes an HDU or HDUList to a FITS file with a single write call
+
+    Serializing in memory first is much faster than astropy's many small
+    writes on network filesystems.
+    """
+    buffer = io.BytesIO()
+    hdu.writeto(buffer)
+    with open(filename, "wb" if overwrite else "xb") as f:
+        f.write(buffer.getbuffer())
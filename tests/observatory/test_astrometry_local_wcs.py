@@ -0,0 +1,100 @@
+import os
+import subprocess
+
+import numpy as np
+import pytest
+from astropy.io import fits
+
+from pyscope.observatory import AstrometryLocalWCS, astrometry_local_wcs
+
+
+@pytest.fixture()
+def image(tmp_path):
+    path = tmp_path / "image.fts"
+    header = fits.Header({"RA": 10.5, "DEC": 45.0})
+    fits.PrimaryHDU(np.zeros((4, 4), dtype=np.uint16), header).writeto(path)
+    return str(path)
+
+
+@pytest.fixture()
+def solve_field(monkeypatch):
+    """Replaces solve-field with a fake that records its arguments"""
+    calls = []
+    outcome = {"solved": True, "raises": None}
+
+    def run(args, **kwargs):
+        calls.append(args)
+        if outcome["raises"] is not None:
+            raise outcome["raises"]
+        if outcome["solved"]:
+            tmpdir = args[args.index("--dir") + 1]
+            base = os.path.splitext(os.path.basename(args[1]))[0]
+            open(os.path.join(tmpdir, base + ".solved"), "w").close()
+            header = fits.Header({"CTYPE1": "RA---TAN", "CTYPE2": "DEC--TAN"})
+            fits.PrimaryHDU(header=header).writeto(os.path.join(tmpdir, base + ".wcs"))
+        return subprocess.CompletedProcess(args, 0)
+
+    monkeypatch.setattr(
+        astrometry_local_wcs.shutil, "which", lambda name: "/usr/bin/" + name
+    )
+    monkeypatch.setattr(astrometry_local_wcs.subprocess, "run", run)
+    return calls, outcome
+
+
+def _option(args, name):
+    return args[args.index(name) + 1]
+
+
+def test_solve_arguments(image, solve_field):
+    calls, _ = solve_field
+
+    assert AstrometryLocalWCS(search_radius=3).Solve(
+        image, scale_est=1.0, scale_type="ev", parity=1
+    )
+
+    (args,) = calls
+    assert args[0] == "/usr/bin/solve-field"
+    assert args[1] == image
+    assert float(_option(args, "--ra")) == pytest.approx(157.5)
+    assert float(_option(args, "--dec")) == pytest.approx(45.0)
+    assert _option(args, "--radius") == "3"
+    assert _option(args, "--scale-units") == "arcsecperpix"
+    assert float(_option(args, "--scale-low")) == pytest.approx(0.9)
+    assert float(_option(args, "--scale-high")) == pytest.approx(1.1)
+    assert _option(args, "--parity") == "neg"
+
+    AstrometryLocalWCS().Solve(image, parity=0)
+    assert _option(calls[1], "--parity") == "pos"
+    assert "--scale-low" not in calls[1]
+
+
+def test_solve_merges_wcs_header(image, solve_field):
+    assert AstrometryLocalWCS().Solve(image)
+
+    header = fits.getheader(image)
+    assert header["CTYPE1"] == "RA---TAN"
+    assert header["CTYPE2"] == "DEC--TAN"
+    assert header["RA"] == 10.5
+    assert fits.getdata(image).shape == (4, 4)
+
+
+def test_solve_unsolved(image, solve_field):
+    _, outcome = solve_field
+    outcome["solved"] = False
+
+    assert not AstrometryLocalWCS().Solve(image)
+    assert "CTYPE1" not in fits.getheader(image)
+
+
+def test_solve_timeout(image, solve_field):
+    _, outcome = solve_field
+    outcome["raises"] = subprocess.TimeoutExpired("solve-field", 70)
+
+    assert not AstrometryLocalWCS().Solve(image)
+
+
+def test_missing_solve_field(monkeypatch):
+    monkeypatch.setattr(astrometry_local_wcs.shutil, "which", lambda name: None)
+
+    with pytest.raises(astrometry_local_wcs.ObservatoryException):
+        AstrometryLocalWCS()
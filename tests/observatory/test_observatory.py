@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from pyscope.observatory import Observatory
+from pyscope.observatory.observatory import _parse_kwargs, _parse_multi
+from pyscope.utils import _fast_ini_parse
+
+CONFIG_PATH = Path(__file__).parents[2] / "pyscope" / "config" / "observatory.cfg"
+
+
+class _StubSolver:
+    def __init__(self, solves):
+        self.solves = solves
+        self.calls = []
+
+    def Solve(self, filepath, **kwargs):
+        self.calls.append((filepath, kwargs))
+        return self.solves
+
+
+def test_solve_wcs_tries_each_solver():
+    obs = object.__new__(Observatory)
+    failing, solving, unused = _StubSolver(False), _StubSolver(True), _StubSolver(True)
+    obs._wcs = [None, failing, solving, unused]
+    obs._wcs_driver = ["Missing", "Failing", "Solving", "Unused"]
+    obs._pixel_scale = (0.5, 0.5)
+
+    assert obs._solve_wcs("image.fts")
+    assert failing.calls[0][0] == "image.fts"
+    assert failing.calls[0][1]["scale_est"] == 0.5
+    assert len(solving.calls) == 1
+    assert unused.calls == []
+
+    obs._wcs = [failing, None]
+    obs._wcs_driver = ["Failing", "Missing"]
+    assert not obs._solve_wcs("image.fts")
+
+
+def test_sample_config_device_entries_parse():
+    config = _fast_ini_parse(CONFIG_PATH)
+
+    for spec in Observatory._DEVICES:
+        values = config[spec.section]
+        if spec.multi:
+            configured = [v for k, v in values.items() if k.startswith("driver_") and v]
+            entries = _parse_multi(values, has_ascom=spec.uses_ascom)
+            assert len(entries) == len(configured), spec.section
+        else:
+            _parse_kwargs(values.get(spec.section + "_kwargs"))
+
+    (entry,) = _parse_multi(config["safety_monitor"])
+    assert entry[3] == {"url": "https://winer.org/Site/Roof.php"}
+    assert _parse_kwargs(
+        config["observing_conditions"]["observing_conditions_kwargs"]
+    ) == {"url": "https://winer.org/Site/Weather.php"}
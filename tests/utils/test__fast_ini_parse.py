@@ -0,0 +1,48 @@
+import configparser
+from pathlib import Path
+
+from pyscope.utils import _fast_ini_parse
+
+
+def test_fast_ini_parse(tmp_path):
+    path = tmp_path / "test.cfg"
+    path.write_text(
+        "[site]\n"
+        "\n"
+        "Site_Name = Winer Observatory\n"
+        "latitude = # dd:mm:ss.s\n"
+        "; full-line comment\n"
+        "[camera]\n"
+        "cooler_setpoint = -20 # Celsius\n"
+        "camera_kwargs = url:https://example.org/page#anchor\n"
+        "camera_args =\n"
+    )
+
+    assert _fast_ini_parse(path) == {
+        "site": {"site_name": "Winer Observatory", "latitude": ""},
+        "camera": {
+            "cooler_setpoint": "-20",
+            "camera_kwargs": "url:https://example.org/page#anchor",
+            "camera_args": "",
+        },
+    }
+
+
+def test_fast_ini_parse_matches_configparser():
+    path = Path(__file__).parents[2] / "pyscope" / "config" / "observatory.cfg"
+    config = configparser.ConfigParser(inline_comment_prefixes=("#", ";"))
+    config.read(path)
+
+    assert _fast_ini_parse(path) == {s: dict(config[s]) for s in config.sections()}
+
+
+def test_fast_ini_parse_rereads_changed_file(tmp_path):
+    path = tmp_path / "test.cfg"
+    path.write_text("[site]\nsite_name = A\n")
+    first = _fast_ini_parse(path)
+    first["site"]["site_name"] = "modified by caller"
+
+    assert _fast_ini_parse(path) == {"site": {"site_name": "A"}}
+
+    path.write_text("[site]\nsite_name = Other\n")
+    assert _fast_ini_parse(path) == {"site": {"site_name": "Other"}}
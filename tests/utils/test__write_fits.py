@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+from astropy.io import fits
+
+from pyscope.utils import _write_fits
+
+
+def test_write_fits(tmp_path):
+    path = tmp_path / "test.fts"
+    data = np.arange(12, dtype=np.uint16).reshape(3, 4)
+    header = fits.Header({"OBJECT": "M31"})
+
+    _write_fits(path, fits.PrimaryHDU(data, header))
+
+    with fits.open(path) as hdul:
+        assert hdul[0].header["OBJECT"] == "M31"
+        np.testing.assert_array_equal(hdul[0].data, data)
+
+    with pytest.raises(FileExistsError):
+        _write_fits(path, fits.PrimaryHDU(data))
+
+    _write_fits(path, fits.PrimaryHDU(data * 2), overwrite=True)
+    np.testing.assert_array_equal(fits.getdata(path), data * 2)